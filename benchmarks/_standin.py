@@ -0,0 +1,251 @@
+"""Local stand-in for the Scorable API used by the benchmarks.
+
+Only the endpoints the MCP server talks to are emulated, with a configurable
+artificial latency so network effects can be measured without touching the
+real API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import ipaddress
+import os
+import random
+import socket
+import tempfile
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import uvicorn
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+# Settings are loaded at import time of scorable_mcp, make sure they validate.
+os.environ.setdefault("SCORABLE_API_KEY", "benchmark")
+
+from starlette.applications import Starlette  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+from starlette.routing import Route  # noqa: E402
+
+
+@dataclass
+class StandInStats:
+    """Counters collected by the stand-in server."""
+
+    requests: int = 0
+    connections: set[tuple[str, int]] = field(default_factory=set)
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.connections.clear()
+
+
+LatencyFn = Callable[[], float]
+
+
+def fixed_latency(seconds: float) -> LatencyFn:
+    """Return a latency function that always sleeps *seconds*."""
+    return lambda: seconds
+
+
+def long_tail_latency(base: float, slow: float, slow_ratio: float) -> LatencyFn:
+    """Return a latency function where *slow_ratio* of the calls take *slow* seconds."""
+    return lambda: slow if random.random() < slow_ratio else base
+
+
+def build_app(
+    latency: LatencyFn,
+    stats: StandInStats,
+    evaluators: int = 200,
+    judge_evaluators: int = 6,
+) -> Starlette:
+    """Build a Starlette app emulating the Scorable API."""
+
+    catalog = [
+        {
+            "id": f"eval-{i}",
+            "name": f"Evaluator {i}",
+            "created_at": "2025-01-01T00:00:00Z",
+            "objective": {"intent": f"Intent {i}"},
+            "inputs": {"request": {"type": "string"}, "response": {"type": "string"}},
+        }
+        for i in range(evaluators)
+    ]
+    judge = {
+        "id": "judge-1",
+        "name": "Judge 1",
+        "created_at": "2025-01-01T00:00:00Z",
+        "intent": "Benchmark judge",
+        "evaluators": [
+            {"id": f"eval-{i}", "name": f"Evaluator {i}", "intent": f"Intent {i}"}
+            for i in range(judge_evaluators)
+        ],
+    }
+
+    async def _track(request: Request) -> None:
+        stats.requests += 1
+        if request.client is not None:
+            stats.connections.add((request.client.host, request.client.port))
+        # Drain the body like a real server would before answering.
+        await request.body()
+
+    async def execute(request: Request) -> JSONResponse:
+        await _track(request)
+        await asyncio.sleep(latency())
+        evaluator_id = request.path_params["evaluator_id"]
+        return JSONResponse(
+            {
+                "result": {
+                    "evaluator_name": f"Evaluator {evaluator_id}",
+                    "score": 0.75,
+                    "justification": "Stand-in justification",
+                    "execution_log_id": "log-1",
+                    "cost": 0.001,
+                }
+            }
+        )
+
+    async def execute_judge(request: Request) -> JSONResponse:
+        await _track(request)
+        # The server-side judge runs its evaluators one after another.
+        for _ in judge["evaluators"]:
+            await asyncio.sleep(latency())
+        return JSONResponse(
+            {
+                "evaluator_results": [
+                    {
+                        "evaluator_name": e["name"],
+                        "score": 0.75,
+                        "justification": "Stand-in justification",
+                    }
+                    for e in judge["evaluators"]
+                ]
+            }
+        )
+
+    async def list_evaluators(request: Request) -> JSONResponse:
+        await _track(request)
+        await asyncio.sleep(latency())
+        page = int(request.query_params.get("page", "1"))
+        page_size = int(request.query_params.get("page_size", "40"))
+        start = (page - 1) * page_size
+        results = catalog[start : start + page_size]
+        has_next = start + page_size < len(catalog)
+        next_url = (
+            f"{request.base_url}v1/evaluators?page={page + 1}&page_size={page_size}"
+            if has_next
+            else None
+        )
+        return JSONResponse({"count": len(catalog), "next": next_url, "results": results})
+
+    async def list_judges(request: Request) -> JSONResponse:
+        await _track(request)
+        await asyncio.sleep(latency())
+        return JSONResponse({"count": 1, "next": None, "results": [judge]})
+
+    return Starlette(
+        routes=[
+            Route("/v1/evaluators/execute/{evaluator_id}/", execute, methods=["POST"]),
+            Route("/v1/evaluators", list_evaluators),
+            Route("/v1/judges", list_judges),
+            Route("/v1/judges/{judge_id}/execute/", execute_judge, methods=["POST"]),
+        ]
+    )
+
+
+def _self_signed_certificate(directory: Path) -> tuple[Path, Path]:
+    """Write a self-signed certificate for 127.0.0.1 into *directory*."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.UTC)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .sign(key, hashes.SHA256())
+    )
+    certfile = directory / "cert.pem"
+    keyfile = directory / "key.pem"
+    certfile.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    keyfile.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return certfile, keyfile
+
+
+def free_port() -> int:
+    """Return a free TCP port on localhost."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+@asynccontextmanager
+async def serve(app: Starlette, http2: bool = False) -> AsyncIterator[str]:
+    """Serve *app* on a free local port and yield its base URL.
+
+    HTTP/2 needs hypercorn (``pip install hypercorn``) and is served over TLS with a
+    throw-away self-signed certificate so that ALPN negotiates it exactly like against
+    the real API; otherwise uvicorn serves plain HTTP/1.1.
+    """
+    port = free_port()
+    if http2:
+        from hypercorn.asyncio import serve as hypercorn_serve  # noqa: PLC0415
+        from hypercorn.config import Config  # noqa: PLC0415
+
+        with tempfile.TemporaryDirectory() as tmp:
+            certfile, keyfile = _self_signed_certificate(Path(tmp))
+            config = Config()
+            config.bind = [f"127.0.0.1:{port}"]
+            config.certfile = str(certfile)
+            config.keyfile = str(keyfile)
+            config.alpn_protocols = ["h2", "http/1.1"]
+            config.accesslog = None
+            config.errorlog = None
+            shutdown = asyncio.Event()
+            task = asyncio.create_task(
+                hypercorn_serve(app, config, shutdown_trigger=shutdown.wait)  # type: ignore[arg-type]
+            )
+            await asyncio.sleep(0.5)
+            try:
+                yield f"https://127.0.0.1:{port}"
+            finally:
+                shutdown.set()
+                await task
+    else:
+        server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        )
+        task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.05)
+        try:
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            server.should_exit = True
+            await task
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Return the *q* percentile (0-1) of *samples* using nearest-rank."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
@@ -0,0 +1,76 @@
+"""Measure how hedged requests cut the tail latency of evaluator executions.
+
+Runs the same evaluator against a local stand-in API where a small fraction of
+the executions is much slower than the rest, first without hedging and then
+with it, and reports the latency percentiles and the extra requests sent.
+
+run it with: uv run python benchmarks/hedged_requests.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from _standin import StandInStats, build_app, long_tail_latency, percentile, serve
+
+from scorable_mcp.hedging import HedgePolicy
+from scorable_mcp.latency import LatencyTracker
+from scorable_mcp.retry import RetryBudget
+from scorable_mcp.root_api_client import ScorableConnection, ScorableEvaluatorRepository
+from scorable_mcp.settings import settings
+
+
+async def _run(
+    base_url: str, label: str, hedging: HedgePolicy | None, stats: StandInStats, calls: int
+) -> None:
+    connection = ScorableConnection(hedging=hedging)
+    repository = ScorableEvaluatorRepository(
+        api_key="benchmark", base_url=base_url, connection=connection
+    )
+    stats.reset()
+
+    samples: list[float] = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+        samples.append(time.perf_counter() - started)
+
+    print(
+        f"{label:10s} p50={percentile(samples, 0.5) * 1000:7.1f}ms "
+        f"p99={percentile(samples, 0.99) * 1000:7.1f}ms "
+        f"max={max(samples) * 1000:7.1f}ms requests={stats.requests}"
+    )
+    await connection.aclose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--base", type=float, default=0.01, help="usual latency (s)")
+    parser.add_argument("--slow", type=float, default=0.3, help="latency of slow calls (s)")
+    parser.add_argument("--slow-ratio", type=float, default=0.03, help="fraction of slow calls")
+    parser.add_argument("--percentile", type=float, default=0.95, help="hedge threshold")
+    args = parser.parse_args()
+
+    stats = StandInStats()
+    app = build_app(long_tail_latency(args.base, args.slow, args.slow_ratio), stats)
+    async with serve(app) as base_url:
+        await _run(base_url, "no hedge", None, stats, args.calls)
+        await _run(
+            base_url,
+            "hedged",
+            HedgePolicy(
+                tracker=LatencyTracker(),
+                percentile=args.percentile,
+                min_delay=settings.hedge_min_delay,
+                budget=RetryBudget(ratio=settings.hedge_budget_ratio, min_per_second=0.0),
+            ),
+            stats,
+            args.calls,
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""Compare HTTP/1.1 and HTTP/2 connection usage for concurrent evaluations.
+
+Fires bursts of concurrent ``run_evaluator`` calls against a local stand-in API
+and reports how many TCP connections the server saw and the latency percentiles.
+
+run it with: uv run --extra http2 --with hypercorn python benchmarks/http2_connections.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from _standin import StandInStats, build_app, fixed_latency, percentile, serve
+
+from scorable_mcp.root_api_client import ScorableConnection, ScorableEvaluatorRepository
+
+
+async def _run_mode(http2: bool, concurrency: int, rounds: int, latency: float) -> None:
+    stats = StandInStats()
+    app = build_app(fixed_latency(latency), stats)
+    async with serve(app, http2=http2) as base_url:
+        connection = ScorableConnection(http2=http2)
+        if http2:
+            # Same pool settings, but trust the stand-in's self-signed certificate.
+            connection = ScorableConnection(
+                http2=True,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True, verify=False, limits=connection.limits
+                ),
+            )
+        repository = ScorableEvaluatorRepository(
+            api_key="benchmark", base_url=base_url, connection=connection
+        )
+
+        async def _one() -> float:
+            started = time.perf_counter()
+            await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+            return time.perf_counter() - started
+
+        await _one()  # warm-up
+        stats.reset()
+        samples: list[float] = []
+        started = time.perf_counter()
+        for _ in range(rounds):
+            samples.extend(await asyncio.gather(*(_one() for _ in range(concurrency))))
+        elapsed = time.perf_counter() - started
+        await connection.aclose()
+
+    label = "HTTP/2  " if http2 else "HTTP/1.1"
+    print(
+        f"{label} requests={stats.requests:5d} connections={len(stats.connections):4d} "
+        f"p50={percentile(samples, 0.5) * 1000:7.1f}ms "
+        f"p99={percentile(samples, 0.99) * 1000:7.1f}ms "
+        f"throughput={stats.requests / elapsed:8.1f} req/s"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05, help="server latency (s)")
+    args = parser.parse_args()
+
+    await _run_mode(False, args.concurrency, args.rounds, args.latency)
+    await _run_mode(True, args.concurrency, args.rounds, args.latency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
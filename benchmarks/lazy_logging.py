@@ -0,0 +1,93 @@
+"""Microbenchmark for the payload debug logs on the API client's hot paths.
+
+Compares the former f-string debug logs, which render whole request and
+response payloads on every call, with %-style logs taking a truncated
+:class:`~scorable_mcp.logpreview.Preview`, which render nothing while DEBUG is
+off. Reports the CPU time per call with DEBUG off (the production setting) and
+on (records written to a discarded stream), for an evaluator execution and a
+page of the evaluator catalog.
+
+run it with: uv run python benchmarks/lazy_logging.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import time
+import timeit
+from typing import Any
+
+from scorable_mcp.logpreview import Preview
+
+logger = logging.getLogger("scorable_mcp.benchmark")
+
+PAYLOAD = {
+    "request": "How do I reset my password? " * 20,
+    "response": "Open the account settings and choose 'Reset password'. " * 40,
+    "contexts": ["The account settings page lists security options. " * 10] * 5,
+}
+EXECUTION = json.dumps(
+    {
+        "result": {
+            "evaluator_name": "Clarity",
+            "score": 0.75,
+            "justification": "The answer is clear and well structured. " * 40,
+        }
+    }
+).encode()
+PAGE = json.dumps(
+    {
+        "count": 40,
+        "next": None,
+        "results": [
+            {"id": f"eval-{i}", "name": f"Evaluator {i}", "objective": {"intent": "x" * 200}}
+            for i in range(40)
+        ],
+    }
+).encode()
+
+
+def _eager(payload: dict[str, Any], body: bytes) -> None:
+    logger.debug(f"Request payload: {payload}")
+    logger.debug(f"Raw evaluation response: {body}")
+
+
+def _lazy(payload: dict[str, Any], body: bytes) -> None:
+    logger.debug("Request payload: %s", Preview(payload))
+    logger.debug("Raw evaluation response: %s", Preview(body))
+
+
+def _report(label: str, number: int, body: bytes) -> None:
+    before = timeit.timeit(lambda: _eager(PAYLOAD, body), number=number, timer=time.process_time)
+    after = timeit.timeit(lambda: _lazy(PAYLOAD, body), number=number, timer=time.process_time)
+    print(
+        f"{label:24s} f-string: {before / number * 1e6:8.2f}us  "
+        f"lazy: {after / number * 1e6:8.2f}us  saved: {(before - after) / number * 1e6:8.2f}us"
+    )
+
+
+def _run(number: int) -> None:
+    _report("execution, DEBUG off", number, EXECUTION)
+    _report("catalog page, DEBUG off", number, PAGE)
+
+    logger.setLevel(logging.DEBUG)
+    number = max(number // 10, 1)
+    _report("execution, DEBUG on", number, EXECUTION)
+    _report("catalog page, DEBUG on", number, PAGE)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        logging.basicConfig(level=logging.INFO, stream=devnull)
+        _run(args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Microbenchmark for the MCP ``list_tools`` handler.
+
+Compares rebuilding every ``Tool`` (and its JSON schema) per call with the
+cached catalogue served by ``scorable_mcp.tools.get_tools``.
+
+run it with: uv run python benchmarks/list_tools.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import timeit
+
+os.environ.setdefault("SCORABLE_API_KEY", "benchmark")
+
+from mcp.types import Tool  # noqa: E402
+
+from scorable_mcp import tools  # noqa: E402
+from scorable_mcp.core import RootMCPServerCore  # noqa: E402
+
+
+def _rebuild_tools() -> list[Tool]:
+    """What list_tools used to do on every call."""
+    return [
+        Tool(name=name, description=description, inputSchema=model.model_json_schema())
+        for name, description, model in tools._TOOL_SPECS
+    ]
+
+
+def _report(label: str, seconds: float, number: int) -> float:
+    per_call = seconds / number * 1e6
+    print(f"{label:<28} {per_call:10.2f} µs/call")
+    return per_call
+
+
+def main() -> None:
+    core = RootMCPServerCore()
+    loop = asyncio.new_event_loop()
+    number = 2_000
+    tools.get_tools()  # build the catalogue outside the timed loop
+
+    rebuilt = _report("rebuild per call", timeit.timeit(_rebuild_tools, number=number), number)
+    cached = _report("cached get_tools()", timeit.timeit(tools.get_tools, number=number), number)
+    _report(
+        "core.list_tools()",
+        timeit.timeit(lambda: loop.run_until_complete(core.list_tools()), number=number),
+        number,
+    )
+    _report(
+        "get_request_model()",
+        timeit.timeit(lambda: tools.get_request_model("run_judge"), number=number),
+        number,
+    )
+    print(f"speed-up: {rebuilt / cached:,.0f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
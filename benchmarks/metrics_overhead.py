@@ -0,0 +1,70 @@
+"""Microbenchmark for the cost of recording and scraping server metrics.
+
+Measures what the hot paths pay per tool call and upstream request (a counter
+increment, a gauge up and down and a histogram observation), and how long a
+/metrics scrape of a registry with every tool and endpoint series takes.
+
+run it with: uv run python benchmarks/metrics_overhead.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from scorable_mcp.metrics import MetricsRegistry
+
+TOOLS = (
+    "list_evaluators",
+    "run_evaluation",
+    "run_evaluation_by_name",
+    "run_evaluation_batch",
+    "run_evaluations",
+    "run_coding_policy_adherence",
+    "list_judges",
+    "run_judge",
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args()
+
+    registry = MetricsRegistry()
+    calls = registry.counter("tool_calls_total", "Tool calls", ("tool", "outcome"))
+    in_flight = registry.gauge("tool_calls_in_flight", "In flight", ("tool",))
+    duration = registry.histogram("tool_call_duration_seconds", "Duration", ("tool",))
+    upstream = registry.histogram(
+        "upstream_request_duration_seconds", "Upstream", ("method", "endpoint", "status")
+    )
+
+    def _tool_call() -> None:
+        in_flight.inc("run_judge")
+        in_flight.dec("run_judge")
+        duration.observe(0.12, "run_judge")
+        calls.inc("run_judge", "ok")
+
+    def _upstream_request() -> None:
+        upstream.observe(0.08, "POST", "judges", "200")
+
+    for tool in TOOLS:
+        _tool_call()
+        calls.inc(tool, "ok")
+        duration.observe(0.3, tool)
+    for endpoint in ("execute", "list", "judges"):
+        for status in ("200", "429", "500", "error"):
+            upstream.observe(0.1, "POST", endpoint, status)
+
+    number = args.number
+    per_call = timeit.timeit(_tool_call, number=number) / number
+    per_request = timeit.timeit(_upstream_request, number=number) / number
+    scrapes = max(number // 100, 1)
+    per_scrape = timeit.timeit(registry.render, number=scrapes) / scrapes
+    print(f"tool call metrics:        {per_call * 1e6:6.2f}us")
+    print(f"upstream request metrics: {per_request * 1e6:6.2f}us")
+    print(f"scrape ({len(registry.render().splitlines())} lines):      {per_scrape * 1e6:6.1f}us")
+
+
+if __name__ == "__main__":
+    main()
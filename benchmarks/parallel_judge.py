@@ -0,0 +1,82 @@
+"""Compare server-side and client-side parallel judge execution.
+
+Runs the same judge against a local stand-in API whose judge endpoint executes
+its evaluators one after another, first through the judge endpoint and then in
+``parallel`` mode, which fans the evaluators out through the execute endpoint.
+Also reports how soon ``stream_judge`` delivers its first partial result.
+
+run it with: uv run python benchmarks/parallel_judge.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from contextlib import aclosing
+
+from _standin import StandInStats, build_app, fixed_latency, percentile, serve
+
+from scorable_mcp.judge import JudgeService
+from scorable_mcp.root_api_client import ScorableConnection
+from scorable_mcp.schema import RunJudgeRequest
+from scorable_mcp.settings import settings
+
+REQUEST = RunJudgeRequest(judge_id="judge-1", request="What is 2+2?", response="4")
+
+
+async def _run_mode(mode: str, rounds: int) -> None:
+    settings.judge_execution_mode = mode  # type: ignore[assignment]
+    connection = ScorableConnection()
+    service = JudgeService(connection=connection)
+    await service.get_judge_index()  # load the catalog outside of the measurement
+
+    samples: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        await service.run_judge(REQUEST)
+        samples.append(time.perf_counter() - started)
+
+    print(
+        f"{mode:8s} p50={percentile(samples, 0.5) * 1000:7.1f}ms "
+        f"p99={percentile(samples, 0.99) * 1000:7.1f}ms"
+    )
+    await service.aclose()
+    await connection.aclose()
+
+
+async def _first_partial_result(rounds: int) -> None:
+    connection = ScorableConnection()
+    service = JudgeService(connection=connection)
+    await service.get_judge_index()
+
+    first: list[float] = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        async with aclosing(service.stream_judge(REQUEST)) as results:
+            async for _result in results:
+                first.append(time.perf_counter() - started)
+                break
+
+    print(f"stream   first result p50={percentile(first, 0.5) * 1000:7.1f}ms")
+    await service.aclose()
+    await connection.aclose()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--evaluators", type=int, default=6, help="evaluators in the judge")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="per-evaluator latency (s)")
+    args = parser.parse_args()
+
+    app = build_app(fixed_latency(args.latency), StandInStats(), judge_evaluators=args.evaluators)
+    async with serve(app) as base_url:
+        settings.scorable_api_url = base_url
+        await _run_mode("server", args.rounds)
+        await _run_mode("parallel", args.rounds)
+        await _first_partial_result(args.rounds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""Microbenchmark for validating Scorable API responses.
+
+Compares decoding response bodies to dicts and then building models (the
+former ``response.json()`` + ``model_validate`` / hand-copied fields path) with
+validating the raw bytes through cached ``TypeAdapter``s, for an execution
+result and a page of the evaluator catalog.
+
+run it with: uv run python benchmarks/response_validation.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import timeit
+from typing import Any
+
+os.environ.setdefault("SCORABLE_API_KEY", "benchmark")
+
+from scorable_mcp.root_api_client import ScorableEvaluatorRepository  # noqa: E402
+from scorable_mcp.schema import EvaluationResponse, EvaluatorInfo  # noqa: E402
+
+EXECUTION = json.dumps(
+    {
+        "result": {
+            "evaluator_name": "Clarity",
+            "score": 0.75,
+            "justification": "The answer is clear and well structured. " * 40,
+            "execution_log_id": "log-1",
+            "cost": 0.001,
+        }
+    }
+).encode()
+
+
+def _catalog_page(size: int) -> bytes:
+    return json.dumps(
+        {
+            "count": size,
+            "next": None,
+            "results": [
+                {
+                    "id": f"eval-{i}",
+                    "name": f"Evaluator {i}",
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "objective": {"intent": f"Intent {i}", "version": 3},
+                    "inputs": {
+                        "request": {"type": "string"},
+                        "response": {"type": "string"},
+                        "contexts": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "status": "active",
+                }
+                for i in range(size)
+            ],
+        }
+    ).encode()
+
+
+def _decoded_execution(body: bytes) -> EvaluationResponse:
+    data = json.loads(body)
+    return EvaluationResponse.model_validate(data.get("result", data))
+
+
+def _decoded_page(body: bytes) -> list[EvaluatorInfo]:
+    evaluators = []
+    for item in json.loads(body)["results"]:
+        objective: dict[str, Any] = item.get("objective") or {}
+        evaluators.append(
+            EvaluatorInfo(
+                id=item["id"],
+                name=item["name"],
+                created_at=item["created_at"],
+                intent=objective.get("intent"),
+                inputs=item["inputs"],
+            )
+        )
+    return evaluators
+
+
+def _bytes_page(body: bytes) -> list[Any]:
+    items, _, _ = ScorableEvaluatorRepository._parse_page(body, 0, "evaluators", None)
+    return items
+
+
+def _report(label: str, before: float, after: float, number: int) -> None:
+    print(
+        f"{label:18s} dicts: {before / number * 1e6:8.1f}us  "
+        f"bytes: {after / number * 1e6:8.1f}us  speedup: {before / after:4.2f}x"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=40)
+    args = parser.parse_args()
+
+    parse_execution = ScorableEvaluatorRepository._parse_evaluation_response
+    assert _decoded_execution(EXECUTION) == parse_execution(EXECUTION)
+    page = _catalog_page(args.page_size)
+    assert _decoded_page(page) == _bytes_page(page)
+
+    _report(
+        "execution result",
+        timeit.timeit(lambda: _decoded_execution(EXECUTION), number=args.number),
+        timeit.timeit(lambda: parse_execution(EXECUTION), number=args.number),
+        args.number,
+    )
+    number = max(args.number // 10, 1)
+    _report(
+        f"catalog page ({args.page_size})",
+        timeit.timeit(lambda: _decoded_page(page), number=number),
+        timeit.timeit(lambda: _bytes_page(page), number=number),
+        number,
+    )
+
+
+if __name__ == "__main__":
+    main()
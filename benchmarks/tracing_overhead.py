@@ -0,0 +1,68 @@
+"""Microbenchmark for the cost of tracing spans on the tool call path.
+
+A traced judge call opens six spans (tool call, argument validation, judge
+run, payload encoding, upstream request, result serialization). Measures that
+span tree with tracing disabled (the default no-op path), with tracing enabled
+and spans handed to an exporter that drops them, and without any span code.
+
+run it with: uv run python benchmarks/tracing_overhead.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import timeit
+
+from scorable_mcp.tracing import Span, Tracer
+
+
+class _DroppingExporter:
+    async def export(self, spans: list[Span]) -> None:
+        return None
+
+
+def _baseline() -> None:
+    for _ in range(6):
+        pass
+
+
+def _span_tree(tracer: Tracer) -> None:
+    with tracer.span("mcp.call_tool") as call:
+        call.set_attribute("mcp.tool.name", "run_judge")
+        with tracer.span("mcp.validate_arguments"):
+            pass
+        with tracer.span("judge.run") as run:
+            run.set_attribute("scorable.judge.id", "judge-1")
+            with tracer.span("scorable.encode_payload"):
+                pass
+            with tracer.span("scorable.request") as request:
+                request.set_attribute("http.response.status_code", 200)
+        with tracer.span("mcp.serialize_result") as serialize:
+            serialize.set_attribute("mcp.result.size", 512)
+        call.set_attribute("mcp.tool.outcome", "ok")
+
+
+async def _measure(number: int) -> None:
+    disabled = Tracer()
+    enabled = Tracer(_DroppingExporter(), batch_size=number * 6 + 1)
+
+    baseline = timeit.timeit(_baseline, number=number) / number
+    off = timeit.timeit(lambda: _span_tree(disabled), number=number) / number
+    on = timeit.timeit(lambda: _span_tree(enabled), number=number) / number
+    await enabled.flush()
+
+    print(f"no span code:      {baseline * 1e6:6.2f}us per call")
+    print(f"tracing disabled:  {off * 1e6:6.2f}us per call")
+    print(f"tracing enabled:   {on * 1e6:6.2f}us per call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(_measure(args.number))
+
+
+if __name__ == "__main__":
+    main()
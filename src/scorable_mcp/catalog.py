@@ -0,0 +1,217 @@
+"""In-process caching for the evaluator and judge catalogs.
+
+Catalogs change rarely but are listed at the start of almost every agent
+conversation, so they are served from memory and refreshed in the background
+(stale-while-revalidate) instead of re-walking every API page on each call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Protocol
+
+from scorable_mcp.singleflight import SingleFlight
+
+logger = logging.getLogger("scorable_mcp.catalog")
+
+
+class CatalogItem(Protocol):
+    """Anything listed in a catalog: evaluators and judges."""
+
+    @property
+    def id(self) -> str: ...
+
+    @property
+    def name(self) -> str: ...
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a catalog item name for lookups (case and whitespace insensitive)."""
+    return " ".join(name.split()).casefold()
+
+
+class CatalogIndex[T: CatalogItem]:
+    """Immutable, indexed snapshot of a catalog.
+
+    Built once per catalog refresh so that lookups by ID or name are dictionary
+    hits instead of linear scans over a freshly downloaded list.
+    """
+
+    __slots__ = ("_by_exact_name", "_by_id", "_by_name", "items")
+
+    def __init__(self, items: Iterable[T]):
+        """Index *items*, keeping their original order.
+
+        When several items share a name the first one wins, matching the order
+        in which the API returned them.
+        """
+        self.items: tuple[T, ...] = tuple(items)
+        self._by_id: dict[str, T] = {}
+        self._by_exact_name: dict[str, str] = {}
+        self._by_name: dict[str, str] = {}
+        for item in self.items:
+            self._by_id.setdefault(item.id, item)
+            self._by_exact_name.setdefault(item.name, item.id)
+            self._by_name.setdefault(normalize_name(item.name), item.id)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._by_id
+
+    def get(self, item_id: str) -> T | None:
+        """Return the item with *item_id*, or None."""
+        return self._by_id.get(item_id)
+
+    def id_for_name(self, name: str) -> str | None:
+        """Resolve *name* to an item ID, preferring an exact match over a normalized one."""
+        item_id = self._by_exact_name.get(name)
+        if item_id is None:
+            item_id = self._by_name.get(normalize_name(name))
+        return item_id
+
+    def get_by_name(self, name: str) -> T | None:
+        """Return the item called *name*, or None."""
+        item_id = self.id_for_name(name)
+        return self._by_id[item_id] if item_id is not None else None
+
+
+@dataclass
+class _CacheEntry[T]:
+    value: T
+    fetched_at: float
+
+
+class CatalogCache[T]:
+    """TTL cache with a stale-while-revalidate grace window.
+
+    * Within ``ttl`` seconds of a fetch the cached value is returned as-is.
+    * Within the following ``stale_ttl`` seconds the stale value is returned
+      immediately and a single background task refreshes it.
+    * After that the value is considered expired and callers wait for a reload.
+
+    A ``ttl`` of zero or less disables caching entirely.
+
+    Concurrent loads of the same key, cached or not, share a single call to
+    the loader.
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float = 0.0):
+        """Initialize the cache.
+
+        Args:
+            name: Human readable catalog name used in logs
+            ttl: Seconds a fetched value is considered fresh
+            stale_ttl: Extra seconds a stale value may be served while refreshing
+        """
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, 0.0)
+        self._entries: dict[Hashable, _CacheEntry[T]] = {}
+        self._refresh_tasks: dict[Hashable, asyncio.Task[None]] = {}
+        self._inflight: SingleFlight[Hashable, T] = SingleFlight(f"{name} catalog")
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        """Return the cached value for *key*, loading or refreshing it as needed.
+
+        Args:
+            key: Cache key, e.g. the requested maximum item count
+            loader: Coroutine factory fetching a fresh value from the API
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            Exception: Whatever *loader* raises when no usable cached value exists
+        """
+        if not self.enabled:
+            return await self._inflight.do(key, loader)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.fetched_at
+            if age < self.ttl:
+                return entry.value
+            if age < self.ttl + self.stale_ttl:
+                self._schedule_refresh(key, loader)
+                return entry.value
+
+        return await self._load(key, loader)
+
+    def peek(self, key: Hashable) -> T | None:
+        """Return the cached value for *key* while it is fresh, without loading it."""
+        entry = self._entries.get(key) if self.enabled else None
+        if entry is None or time.monotonic() - entry.fetched_at >= self.ttl:
+            return None
+        return entry.value
+
+    def seed(self, key: Hashable, value: T, age: float) -> bool:
+        """Install a previously saved *value* fetched *age* seconds ago.
+
+        Snapshots older than the fresh window are installed as stale, so they
+        are served right away and the first request refreshes them in the
+        background. Existing entries are never overwritten.
+
+        Returns:
+            Whether the value was installed
+        """
+        if not self.enabled or key in self._entries:
+            return False
+        if age >= self.ttl and self.stale_ttl == 0:
+            return False
+
+        age = min(max(age, 0.0), self.ttl)
+        self._entries[key] = _CacheEntry(value=value, fetched_at=time.monotonic() - age)
+        return True
+
+    @property
+    def coalesced(self) -> int:
+        """Number of loads that joined a load already in flight."""
+        return self._inflight.coalesced
+
+    def invalidate(self, key: Hashable | None = None) -> None:
+        """Drop the cached value for *key*, or every value when *key* is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def aclose(self) -> None:
+        """Cancel pending background refreshes."""
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refresh_tasks.clear()
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> T:
+        async def _fetch() -> T:
+            value = await loader()
+            self._entries[key] = _CacheEntry(value=value, fetched_at=time.monotonic())
+            return value
+
+        return await self._inflight.do(key, _fetch)
+
+    def _schedule_refresh(self, key: Hashable, loader: Callable[[], Awaitable[T]]) -> None:
+        if key in self._refresh_tasks:
+            return
+
+        async def _refresh() -> None:
+            try:
+                await self._load(key, loader)
+                logger.debug("Refreshed %s catalog in the background", self.name)
+            except Exception as e:
+                logger.warning("Background refresh of %s catalog failed: %s", self.name, e)
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.create_task(_refresh())
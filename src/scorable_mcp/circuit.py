@@ -0,0 +1,191 @@
+"""Circuit breakers for the Scorable API.
+
+While the API is failing, every call would otherwise wait out the full request
+timeout. A breaker counts consecutive failures per endpoint class and, once a
+threshold is reached, rejects calls immediately for a cool-down period. After
+that a limited number of probe calls are let through: a success closes the
+circuit again, a failure re-opens it.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Any, Literal
+
+logger = logging.getLogger("scorable_mcp.circuit")
+
+EndpointClass = Literal["execute", "list", "judges"]
+
+ENDPOINT_CLASSES: tuple[EndpointClass, ...] = ("execute", "list", "judges")
+
+
+def endpoint_class(method: str, path: str) -> EndpointClass:
+    """Classify a Scorable API request for circuit breaking.
+
+    Judge endpoints form their own class; evaluator requests are split into
+    executions (POST) and catalog listings.
+    """
+    if "/judges" in path:
+        return "judges"
+    return "execute" if method.upper() == "POST" else "list"
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint class."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            name: Endpoint class guarded by the breaker, used in logs and errors
+            failure_threshold: Consecutive failures opening the circuit (0 disables)
+            recovery_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Concurrent probe calls allowed while half-open
+            clock: Monotonic time source, mainly for tests
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = max(half_open_max_calls, 1)
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the cool-down has passed."""
+        if self._state is CircuitState.OPEN and self.retry_after() == 0.0:
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+            logger.info("Circuit for %s endpoints is half-open, probing", self.name)
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit starts probing, 0 when it is not open."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+
+    def allow(self) -> bool:
+        """Whether a call may be sent now.
+
+        Every allowed call must be followed by :meth:`record_success`,
+        :meth:`record_failure` or :meth:`release`.
+        """
+        if not self.enabled:
+            return True
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+            self._probes += 1
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a call that reached a healthy API."""
+        if self._state is CircuitState.HALF_OPEN:
+            logger.info("Circuit for %s endpoints closed", self.name)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self) -> None:
+        """Record a call that failed because the API is unhealthy."""
+        if not self.enabled:
+            return
+        self._failures += 1
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._open()
+
+    def release(self) -> None:
+        """Give back a probe slot for a call that ended without an outcome."""
+        if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the breaker state for health reports."""
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self._failures,
+            "retry_after": round(self.retry_after(), 3),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+        }
+
+    def _open(self) -> None:
+        if self._state is not CircuitState.OPEN:
+            self.times_opened += 1
+            logger.warning(
+                "Circuit for %s endpoints opened after %d failures, failing fast for %.0fs",
+                self.name,
+                self._failures,
+                self.recovery_timeout,
+            )
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._probes = 0
+
+
+class CircuitBreakers:
+    """One breaker per endpoint class, shared by every repository on a connection."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a breaker for each endpoint class with the same configuration."""
+        self._breakers: dict[EndpointClass, CircuitBreaker] = {
+            name: CircuitBreaker(
+                name,
+                failure_threshold=failure_threshold,
+                recovery_timeout=recovery_timeout,
+                half_open_max_calls=half_open_max_calls,
+                clock=clock,
+            )
+            for name in ENDPOINT_CLASSES
+        }
+
+    def __getitem__(self, name: EndpointClass) -> CircuitBreaker:
+        return self._breakers[name]
+
+    def for_request(self, method: str, path: str) -> CircuitBreaker:
+        """Return the breaker guarding a *method* request to *path*."""
+        return self._breakers[endpoint_class(method, path)]
+
+    @property
+    def healthy(self) -> bool:
+        """Whether every circuit is closed."""
+        return all(b.state is CircuitState.CLOSED for b in self._breakers.values())
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return the state of every breaker keyed by endpoint class."""
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
@@ -179,6 +179,50 @@ class ScorableMCPClient:
 
         return await self.call_tool("run_evaluation_by_name", arguments)
 
+    async def run_evaluation_batch(self, items: list[dict[str, Any]]) -> dict[str, Any]:
+        """Run many evaluations in a single tool call.
+
+        Args:
+            items: Evaluation arguments, each with either "evaluator_id" or "evaluator_name"
+
+        Returns:
+            Per-item results and errors in input order, plus success and failure counts
+        """
+        return await self.call_tool("run_evaluation_batch", {"items": items})
+
+    async def run_evaluations(
+        self,
+        request: str,
+        response: str,
+        evaluator_ids: list[str] | None = None,
+        evaluator_names: list[str] | None = None,
+        contexts: list[str] | None = None,
+        expected_output: str | None = None,
+    ) -> dict[str, Any]:
+        """Run several evaluators on the same request/response pair.
+
+        Args:
+            request: The user request/query
+            response: The model's response to evaluate
+            evaluator_ids: IDs of the evaluators to run
+            evaluator_names: Names of further evaluators to run
+            contexts: Optional list of contexts. Only used for evaluators that require contexts.
+            expected_output: Optional expected LLM response. Only used for evaluators that require expected output.
+
+        Returns:
+            Per-evaluator results, total cost and wall time
+        """
+        arguments = {
+            "evaluator_ids": evaluator_ids or [],
+            "evaluator_names": evaluator_names or [],
+            "request": request,
+            "response": response,
+            "contexts": contexts,
+            "expected_output": expected_output,
+        }
+
+        return await self.call_tool("run_evaluations", arguments)
+
     async def run_rag_evaluation_by_name(
         self, evaluator_name: str, request: str, response: str, contexts: list[str]
     ) -> dict[str, Any]:
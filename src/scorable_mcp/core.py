@@ -9,6 +9,8 @@ from __future__ import annotations
 
 import json
 import logging
+import sqlite3
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
@@ -18,8 +20,17 @@ from mcp.types import TextContent, Tool
 from scorable_mcp import tools as tool_catalogue
 from scorable_mcp.evaluator import EvaluatorService
 from scorable_mcp.judge import JudgeService
+from scorable_mcp.logpreview import Preview
+from scorable_mcp.metrics import Samples
+from scorable_mcp.persistent_cache import SQLiteCacheStore
+from scorable_mcp.progress import ProgressReporter, progress_scope
+from scorable_mcp.result_cache import ResultCache
+from scorable_mcp.root_api_client import ScorableConnection
+from scorable_mcp.scheduler import FairScheduler, SchedulerFullError
 from scorable_mcp.schema import (
     CodingPolicyAdherenceEvaluationRequest,
+    EvaluationBatchRequest,
+    EvaluationBatchResponse,
     EvaluationRequest,
     EvaluationRequestByName,
     EvaluationResponse,
@@ -27,11 +38,15 @@ from scorable_mcp.schema import (
     JudgesListResponse,
     ListEvaluatorsRequest,
     ListJudgesRequest,
+    MultiEvaluationRequest,
+    MultiEvaluationResponse,
     RunJudgeRequest,
     RunJudgeResponse,
     UnknownToolRequest,
 )
+from scorable_mcp.session import DEFAULT_SESSION, session_scope
 from scorable_mcp.settings import settings
+from scorable_mcp.tracing import current_span, tracer
 
 logger = logging.getLogger("scorable_mcp.core")
 
@@ -39,10 +54,62 @@ logger = logging.getLogger("scorable_mcp.core")
 _Handler = Callable[[Any], Awaitable[Any]]
 
 
+def _call_cost(request: Any) -> float:
+    """Relative amount of upstream work of a tool call, used for fair queuing."""
+    if isinstance(request, EvaluationBatchRequest):
+        return float(len(request.items))
+    if isinstance(request, MultiEvaluationRequest):
+        return float(len(request.evaluator_ids) + len(request.evaluator_names))
+    return 1.0
+
+
+def _call_width(request: Any) -> int:
+    """Upstream executions a tool call may run at once, the scheduler slots it holds."""
+    if isinstance(request, EvaluationBatchRequest):
+        return min(len(request.items), settings.batch_max_concurrency)
+    if isinstance(request, MultiEvaluationRequest):
+        targets = len(request.evaluator_ids) + len(request.evaluator_names)
+        return min(targets, settings.batch_max_concurrency)
+    if isinstance(request, RunJudgeRequest) and settings.judge_execution_mode == "parallel":
+        return settings.judge_max_concurrency
+    return 1
+
+
 class RootMCPServerCore:  # noqa: D101
     def __init__(self) -> None:
-        self.evaluator_service = EvaluatorService()
-        self.judge_service = JudgeService()
+        self.connection = ScorableConnection()
+        self.metrics = self.connection.metrics
+        self.store = (
+            SQLiteCacheStore(
+                settings.cache_db_path,
+                max_entries=settings.cache_db_max_entries,
+                max_bytes=settings.cache_db_max_bytes,
+                flush_interval=settings.cache_db_flush_interval,
+            )
+            if settings.cache_db_path
+            else None
+        )
+        self.result_cache = (
+            ResultCache(
+                ttl=settings.result_cache_ttl,
+                max_entries=settings.result_cache_max_entries,
+                max_bytes=settings.result_cache_max_bytes,
+                store=self.store,
+            )
+            if settings.result_cache_enabled
+            else None
+        )
+        self.evaluator_service = EvaluatorService(
+            connection=self.connection, result_cache=self.result_cache, store=self.store
+        )
+        self.judge_service = JudgeService(
+            connection=self.connection, result_cache=self.result_cache, store=self.store
+        )
+        self.scheduler = FairScheduler(
+            max_concurrency=settings.scheduler_max_concurrency,
+            session_max_concurrency=settings.scheduler_session_max_concurrency,
+            max_queue=settings.scheduler_max_queue,
+        )
         self.app = Server("Scorable Evaluators")
 
         @self.app.list_tools()
@@ -51,16 +118,20 @@ class RootMCPServerCore:  # noqa: D101
 
         @self.app.call_tool()
         async def _call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-            return await self.call_tool(name, arguments)
+            with session_scope(self._session_key()), progress_scope(self._progress_reporter()):
+                return await self.call_tool(name, arguments)
 
         self._function_map: dict[str, _Handler] = {
             "list_evaluators": self._handle_list_evaluators,
             "run_evaluation": self._handle_run_evaluation,
             "run_evaluation_by_name": self._handle_run_evaluation_by_name,
+            "run_evaluation_batch": self._handle_run_evaluation_batch,
+            "run_evaluations": self._handle_run_evaluations,
             "run_coding_policy_adherence": self._handle_coding_style_evaluation,
             "list_judges": self._handle_list_judges,
             "run_judge": self._handle_run_judge,
         }
+        self._register_metrics()
 
     # ---------------------------------------------------------------------
     # Public API used by transports
@@ -69,14 +140,68 @@ class RootMCPServerCore:  # noqa: D101
     async def list_tools(self) -> list[Tool]:
         return tool_catalogue.get_tools()
 
+    async def start(self) -> None:
+        """Open the persistent cache, if configured, and warm the in-memory caches from it.
+
+        A broken cache file is logged and ignored; the server then starts cold.
+        """
+        if self.store is None:
+            return
+
+        try:
+            await self.store.open()
+            if self.result_cache is not None:
+                await self.result_cache.warm()
+            await self.evaluator_service.warm()
+            await self.judge_service.warm()
+        except (sqlite3.Error, OSError) as exc:
+            logger.error("Cannot use persistent cache %s: %s", self.store.path, exc)
+            await self.store.aclose()
+
+    def health(self) -> dict[str, Any]:
+        """Report the state of the Scorable API client and the local caches.
+
+        The status is ``degraded`` while any endpoint class fails fast. The result
+        cache and hedging are reported as None when they are disabled.
+        """
+        breakers = self.connection.breakers
+        return {
+            "status": "ok" if breakers.healthy else "degraded",
+            "circuits": breakers.snapshot(),
+            "rate_limits": self.connection.rate_limiter.stats(),
+            "timeouts": self.connection.timeouts.snapshot(),
+            "scheduler": self.scheduler.stats(),
+            "hedging": (
+                self.connection.hedging.stats() if self.connection.hedging is not None else None
+            ),
+            "result_cache": self.result_cache.stats() if self.result_cache is not None else None,
+            "coalescing": {
+                "evaluations": self.evaluator_service.stats(),
+                "judges": self.judge_service.stats(),
+            },
+        }
+
+    async def aclose(self) -> None:
+        """Release the shared Scorable API connection pool and flush the persistent cache.
+
+        Buffered tracing spans are exported as well.
+        """
+        await self.evaluator_service.aclose()
+        await self.judge_service.aclose()
+        await self.connection.aclose()
+        if self.store is not None:
+            await self.store.aclose()
+        await tracer.flush()
+
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Validate *arguments* and dispatch to the proper *tool* handler."""
 
-        logger.debug("Tool call %s with args %s", name, arguments)
+        logger.debug("Tool call %s with args %s", name, Preview(arguments))
 
         handler = self._function_map.get(name)
         if not handler:
             logger.warning("Unknown tool: %s", name)
+            self._tool_calls.inc("unknown", "unknown_tool")
             return [
                 TextContent(
                     type="text",
@@ -84,26 +209,58 @@ class RootMCPServerCore:  # noqa: D101
                 )
             ]
 
+        self._tool_in_flight.inc(name)
+        started = time.perf_counter()
+        outcome = "error"
+        with tracer.span("mcp.call_tool") as span:
+            span.set_attribute("mcp.tool.name", name)
+            try:
+                content, outcome = await self._dispatch(name, handler, arguments)
+                return content
+            finally:
+                span.set_attribute("mcp.tool.outcome", outcome)
+                span.set_status("ok" if outcome == "ok" else "error")
+                self._tool_in_flight.dec(name)
+                self._tool_duration.observe(time.perf_counter() - started, name)
+                self._tool_calls.inc(name, outcome)
+
+    async def _dispatch(
+        self, name: str, handler: _Handler, arguments: dict[str, Any]
+    ) -> tuple[list[TextContent], str]:
+        """Run *handler* on validated *arguments*, returning its content and outcome label."""
+
         model_cls = tool_catalogue.get_request_model(name) or UnknownToolRequest
-        try:
-            request_model = model_cls(**arguments)  # type: ignore[arg-type]
-        except Exception as exc:
-            logger.error("Validation error for tool %s: %s", name, exc, exc_info=settings.debug)
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"error": f"Invalid arguments for {name}: {exc}"}),
-                )
-            ]
+        with tracer.span("mcp.validate_arguments") as span:
+            if tracer.enabled:
+                span.set_attribute("mcp.arguments.size", len(json.dumps(arguments, default=str)))
+            try:
+                request_model = model_cls(**arguments)  # type: ignore[arg-type]
+            except Exception as exc:
+                span.set_status("error", str(exc))
+                logger.error("Validation error for tool %s: %s", name, exc, exc_info=settings.debug)
+                return [
+                    TextContent(
+                        type="text",
+                        text=json.dumps({"error": f"Invalid arguments for {name}: {exc}"}),
+                    )
+                ], "invalid"
 
         try:
-            result = await handler(request_model)  # type: ignore[arg-type]
-            return [
-                TextContent(
-                    type="text",
-                    text=result.model_dump_json(exclude_none=True),
+            queued_at = time.perf_counter()
+            async with self.scheduler.slot(
+                cost=_call_cost(request_model), width=_call_width(request_model)
+            ):
+                current_span().set_attribute(
+                    "mcp.queue.wait_seconds", time.perf_counter() - queued_at
                 )
-            ]
+                result = await handler(request_model)  # type: ignore[arg-type]
+            with tracer.span("mcp.serialize_result") as span:
+                text = result.model_dump_json(exclude_none=True)
+                span.set_attribute("mcp.result.size", len(text))
+            return [TextContent(type="text", text=text)], "ok"
+        except SchedulerFullError as exc:
+            logger.warning("Rejected tool call %s: %s", name, exc)
+            return [TextContent(type="text", text=json.dumps({"error": str(exc)}))], "rejected"
         except Exception as exc:
             logger.error("Error executing tool %s: %s", name, exc, exc_info=settings.debug)
             return [
@@ -111,8 +268,103 @@ class RootMCPServerCore:  # noqa: D101
                     type="text",
                     text=json.dumps({"error": f"Error calling tool {name}: {exc}"}),
                 )
+            ], "error"
+
+    def _register_metrics(self) -> None:
+        """Declare the tool metrics and expose cache and scheduler state to scrapes."""
+        self._tool_calls = self.metrics.counter(
+            "scorable_tool_calls_total", "MCP tool calls by tool and outcome", ("tool", "outcome")
+        )
+        self._tool_duration = self.metrics.histogram(
+            "scorable_tool_call_duration_seconds",
+            "Time spent serving MCP tool calls, queueing included",
+            ("tool",),
+        )
+        self._tool_in_flight = self.metrics.gauge(
+            "scorable_tool_calls_in_flight", "MCP tool calls being served", ("tool",)
+        )
+        for name in self._function_map:
+            self._tool_duration.declare(name)
+            self._tool_in_flight.declare(name)
+
+        def _result_cache(key: str) -> Callable[[], Samples]:
+            def _collect() -> Samples:
+                if self.result_cache is not None:
+                    yield (), self.result_cache.stats()[key]
+
+            return _collect
+
+        def _scheduler(key: str) -> Callable[[], Samples]:
+            return lambda: [((), self.scheduler.stats()[key])]
+
+        def _coalescing(key: str) -> Callable[[], Samples]:
+            return lambda: [
+                (("evaluations",), self.evaluator_service.stats()[key]),
+                (("judges",), self.judge_service.stats()[key]),
             ]
 
+        self.metrics.counter(
+            "scorable_result_cache_hits_total",
+            "Evaluations served from the result cache",
+            callback=_result_cache("hits"),
+        )
+        self.metrics.counter(
+            "scorable_result_cache_misses_total",
+            "Result cache lookups that found nothing fresh",
+            callback=_result_cache("misses"),
+        )
+        self.metrics.gauge(
+            "scorable_result_cache_hit_ratio",
+            "Share of result cache lookups served from the cache",
+            callback=_result_cache("hit_ratio"),
+        )
+        self.metrics.gauge(
+            "scorable_scheduler_running",
+            "Scheduler slots held by running tool calls",
+            callback=_scheduler("running"),
+        )
+        self.metrics.gauge(
+            "scorable_scheduler_queued",
+            "Tool calls waiting for a scheduler slot",
+            callback=_scheduler("queued"),
+        )
+        self.metrics.gauge(
+            "scorable_upstream_calls_in_flight",
+            "Distinct upstream calls in flight, after coalescing identical requests",
+            ("service",),
+            callback=_coalescing("inflight"),
+        )
+        self.metrics.counter(
+            "scorable_coalesced_calls_total",
+            "Calls that shared an identical request already in flight",
+            ("service",),
+            callback=_coalescing("coalesced"),
+        )
+
+    def _session_key(self) -> str:
+        """Identify the MCP session of the request being served."""
+        try:
+            return f"session-{id(self.app.request_context.session):x}"
+        except LookupError:
+            return DEFAULT_SESSION
+
+    def _progress_reporter(self) -> ProgressReporter | None:
+        """Send progress to the client when the request being served carries a progress token."""
+        try:
+            ctx = self.app.request_context
+        except LookupError:
+            return None
+        token = ctx.meta.progressToken if ctx.meta is not None else None
+        if token is None:
+            return None
+
+        async def _report(progress: float, total: float | None, message: str | None) -> None:
+            await ctx.session.send_progress_notification(
+                token, progress, total, message, related_request_id=str(ctx.request_id)
+            )
+
+        return _report
+
     # ------------------------------------------------------------------
     # Handlers (internal)
     # ------------------------------------------------------------------
@@ -121,7 +373,7 @@ class RootMCPServerCore:  # noqa: D101
         self, params: ListEvaluatorsRequest
     ) -> EvaluatorsListResponse:
         logger.debug("Handling list_evaluators request")
-        return await self.evaluator_service.list_evaluators()
+        return await self.evaluator_service.list_evaluators(limit=params.limit)
 
     async def _handle_run_evaluation(self, params: EvaluationRequest) -> EvaluationResponse:
         logger.debug("Handling run_evaluation for evaluator %s", params.evaluator_id)
@@ -133,6 +385,21 @@ class RootMCPServerCore:  # noqa: D101
         logger.debug("Handling run_evaluation_by_name for evaluator %s", params.evaluator_name)
         return await self.evaluator_service.run_evaluation_by_name(params)
 
+    async def _handle_run_evaluation_batch(
+        self, params: EvaluationBatchRequest
+    ) -> EvaluationBatchResponse:
+        logger.debug("Handling run_evaluation_batch with %d items", len(params.items))
+        return await self.evaluator_service.run_evaluation_batch(params)
+
+    async def _handle_run_evaluations(
+        self, params: MultiEvaluationRequest
+    ) -> MultiEvaluationResponse:
+        logger.debug(
+            "Handling run_evaluations for %d evaluators",
+            len(params.evaluator_ids) + len(params.evaluator_names),
+        )
+        return await self.evaluator_service.run_evaluations(params)
+
     async def _handle_coding_style_evaluation(
         self, params: CodingPolicyAdherenceEvaluationRequest
     ) -> EvaluationResponse:
@@ -147,10 +414,10 @@ class RootMCPServerCore:  # noqa: D101
 
         return await self.evaluator_service.run_evaluation(rag_request)
 
-    async def _handle_list_judges(self, _params: ListJudgesRequest) -> JudgesListResponse:
+    async def _handle_list_judges(self, params: ListJudgesRequest) -> JudgesListResponse:
         """Handle list_judges tool call."""
         logger.debug("Handling list_judges request")
-        return await self.judge_service.list_judges()
+        return await self.judge_service.list_judges(limit=params.limit)
 
     async def _handle_run_judge(self, params: RunJudgeRequest) -> RunJudgeResponse:
         """Handle run_judge tool call."""
@@ -3,81 +3,253 @@
 This module handles the integration with Scorable evaluators.
 """
 
+import asyncio
+import json
 import logging
+import time
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 
+from pydantic import TypeAdapter, ValidationError
+
+from scorable_mcp.catalog import CatalogCache, CatalogIndex
+from scorable_mcp.logpreview import Preview
+from scorable_mcp.persistent_cache import SQLiteCacheStore
+from scorable_mcp.result_cache import ResultCache, evaluation_cache_key
 from scorable_mcp.root_api_client import (
     ResponseValidationError,
     ScorableAPIError,
+    ScorableConnection,
     ScorableEvaluatorRepository,
+    build_evaluation_payload,
+    encode_payload,
 )
 from scorable_mcp.schema import (
+    BaseEvaluationRequest,
+    BatchEvaluationItem,
+    BatchEvaluationResult,
+    EvaluationBatchRequest,
+    EvaluationBatchResponse,
     EvaluationRequest,
     EvaluationRequestByName,
     EvaluationResponse,
     EvaluatorInfo,
+    EvaluatorOutcome,
     EvaluatorsListResponse,
+    MultiEvaluationRequest,
+    MultiEvaluationResponse,
 )
 from scorable_mcp.settings import settings
+from scorable_mcp.singleflight import SingleFlight, request_key
+from scorable_mcp.tracing import tracer
 
 logger = logging.getLogger("scorable_mcp.evaluator")
 
+_EVALUATOR_LIST = TypeAdapter(list[EvaluatorInfo])
+
+
+def _target_key(kind: str, target: str, request: BaseEvaluationRequest) -> str:
+    """Coalescing key of one fan-out target, equal to that of the single-evaluation tool.
+
+    ``run_evaluation`` and ``run_evaluation_by_name`` key their requests including the
+    evaluator reference, so the key is taken from the same request model.
+    """
+    fields = {name: getattr(request, name) for name in BaseEvaluationRequest.model_fields}
+    if kind == "evaluator":
+        return request_key(kind, target, EvaluationRequest(evaluator_id=target, **fields))
+    return request_key(kind, target, EvaluationRequestByName(evaluator_name=target, **fields))
+
 
 class EvaluatorService:
     """Service for interacting with Scorable evaluators."""
 
-    def __init__(self) -> None:
-        """Initialize the evaluator service."""
+    def __init__(
+        self,
+        connection: ScorableConnection | None = None,
+        result_cache: ResultCache | None = None,
+        store: SQLiteCacheStore | None = None,
+    ) -> None:
+        """Initialize the evaluator service.
+
+        Args:
+            connection: Optional connection pool shared with other services
+            result_cache: Optional cache for evaluation results
+            store: Optional persistent store for evaluator catalog snapshots
+        """
         self.async_client = ScorableEvaluatorRepository(
             api_key=settings.scorable_api_key.get_secret_value(),
             base_url=settings.scorable_api_url,
+            connection=connection,
+        )
+        self.catalog_cache: CatalogCache[CatalogIndex[EvaluatorInfo]] = CatalogCache(
+            "evaluators",
+            ttl=settings.catalog_cache_ttl,
+            stale_ttl=settings.catalog_cache_stale_ttl,
+        )
+        self.result_cache = result_cache
+        self.store = store
+        self._unknown_evaluator_names: dict[str, float] = {}
+        self._inflight: SingleFlight[str, EvaluationResponse] = SingleFlight(
+            "evaluation", enabled=settings.coalesce_inflight_requests
         )
 
-    async def fetch_evaluators(self, max_count: int | None = None) -> list[EvaluatorInfo]:
-        """Fetch available evaluators from the API.
+    async def warm(self) -> int:
+        """Seed the evaluator catalog cache from persisted snapshots.
+
+        Returns:
+            int: Number of catalog snapshots restored.
+        """
+        if self.store is None:
+            return 0
+
+        restored = 0
+        now = time.time()
+        for snapshot in await self.store.load_catalogs("evaluators"):
+            try:
+                evaluators = _EVALUATOR_LIST.validate_json(snapshot.value)
+            except ValidationError as e:
+                logger.debug(f"Skipping unreadable evaluator catalog snapshot: {e}")
+                continue
+            if self.catalog_cache.seed(
+                json.loads(snapshot.key), CatalogIndex(evaluators), now - snapshot.fetched_at
+            ):
+                restored += 1
+
+        logger.info(f"Restored {restored} evaluator catalog snapshots from the persistent cache")
+        return restored
+
+    def stats(self) -> dict[str, int]:
+        """Return counters of calls shared between concurrent identical requests."""
+        return {
+            "inflight": len(self._inflight),
+            "coalesced": self._inflight.coalesced,
+            "catalog_coalesced": self.catalog_cache.coalesced,
+        }
+
+    async def aclose(self) -> None:
+        """Release HTTP resources held by the underlying API client."""
+        await self.catalog_cache.aclose()
+        await self.async_client.aclose()
+
+    async def get_evaluator_index(
+        self, max_count: int | None = None
+    ) -> CatalogIndex[EvaluatorInfo]:
+        """Return the indexed evaluator catalog, served from the catalog cache when fresh.
 
         Args:
             max_count: Maximum number of evaluators to fetch
 
         Returns:
-            List[EvaluatorInfo]: List of evaluator information.
+            CatalogIndex[EvaluatorInfo]: Indexed snapshot of the evaluator catalog.
 
         Raises:
             RuntimeError: If evaluators cannot be retrieved from the API.
         """
-        logger.info(
-            f"Fetching evaluators from Scorable API (max: {max_count or settings.max_evaluators})"
-        )
-
         try:
-            evaluators_data = await self.async_client.list_evaluators(max_count)
+            return await self.catalog_cache.get(
+                max_count, lambda: self._load_evaluator_index(max_count)
+            )
+        except Exception as e:
+            raise self._catalog_error(e) from e
 
-            total = len(evaluators_data)
-            logger.info(f"Retrieved {total} evaluators from Scorable API")
+    async def iter_evaluators(self, max_count: int | None = None) -> AsyncGenerator[EvaluatorInfo]:
+        """Yield the available evaluators, page by page unless the catalog is cached.
 
-            return evaluators_data
+        A fresh cached catalog is replayed without calling the API. Otherwise the
+        evaluators are yielded as their pages arrive and are not kept, so memory use
+        stays flat however large the catalog is.
 
-        except ScorableAPIError as e:
+        Args:
+            max_count: Maximum number of evaluators to fetch
+
+        Yields:
+            EvaluatorInfo: Evaluators in catalog order.
+
+        Raises:
+            RuntimeError: If evaluators cannot be retrieved from the API.
+        """
+        cached = self.catalog_cache.peek(max_count)
+        if cached is not None:
+            for item in cached.items:
+                yield item
+            return
+
+        try:
+            async with aclosing(self.async_client.iter_evaluators(max_count)) as items:
+                async for item in items:
+                    yield item
+        except Exception as e:
+            raise self._catalog_error(e) from e
+
+    @staticmethod
+    def _catalog_error(e: Exception) -> RuntimeError:
+        """Log a failed catalog fetch and turn it into the error reported to callers."""
+        if isinstance(e, ScorableAPIError):
             logger.error(f"Failed to fetch evaluators from API: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Cannot fetch evaluators: {str(e)}") from e
-        except ResponseValidationError as e:
+            return RuntimeError(f"Cannot fetch evaluators: {str(e)}")
+        if isinstance(e, ResponseValidationError):
             logger.error(f"Response validation error: {e}", exc_info=settings.debug)
             if e.response_data:
-                logger.debug(f"Response data: {e.response_data}")
-            raise RuntimeError(f"Invalid evaluators response: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error fetching evaluators: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Cannot fetch evaluators: {str(e)}") from e
+                logger.debug("Response data: %s", Preview(e.response_data))
+            return RuntimeError(f"Invalid evaluators response: {str(e)}")
+        logger.error(f"Unexpected error fetching evaluators: {e}", exc_info=settings.debug)
+        return RuntimeError(f"Cannot fetch evaluators: {str(e)}")
 
-    async def list_evaluators(self, max_count: int | None = None) -> EvaluatorsListResponse:
+    async def _load_evaluator_index(self, max_count: int | None) -> CatalogIndex[EvaluatorInfo]:
+        logger.info(
+            f"Fetching evaluators from Scorable API (max: {max_count or settings.max_evaluators})"
+        )
+
+        evaluators_data = await self.async_client.list_evaluators(max_count)
+        logger.info(f"Retrieved {len(evaluators_data)} evaluators from Scorable API")
+
+        if self.store is not None:
+            self.store.put_catalog(
+                "evaluators",
+                json.dumps(max_count),
+                _EVALUATOR_LIST.dump_json(evaluators_data).decode(),
+                time.time(),
+            )
+        return CatalogIndex(evaluators_data)
+
+    async def fetch_evaluators(self, max_count: int | None = None) -> list[EvaluatorInfo]:
+        """Fetch available evaluators from the API.
+
+        Args:
+            max_count: Maximum number of evaluators to fetch
+
+        Returns:
+            List[EvaluatorInfo]: List of evaluator information.
+
+        Raises:
+            RuntimeError: If evaluators cannot be retrieved from the API.
+        """
+        index = await self.get_evaluator_index(max_count)
+
+        return list(index.items)
+
+    async def list_evaluators(
+        self, max_count: int | None = None, limit: int | None = None
+    ) -> EvaluatorsListResponse:
         """List all available evaluators.
 
         Args:
             max_count: Maximum number of evaluators to fetch
+            limit: Return only the first *limit* evaluators, answering as soon as
+                the pages holding them have arrived
 
         Returns:
             EvaluatorsListResponse: A response containing all available evaluators.
         """
-        evaluators = await self.fetch_evaluators(max_count)
+        if limit is None:
+            evaluators = await self.fetch_evaluators(max_count)
+        else:
+            evaluators = []
+            async with aclosing(self.iter_evaluators(max_count)) as stream:
+                async for evaluator in stream:
+                    evaluators.append(evaluator)
+                    if len(evaluators) >= limit:
+                        break
 
         return EvaluatorsListResponse(evaluators=evaluators)
 
@@ -90,13 +262,65 @@ class EvaluatorService:
         Returns:
             Optional[EvaluatorInfo]: The evaluator details or None if not found.
         """
-        evaluators = await self.fetch_evaluators()
+        index = await self.get_evaluator_index()
 
-        for evaluator in evaluators:
-            if evaluator.id == evaluator_id:
-                return evaluator
+        return index.get(evaluator_id)
+
+    async def get_evaluator_by_name(self, evaluator_name: str) -> EvaluatorInfo | None:
+        """Get evaluator details by name.
+
+        Exact names win; otherwise the lookup ignores case and repeated whitespace.
+
+        Args:
+            evaluator_name: The name of the evaluator to retrieve.
+
+        Returns:
+            Optional[EvaluatorInfo]: The evaluator details or None if not found.
+        """
+        index = await self.get_evaluator_index()
+
+        return index.get_by_name(evaluator_name)
+
+    async def resolve_evaluator_name(self, evaluator_name: str) -> str | None:
+        """Resolve an evaluator name to its ID using the cached catalog.
+
+        Names that are not in the catalog are remembered for
+        ``settings.evaluator_name_negative_ttl`` seconds so repeated misses skip the
+        catalog entirely.
+
+        Args:
+            evaluator_name: The name of the evaluator to resolve.
+
+        Returns:
+            Optional[str]: The evaluator ID, or None if the name is unknown or the
+            catalog is unavailable.
+        """
+        now = time.monotonic()
+        expires_at = self._unknown_evaluator_names.get(evaluator_name)
+        if expires_at is not None:
+            if expires_at > now:
+                return None
+            del self._unknown_evaluator_names[evaluator_name]
+
+        try:
+            index = await self.get_evaluator_index()
+        except RuntimeError as e:
+            logger.warning(f"Cannot resolve evaluator name locally: {e}")
+            return None
+
+        evaluator_id = index.id_for_name(evaluator_name)
+        if evaluator_id is None:
+            logger.debug(f"Evaluator name '{evaluator_name}' not found in cached catalog")
+            self._unknown_evaluator_names = {
+                name: expiry
+                for name, expiry in self._unknown_evaluator_names.items()
+                if expiry > now
+            }
+            self._unknown_evaluator_names[evaluator_name] = (
+                now + settings.evaluator_name_negative_ttl
+            )
 
-        return None
+        return evaluator_id
 
     async def run_evaluation(self, request: EvaluationRequest) -> EvaluationResponse:
         """Run a standard evaluation asynchronously.
@@ -110,46 +334,220 @@ class EvaluatorService:
         Returns:
             EvaluationResponse: The evaluation results.
         """
-        try:
-            result = await self.async_client.run_evaluator(
-                evaluator_id=request.evaluator_id,
-                request=request.request,
-                response=request.response,
-                contexts=request.contexts,
-                expected_output=request.expected_output,
-                tags=request.tags,
-                user_id=request.user_id,
-                session_id=request.session_id,
-                system_prompt=request.system_prompt,
-                turns=request.turns,
-            )
+        with tracer.span("evaluator.run") as span:
+            span.set_attribute("scorable.evaluator.id", request.evaluator_id)
+            cache_key = None
+            if self.result_cache is not None:
+                cache_key = evaluation_cache_key("evaluator", request.evaluator_id, request)
+                cached = self.result_cache.get(cache_key, EvaluationResponse)
+                if cached is not None:
+                    logger.debug(f"Serving evaluation {request.evaluator_id} from result cache")
+                    span.set_attribute("scorable.cache_hit", True)
+                    return cached
+
+            async def _run() -> EvaluationResponse:
+                result = await self.async_client.run_evaluator(
+                    evaluator_id=request.evaluator_id,
+                    request=request.request,
+                    response=request.response,
+                    contexts=request.contexts,
+                    expected_output=request.expected_output,
+                    tags=request.tags,
+                    user_id=request.user_id,
+                    session_id=request.session_id,
+                    system_prompt=request.system_prompt,
+                    turns=request.turns,
+                )
+
+                if self.result_cache is not None and cache_key is not None:
+                    self.result_cache.set(cache_key, result)
+                return result
+
+            try:
+                return await self._inflight.do(
+                    request_key("evaluator", request.evaluator_id, request), _run
+                )
+            except ScorableAPIError as e:
+                logger.error(f"API error running evaluation: {e}", exc_info=settings.debug)
+                raise RuntimeError(f"Failed to run evaluation: {str(e)}") from e
+            except ResponseValidationError as e:
+                logger.error(f"Response validation error: {e}", exc_info=settings.debug)
+                if e.response_data:
+                    logger.debug("Response data: %s", Preview(e.response_data))
+                raise RuntimeError(f"Invalid evaluation response: {str(e)}") from e
+            except Exception as e:
+                logger.error(f"Error running evaluation: {e}", exc_info=settings.debug)
+                raise RuntimeError(f"Failed to run evaluation: {str(e)}") from e
+
+    async def run_evaluation_by_name(self, request: EvaluationRequestByName) -> EvaluationResponse:
+        """Run a standard evaluation using the evaluator's name instead of ID.
+
+        With ``settings.resolve_evaluator_names_locally`` the name is resolved against
+        the cached catalog and executed by ID; unknown names fall back to the
+        server-side by-name endpoint.
+
+        Args:
+            request: The evaluation request parameters.
+                    The evaluator_id field will be treated as the evaluator name.
 
+        Returns:
+            EvaluationResponse: The evaluation results.
+        """
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = evaluation_cache_key("evaluator_name", request.evaluator_name, request)
+            cached = self.result_cache.get(cache_key, EvaluationResponse)
+            if cached is not None:
+                logger.debug(f"Serving evaluation '{request.evaluator_name}' from result cache")
+                return cached
+
+        async def _run() -> EvaluationResponse:
+            result: EvaluationResponse | None = None
+            if settings.resolve_evaluator_names_locally:
+                evaluator_id = await self.resolve_evaluator_name(request.evaluator_name)
+                if evaluator_id is not None:
+                    try:
+                        result = await self.async_client.run_evaluator(
+                            evaluator_id=evaluator_id,
+                            request=request.request,
+                            response=request.response,
+                            contexts=request.contexts,
+                            expected_output=request.expected_output,
+                            tags=request.tags,
+                            user_id=request.user_id,
+                            session_id=request.session_id,
+                            system_prompt=request.system_prompt,
+                            turns=request.turns,
+                        )
+                    except ScorableAPIError as e:
+                        if e.status_code != 404:  # noqa: PLR2004
+                            raise
+                        logger.info(
+                            f"Evaluator '{request.evaluator_name}' ({evaluator_id}) is gone, "
+                            "falling back to lookup by name"
+                        )
+                        self.catalog_cache.invalidate()
+
+            if result is None:
+                result = await self.async_client.run_evaluator_by_name(
+                    evaluator_name=request.evaluator_name,
+                    request=request.request,
+                    response=request.response,
+                    contexts=request.contexts,
+                    expected_output=request.expected_output,
+                    tags=request.tags,
+                    user_id=request.user_id,
+                    session_id=request.session_id,
+                    system_prompt=request.system_prompt,
+                    turns=request.turns,
+                )
+
+            if self.result_cache is not None and cache_key is not None:
+                self.result_cache.set(cache_key, result)
             return result
+
+        try:
+            return await self._inflight.do(
+                request_key("evaluator_name", request.evaluator_name, request), _run
+            )
         except ScorableAPIError as e:
-            logger.error(f"API error running evaluation: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Failed to run evaluation: {str(e)}") from e
+            logger.error(f"API error running evaluation by name: {e}", exc_info=settings.debug)
+            raise RuntimeError(f"Failed to run evaluation by name: {str(e)}") from e
         except ResponseValidationError as e:
             logger.error(f"Response validation error: {e}", exc_info=settings.debug)
             if e.response_data:
-                logger.debug(f"Response data: {e.response_data}")
+                logger.debug("Response data: %s", Preview(e.response_data))
             raise RuntimeError(f"Invalid evaluation response: {str(e)}") from e
         except Exception as e:
-            logger.error(f"Error running evaluation: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Failed to run evaluation: {str(e)}") from e
+            logger.error(f"Error running evaluation by name: {e}", exc_info=settings.debug)
+            raise RuntimeError(f"Failed to run evaluation by name: {str(e)}") from e
 
-    async def run_evaluation_by_name(self, request: EvaluationRequestByName) -> EvaluationResponse:
-        """Run a standard evaluation using the evaluator's name instead of ID.
+    async def run_evaluation_batch(
+        self, request: EvaluationBatchRequest
+    ) -> EvaluationBatchResponse:
+        """Run many evaluations with bounded concurrency.
+
+        Every item goes through :meth:`run_evaluation` or
+        :meth:`run_evaluation_by_name`, so it benefits from the result cache and
+        request coalescing. A failing item does not affect the others.
 
         Args:
-            request: The evaluation request parameters.
-                    The evaluator_id field will be treated as the evaluator name.
+            request: The batch of evaluation items.
 
         Returns:
-            EvaluationResponse: The evaluation results.
+            EvaluationBatchResponse: Per-item results and errors in input order.
+
+        Raises:
+            RuntimeError: If the batch exceeds ``settings.batch_max_items``.
         """
-        try:
-            result = await self.async_client.run_evaluator_by_name(
-                evaluator_name=request.evaluator_name,
+        if len(request.items) > settings.batch_max_items:
+            raise RuntimeError(
+                f"Batch of {len(request.items)} items exceeds the limit of "
+                f"{settings.batch_max_items}"
+            )
+
+        logger.info(f"Running batch of {len(request.items)} evaluations")
+        semaphore = asyncio.Semaphore(max(settings.batch_max_concurrency, 1))
+
+        async def _run_item(index: int, item: BatchEvaluationItem) -> BatchEvaluationResult:
+            async with semaphore:
+                try:
+                    result = await self._run_batch_item(item)
+                except RuntimeError as e:
+                    return BatchEvaluationResult(index=index, result=None, error=str(e))
+            return BatchEvaluationResult(index=index, result=result, error=None)
+
+        results = await asyncio.gather(
+            *(_run_item(index, item) for index, item in enumerate(request.items))
+        )
+        failed = sum(1 for r in results if r.error is not None)
+        logger.info(f"Batch finished: {len(results) - failed} succeeded, {failed} failed")
+
+        return EvaluationBatchResponse(
+            results=list(results), succeeded=len(results) - failed, failed=failed
+        )
+
+    async def _run_batch_item(self, item: BatchEvaluationItem) -> EvaluationResponse:
+        fields = {name: getattr(item, name) for name in BaseEvaluationRequest.model_fields}
+        if item.evaluator_id is not None:
+            return await self.run_evaluation(
+                EvaluationRequest(evaluator_id=item.evaluator_id, **fields)
+            )
+        assert item.evaluator_name is not None
+        return await self.run_evaluation_by_name(
+            EvaluationRequestByName(evaluator_name=item.evaluator_name, **fields)
+        )
+
+    async def run_evaluations(self, request: MultiEvaluationRequest) -> MultiEvaluationResponse:
+        """Run several evaluators on the same interaction concurrently.
+
+        The evaluation payload is built and serialized once and then sent to every
+        evaluator. Results are looked up in and stored to the result cache per
+        evaluator, identical evaluations already in flight are joined like in
+        :meth:`run_evaluation`, and a failing evaluator does not affect the others.
+
+        Args:
+            request: The interaction plus the evaluator IDs and names to run.
+
+        Returns:
+            MultiEvaluationResponse: Per-evaluator outcomes (IDs first, then names), the
+            total cost of the evaluations executed upstream and the wall time.
+
+        Raises:
+            RuntimeError: If more evaluators than ``settings.batch_max_items`` are requested.
+        """
+        targets = [("evaluator", evaluator_id) for evaluator_id in request.evaluator_ids]
+        targets += [("evaluator_name", name) for name in request.evaluator_names]
+        if len(targets) > settings.batch_max_items:
+            raise RuntimeError(
+                f"Request for {len(targets)} evaluators exceeds the limit of "
+                f"{settings.batch_max_items}"
+            )
+
+        logger.info(f"Running {len(targets)} evaluators on one interaction")
+        started = time.perf_counter()
+        body = encode_payload(
+            build_evaluation_payload(
                 request=request.request,
                 response=request.response,
                 contexts=request.contexts,
@@ -160,16 +558,63 @@ class EvaluatorService:
                 system_prompt=request.system_prompt,
                 turns=request.turns,
             )
+        )
+        semaphore = asyncio.Semaphore(max(settings.batch_max_concurrency, 1))
+
+        async def _run_one(kind: str, target: str) -> EvaluatorOutcome:
+            with tracer.span("evaluator.run") as span:
+                span.set_attribute(
+                    "scorable.evaluator.id" if kind == "evaluator" else "scorable.evaluator.name",
+                    target,
+                )
+                cache_key = None
+                if self.result_cache is not None:
+                    cache_key = evaluation_cache_key(kind, target, request)
+                    cached = self.result_cache.get(cache_key, EvaluationResponse)
+                    if cached is not None:
+                        span.set_attribute("scorable.cache_hit", True)
+                        return EvaluatorOutcome(evaluator=target, result=cached, error=None)
+
+                async def _run() -> EvaluationResponse:
+                    async with semaphore:
+                        result = await self._run_encoded(kind, target, body)
+                    if self.result_cache is not None and cache_key is not None:
+                        self.result_cache.set(cache_key, result)
+                    return result
+
+                try:
+                    result = await self._inflight.do(_target_key(kind, target, request), _run)
+                except Exception as e:
+                    span.set_status("error", str(e))
+                    logger.warning(f"Evaluator '{target}' failed: {e}", exc_info=settings.debug)
+                    return EvaluatorOutcome(evaluator=target, result=None, error=str(e))
+            return EvaluatorOutcome(evaluator=target, result=result, error=None)
+
+        outcomes = await asyncio.gather(*(_run_one(kind, target) for kind, target in targets))
+        total_cost = sum(
+            outcome.result.cost or 0
+            for outcome in outcomes
+            if outcome.result is not None and not outcome.result.cached
+        )
 
-            return result
-        except ScorableAPIError as e:
-            logger.error(f"API error running evaluation by name: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Failed to run evaluation by name: {str(e)}") from e
-        except ResponseValidationError as e:
-            logger.error(f"Response validation error: {e}", exc_info=settings.debug)
-            if e.response_data:
-                logger.debug(f"Response data: {e.response_data}")
-            raise RuntimeError(f"Invalid evaluation response: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Error running evaluation by name: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Failed to run evaluation by name: {str(e)}") from e
+        return MultiEvaluationResponse(
+            results=list(outcomes),
+            total_cost=float(total_cost),
+            wall_time=time.perf_counter() - started,
+        )
+
+    async def _run_encoded(self, kind: str, target: str, body: bytes) -> EvaluationResponse:
+        if kind == "evaluator":
+            return await self.async_client.run_evaluator_payload(target, body)
+
+        if settings.resolve_evaluator_names_locally:
+            evaluator_id = await self.resolve_evaluator_name(target)
+            if evaluator_id is not None:
+                try:
+                    return await self.async_client.run_evaluator_payload(evaluator_id, body)
+                except ScorableAPIError as e:
+                    if e.status_code != 404:  # noqa: PLR2004
+                        raise
+                    self.catalog_cache.invalidate()
+
+        return await self.async_client.run_evaluator_by_name_payload(target, body)
@@ -0,0 +1,116 @@
+"""Hedged requests for evaluator executions.
+
+A few slow upstream responses dominate the tail latency of evaluations. When
+the first attempt has not answered by the time most calls to the same
+evaluator have (an adaptive percentile of recent latencies), an identical
+second request is sent and whichever answers first wins; the other is
+cancelled. A budget caps hedges to a small fraction of the traffic, so hedging
+cannot double the load on an API that is slow for everybody.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from scorable_mcp.latency import LatencyTracker
+from scorable_mcp.retry import RetryBudget
+
+logger = logging.getLogger("scorable_mcp.hedging")
+
+
+class HedgePolicy:
+    """Decide when to hedge a call and run the hedged race."""
+
+    def __init__(
+        self,
+        tracker: LatencyTracker,
+        percentile: float,
+        min_delay: float,
+        budget: RetryBudget,
+    ):
+        """Initialize the policy.
+
+        Args:
+            tracker: Latency samples the hedge delay is derived from
+            percentile: Latency percentile (0-1) after which a hedge is sent
+            min_delay: Shortest delay in seconds before hedging
+            budget: Caps hedges to a fraction of recent calls
+        """
+        self.tracker = tracker
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget = budget
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def delay(self, key: str) -> float | None:
+        """Seconds to wait for the first attempt, or None while latencies are unknown."""
+        observed = self.tracker.percentile(key, self.percentile)
+        if observed is None:
+            return None
+        return max(observed, self.min_delay)
+
+    async def run[T](self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run *call*, racing a second attempt against it when it is slow.
+
+        Args:
+            key: Latency key of the call, e.g. the evaluator being executed
+            call: Coroutine factory performing one attempt
+
+        Returns:
+            The result of the first attempt to succeed
+
+        Raises:
+            Exception: The first attempt's error when every attempt failed
+        """
+        self.budget.record_request()
+        started = time.perf_counter()
+        delay = self.delay(key)
+        first = asyncio.ensure_future(call())
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait({first}, timeout=delay)
+                if not done and self.budget.try_acquire():
+                    return await self._race(key, started, first, call)
+            result = await first
+        except BaseException:
+            # asyncio.wait does not cancel the attempt when the caller is cancelled
+            if not first.done():
+                first.cancel()
+                await asyncio.gather(first, return_exceptions=True)
+            raise
+        self.tracker.record(key, time.perf_counter() - started)
+        return result
+
+    async def _race[T](
+        self,
+        key: str,
+        started: float,
+        first: asyncio.Future[T],
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        self.hedged += 1
+        logger.debug("Hedging slow call to %s", key)
+        second = asyncio.ensure_future(call())
+        pending: set[asyncio.Future[T]] = {first, second}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        if attempt is second:
+                            self.hedge_wins += 1
+                        self.tracker.record(key, time.perf_counter() - started)
+                        return attempt.result()
+            return first.result()  # both failed: report the original error
+        finally:
+            for attempt in (first, second):
+                attempt.cancel()
+            await asyncio.gather(first, second, return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        """Return how often calls were hedged and how often the hedge won."""
+        return {"hedged": self.hedged, "hedge_wins": self.hedge_wins}
@@ -3,86 +3,262 @@
 This module handles the integration with Scorable judges.
 """
 
+import asyncio
+import json
 import logging
+import time
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 
+from pydantic import TypeAdapter, ValidationError
+
+from scorable_mcp.catalog import CatalogCache, CatalogIndex
+from scorable_mcp.logpreview import Preview
+from scorable_mcp.persistent_cache import SQLiteCacheStore
+from scorable_mcp.progress import report_progress
+from scorable_mcp.result_cache import ResultCache, evaluation_cache_key
 from scorable_mcp.root_api_client import (
     ResponseValidationError,
     ScorableAPIError,
+    ScorableConnection,
+    ScorableEvaluatorRepository,
     ScorableJudgeRepository,
+    build_evaluation_payload,
+    encode_payload,
 )
 from scorable_mcp.schema import (
+    JudgeEvaluatorResult,
     JudgeInfo,
     JudgesListResponse,
     RunJudgeRequest,
     RunJudgeResponse,
 )
 from scorable_mcp.settings import settings
+from scorable_mcp.singleflight import SingleFlight, request_key
+from scorable_mcp.tracing import tracer
 
 logger = logging.getLogger("scorable_mcp.judge")
 
+_JUDGE_LIST = TypeAdapter(list[JudgeInfo])
+
 
 class JudgeService:
     """Service for interacting with Scorable judges."""
 
-    def __init__(self) -> None:
-        """Initialize the judge service."""
+    def __init__(
+        self,
+        connection: ScorableConnection | None = None,
+        result_cache: ResultCache | None = None,
+        store: SQLiteCacheStore | None = None,
+    ) -> None:
+        """Initialize the judge service.
+
+        Args:
+            connection: Optional connection pool shared with other services
+            result_cache: Optional cache for judge results
+            store: Optional persistent store for judge catalog snapshots
+        """
         self.async_client = ScorableJudgeRepository(
             api_key=settings.scorable_api_key.get_secret_value(),
             base_url=settings.scorable_api_url,
+            connection=connection,
+        )
+        # Used by the parallel execution mode to run a judge's evaluators directly.
+        self.evaluator_client = ScorableEvaluatorRepository(
+            api_key=settings.scorable_api_key.get_secret_value(),
+            base_url=settings.scorable_api_url,
+            connection=connection,
+        )
+        self.catalog_cache: CatalogCache[CatalogIndex[JudgeInfo]] = CatalogCache(
+            "judges",
+            ttl=settings.catalog_cache_ttl,
+            stale_ttl=settings.catalog_cache_stale_ttl,
+        )
+        self.result_cache = result_cache
+        self.store = store
+        self._inflight: SingleFlight[str, RunJudgeResponse] = SingleFlight(
+            "judge", enabled=settings.coalesce_inflight_requests
         )
 
-    async def fetch_judges(self, max_count: int | None = None) -> list[JudgeInfo]:
-        """Fetch available judges from the API.
+    async def warm(self) -> int:
+        """Seed the judge catalog cache from persisted snapshots.
+
+        Returns:
+            int: Number of catalog snapshots restored.
+        """
+        if self.store is None:
+            return 0
+
+        restored = 0
+        now = time.time()
+        for snapshot in await self.store.load_catalogs("judges"):
+            try:
+                judges = _JUDGE_LIST.validate_json(snapshot.value)
+            except ValidationError as e:
+                logger.debug(f"Skipping unreadable judge catalog snapshot: {e}")
+                continue
+            if self.catalog_cache.seed(
+                json.loads(snapshot.key), CatalogIndex(judges), now - snapshot.fetched_at
+            ):
+                restored += 1
+
+        logger.info(f"Restored {restored} judge catalog snapshots from the persistent cache")
+        return restored
+
+    def stats(self) -> dict[str, int]:
+        """Return counters of calls shared between concurrent identical requests."""
+        return {
+            "inflight": len(self._inflight),
+            "coalesced": self._inflight.coalesced,
+            "catalog_coalesced": self.catalog_cache.coalesced,
+        }
+
+    async def aclose(self) -> None:
+        """Release HTTP resources held by the underlying API client."""
+        await self.catalog_cache.aclose()
+        await self.async_client.aclose()
+        await self.evaluator_client.aclose()
+
+    async def get_judge_index(self, max_count: int | None = None) -> CatalogIndex[JudgeInfo]:
+        """Return the indexed judge catalog, served from the catalog cache when fresh.
 
         Args:
             max_count: Maximum number of judges to fetch
 
         Returns:
-            List[JudgeInfo]: List of judge information.
+            CatalogIndex[JudgeInfo]: Indexed snapshot of the judge catalog.
 
         Raises:
             RuntimeError: If judges cannot be retrieved from the API.
         """
-        logger.info(f"Fetching judges from Scorable API (max: {max_count or settings.max_judges})")
-
         try:
-            judges_data = await self.async_client.list_judges(max_count)
+            return await self.catalog_cache.get(
+                max_count, lambda: self._load_judge_index(max_count)
+            )
+        except Exception as e:
+            raise self._catalog_error(e) from e
 
-            total = len(judges_data)
-            logger.info(f"Retrieved {total} judges from Scorable API")
+    async def iter_judges(self, max_count: int | None = None) -> AsyncGenerator[JudgeInfo]:
+        """Yield the available judges, page by page unless the catalog is cached.
 
-            return judges_data
+        A fresh cached catalog is replayed without calling the API. Otherwise the
+        judges are yielded as their pages arrive and are not kept, so memory use
+        stays flat however large the catalog is.
 
-        except ScorableAPIError as e:
+        Args:
+            max_count: Maximum number of judges to fetch
+
+        Yields:
+            JudgeInfo: Judges in catalog order.
+
+        Raises:
+            RuntimeError: If judges cannot be retrieved from the API.
+        """
+        cached = self.catalog_cache.peek(max_count)
+        if cached is not None:
+            for item in cached.items:
+                yield item
+            return
+
+        try:
+            async with aclosing(self.async_client.iter_judges(max_count)) as items:
+                async for item in items:
+                    yield item
+        except Exception as e:
+            raise self._catalog_error(e) from e
+
+    @staticmethod
+    def _catalog_error(e: Exception) -> RuntimeError:
+        """Log a failed catalog fetch and turn it into the error reported to callers."""
+        if isinstance(e, ScorableAPIError):
             logger.error(f"Failed to fetch judges from API: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Cannot fetch judges: {str(e)}") from e
-        except ResponseValidationError as e:
+            return RuntimeError(f"Cannot fetch judges: {str(e)}")
+        if isinstance(e, ResponseValidationError):
             logger.error(f"Response validation error: {e}", exc_info=settings.debug)
             if e.response_data:
-                logger.debug(f"Response data: {e.response_data}")
-            raise RuntimeError(f"Invalid judges response: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error fetching judges: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Cannot fetch judges: {str(e)}") from e
+                logger.debug("Response data: %s", Preview(e.response_data))
+            return RuntimeError(f"Invalid judges response: {str(e)}")
+        logger.error(f"Unexpected error fetching judges: {e}", exc_info=settings.debug)
+        return RuntimeError(f"Cannot fetch judges: {str(e)}")
 
-    async def list_judges(self, max_count: int | None = None) -> JudgesListResponse:
+    async def _load_judge_index(self, max_count: int | None) -> CatalogIndex[JudgeInfo]:
+        logger.info(f"Fetching judges from Scorable API (max: {max_count or settings.max_judges})")
+
+        judges_data = await self.async_client.list_judges(max_count)
+        logger.info(f"Retrieved {len(judges_data)} judges from Scorable API")
+
+        if self.store is not None:
+            self.store.put_catalog(
+                "judges",
+                json.dumps(max_count),
+                _JUDGE_LIST.dump_json(judges_data).decode(),
+                time.time(),
+            )
+        return CatalogIndex(judges_data)
+
+    async def fetch_judges(self, max_count: int | None = None) -> list[JudgeInfo]:
+        """Fetch available judges from the API.
+
+        Args:
+            max_count: Maximum number of judges to fetch
+
+        Returns:
+            List[JudgeInfo]: List of judge information.
+
+        Raises:
+            RuntimeError: If judges cannot be retrieved from the API.
+        """
+        index = await self.get_judge_index(max_count)
+
+        return list(index.items)
+
+    async def list_judges(
+        self, max_count: int | None = None, limit: int | None = None
+    ) -> JudgesListResponse:
         """List all available judges.
 
         Args:
             max_count: Maximum number of judges to fetch
+            limit: Return only the first *limit* judges, answering as soon as the
+                pages holding them have arrived
 
         Returns:
             JudgesListResponse: A response containing all available judges.
         """
-        judges = await self.fetch_judges(max_count)
+        if limit is None:
+            judges = await self.fetch_judges(max_count)
+        else:
+            judges = []
+            async with aclosing(self.iter_judges(max_count)) as stream:
+                async for judge in stream:
+                    judges.append(judge)
+                    if len(judges) >= limit:
+                        break
 
         return JudgesListResponse(
             judges=judges,
         )
 
+    async def get_judge_by_id(self, judge_id: str) -> JudgeInfo | None:
+        """Get judge details by ID.
+
+        Args:
+            judge_id: The ID of the judge to retrieve.
+
+        Returns:
+            Optional[JudgeInfo]: The judge details or None if not found.
+        """
+        index = await self.get_judge_index()
+
+        return index.get(judge_id)
+
     async def run_judge(self, request: RunJudgeRequest) -> RunJudgeResponse:
         """Run a judge by ID.
 
+        With ``settings.judge_execution_mode == "parallel"`` the judge's evaluators
+        are executed concurrently from here instead of by the judge endpoint, and
+        each finished evaluator is reported to the client as a progress notification.
+
         Args:
             request: The judge request containing request, response, and judge ID.
 
@@ -92,22 +268,170 @@ class JudgeService:
         Raises:
             RuntimeError: If the judge execution fails.
         """
-        logger.info(f"Running judge with ID {request.judge_id}")
+        with tracer.span("judge.run") as span:
+            span.set_attribute("scorable.judge.id", request.judge_id)
+            span.set_attribute("scorable.judge.execution_mode", settings.judge_execution_mode)
+            logger.info(f"Running judge with ID {request.judge_id}")
+
+            cache_key = None
+            if self.result_cache is not None:
+                cache_key = evaluation_cache_key("judge", request.judge_id, request)
+                cached = self.result_cache.get(cache_key, RunJudgeResponse)
+                if cached is not None:
+                    logger.info("Serving judge result from result cache")
+                    span.set_attribute("scorable.cache_hit", True)
+                    return cached
+
+            async def _run() -> RunJudgeResponse:
+                result = None
+                if settings.judge_execution_mode == "parallel":
+                    result = await self._run_judge_parallel(request)
+                if result is None:
+                    result = await self.async_client.run_judge(request)
+
+                logger.info("Judge execution completed")
+                if self.result_cache is not None and cache_key is not None:
+                    self.result_cache.set(cache_key, result)
+                return result
+
+            try:
+                return await self._inflight.do(
+                    request_key("judge", request.judge_id, request), _run
+                )
+
+            except ScorableAPIError as e:
+                logger.error(f"Failed to run judge: {e}", exc_info=settings.debug)
+                raise RuntimeError(f"Judge execution failed: {str(e)}") from e
+            except ResponseValidationError as e:
+                logger.error(f"Response validation error: {e}", exc_info=settings.debug)
+                if e.response_data:
+                    logger.debug("Response data: %s", Preview(e.response_data))
+                raise RuntimeError(f"Invalid judge response: {str(e)}") from e
+            except Exception as e:
+                logger.error(f"Unexpected error running judge: {e}", exc_info=settings.debug)
+                raise RuntimeError(f"Judge execution failed: {str(e)}") from e
+
+    async def stream_judge(self, request: RunJudgeRequest) -> AsyncGenerator[JudgeEvaluatorResult]:
+        """Run a judge's evaluators in parallel and yield each result as it finishes.
+
+        A failing evaluator yields a result without a score whose justification
+        carries the error. Judges missing from the catalog are run through the
+        judge endpoint instead and their results are yielded together.
+
+        Args:
+            request: The judge request containing request, response, and judge ID.
+
+        Close the iterator (e.g. with ``contextlib.aclosing``) when stopping early,
+        so evaluators that are still running are cancelled.
+
+        Each finished evaluator is also reported as a progress notification when the
+        client asked for progress; ``run_judge`` in parallel mode reports the same.
+
+        Yields:
+            JudgeEvaluatorResult: Evaluator results in completion order.
+
+        Raises:
+            RuntimeError: If the judge endpoint fallback fails.
+        """
+        evaluators = await self._judge_evaluators(request.judge_id)
+        if evaluators is None:
+            for result in (await self.run_judge(request)).evaluator_results:
+                yield result
+            return
+
+        async with aclosing(self._iter_judge_evaluators(request, evaluators)) as outcomes:
+            async for _, result, _ in outcomes:
+                yield result
+
+    async def _run_judge_parallel(self, request: RunJudgeRequest) -> RunJudgeResponse | None:
+        """Assemble a judge response from its evaluators run in parallel.
+
+        Returns None when the judge is not in the catalog, so the caller can fall
+        back to the judge endpoint. The first failing evaluator fails the judge.
+        """
+        evaluators = await self._judge_evaluators(request.judge_id)
+        if evaluators is None:
+            return None
 
+        logger.info(f"Running {len(evaluators)} judge evaluators in parallel")
+        results: list[JudgeEvaluatorResult | None] = [None] * len(evaluators)
+        async with aclosing(self._iter_judge_evaluators(request, evaluators)) as outcomes:
+            async for index, result, error in outcomes:
+                if error is not None:
+                    raise error
+                results[index] = result
+
+        return RunJudgeResponse(
+            evaluator_results=[r for r in results if r is not None], cached=None
+        )
+
+    async def _judge_evaluators(self, judge_id: str) -> list[JudgeInfo.NestedEvaluatorInfo] | None:
         try:
-            result = await self.async_client.run_judge(request)
+            judge = await self.get_judge_by_id(judge_id)
+        except RuntimeError as e:
+            logger.warning(f"Judge catalog unavailable, using the judge endpoint: {e}")
+            return None
 
-            logger.info("Judge execution completed")
-            return result
+        if judge is None or not judge.evaluators:
+            logger.info(f"Judge {judge_id} not in catalog, using the judge endpoint")
+            return None
+        return judge.evaluators
 
-        except ScorableAPIError as e:
-            logger.error(f"Failed to run judge: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Judge execution failed: {str(e)}") from e
-        except ResponseValidationError as e:
-            logger.error(f"Response validation error: {e}", exc_info=settings.debug)
-            if e.response_data:
-                logger.debug(f"Response data: {e.response_data}")
-            raise RuntimeError(f"Invalid judge response: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error running judge: {e}", exc_info=settings.debug)
-            raise RuntimeError(f"Judge execution failed: {str(e)}") from e
+    async def _iter_judge_evaluators(
+        self,
+        request: RunJudgeRequest,
+        evaluators: list[JudgeInfo.NestedEvaluatorInfo],
+    ) -> AsyncGenerator[tuple[int, JudgeEvaluatorResult, Exception | None]]:
+        body = encode_payload(
+            build_evaluation_payload(
+                request=request.request,
+                response=request.response,
+                contexts=request.contexts,
+                expected_output=request.expected_output,
+                tags=request.tags,
+                user_id=request.user_id,
+                session_id=request.session_id,
+                system_prompt=request.system_prompt,
+                turns=request.turns,
+            )
+        )
+        semaphore = asyncio.Semaphore(max(settings.judge_max_concurrency, 1))
+
+        async def _run_one(
+            index: int, evaluator: JudgeInfo.NestedEvaluatorInfo
+        ) -> tuple[int, JudgeEvaluatorResult, Exception | None]:
+            async with semaphore:
+                try:
+                    result = await self.evaluator_client.run_evaluator_payload(evaluator.id, body)
+                except (ScorableAPIError, ResponseValidationError) as e:
+                    logger.warning(f"Judge evaluator '{evaluator.name}' failed: {e}")
+                    failed = JudgeEvaluatorResult(
+                        evaluator_name=evaluator.name,
+                        score=None,
+                        justification=f"Evaluation failed: {e}",
+                        confidence=None,
+                    )
+                    return index, failed, e
+
+            return (
+                index,
+                JudgeEvaluatorResult(
+                    evaluator_name=result.evaluator_name,
+                    score=result.score,
+                    justification=result.justification,
+                    confidence=result.confidence,
+                ),
+                None,
+            )
+
+        tasks = [asyncio.create_task(_run_one(i, e)) for i, e in enumerate(evaluators)]
+        try:
+            for finished, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+                outcome = await next_done
+                await report_progress(finished, len(tasks), outcome[1].model_dump_json())
+                yield outcome
+        finally:
+            # Stop evaluators still running upstream once the caller stops listening
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
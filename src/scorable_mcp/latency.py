@@ -0,0 +1,153 @@
+"""Latency distributions of Scorable API calls.
+
+Recent latencies are kept per key (an endpoint, or an evaluator on the execute
+endpoint) in a bounded window, so percentiles follow the API as it speeds up or
+slows down, with memory that stays flat regardless of traffic. They drive the
+hedging delay of evaluator executions and the per-endpoint request timeouts.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+import httpx
+
+
+class LatencyTracker:
+    """Sliding-window latency samples with percentile queries per key."""
+
+    def __init__(self, window: int = 512, min_samples: int = 20):
+        """Initialize the tracker.
+
+        Args:
+            window: Most recent samples kept per key
+            min_samples: Samples needed before a percentile is reported
+        """
+        self.window = max(window, 1)
+        self.min_samples = max(min_samples, 1)
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add a latency sample for *key*."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def keys(self) -> list[str]:
+        """Keys that have samples."""
+        return list(self._samples)
+
+    def count(self, key: str) -> int:
+        """Number of samples currently kept for *key*."""
+        samples = self._samples.get(key)
+        return len(samples) if samples is not None else 0
+
+    def percentile(self, key: str, quantile: float) -> float | None:
+        """Return the *quantile* (0-1) latency of *key*, or None without enough samples."""
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = min(max(math.ceil(quantile * len(ordered)) - 1, 0), len(ordered) - 1)
+        return ordered[rank]
+
+
+class AdaptiveTimeouts:
+    """Per-endpoint request timeouts derived from observed latencies.
+
+    Once an endpoint has enough samples its timeout is a high percentile of its
+    latency times a safety factor, clamped between a floor and a ceiling, so
+    quick listing calls that hang are cut early while judges that are always
+    slow keep the time they need. Until then the static default applies.
+
+    A percentile is only trusted with about ``1 / (1 - quantile)`` samples,
+    so p99.9 is not just the slowest of a handful of calls. A request that
+    times out is recorded at its elapsed time, and the endpoint falls back to
+    the static default until successful responses fit within the adaptive
+    timeout again: a lasting rise in latency is learned instead of every
+    request being cut at the old cutoff.
+    """
+
+    def __init__(
+        self,
+        tracker: LatencyTracker,
+        default: float,
+        connect: float,
+        quantile: float = 0.999,
+        factor: float = 3.0,
+        floor: float = 1.0,
+        ceiling: float = 120.0,
+        enabled: bool = True,
+    ):
+        """Initialize the timeouts.
+
+        Args:
+            tracker: Latency samples per endpoint
+            default: Timeout in seconds while an endpoint has too few samples
+            connect: Longest time in seconds to wait for a connection
+            quantile: Latency percentile (0-1) the timeout is based on
+            factor: Multiplier applied to the percentile
+            floor: Shortest adaptive timeout in seconds
+            ceiling: Longest adaptive timeout in seconds
+            enabled: Whether to adapt at all, otherwise *default* always applies
+        """
+        self.tracker = tracker
+        self.default = default
+        self.connect = connect
+        self.quantile = quantile
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = max(ceiling, floor)
+        self.enabled = enabled
+        tail = 1.0 - quantile
+        needed = math.ceil(round(1.0 / tail, 6)) if tail > 0 else tracker.window
+        self.min_samples = max(tracker.min_samples, needed)
+        self._timed_out: set[str] = set()
+
+    def timeout(self, key: str) -> float:
+        """Return the total timeout in seconds for a request to *key*."""
+        if not self.enabled or key in self._timed_out:
+            return self.default
+        return self._adaptive(key)
+
+    def _adaptive(self, key: str) -> float:
+        if self.tracker.count(key) < self.min_samples:
+            return self.default
+        observed = self.tracker.percentile(key, self.quantile)
+        if observed is None:
+            return self.default
+        return min(max(observed * self.factor, self.floor), self.ceiling)
+
+    def for_request(self, key: str) -> httpx.Timeout:
+        """Return the httpx timeout for a request to *key*."""
+        total = self.timeout(key)
+        return httpx.Timeout(total, connect=min(self.connect, total))
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add the latency of a request to *key* that got an answer."""
+        if not self.enabled:
+            return
+        self.tracker.record(key, seconds)
+        if key in self._timed_out and seconds < self._adaptive(key):
+            self._timed_out.discard(key)
+
+    def record_timeout(self, key: str, elapsed: float) -> None:
+        """Add a request to *key* that timed out after *elapsed* seconds.
+
+        Its latency is at least *elapsed*, and the static default applies to the
+        endpoint until successful responses fit the adaptive timeout again.
+        """
+        if not self.enabled:
+            return
+        self.tracker.record(key, elapsed)
+        self._timed_out.add(key)
+
+    def snapshot(self) -> dict[str, float]:
+        """Return the current timeout of every endpoint that has adapted."""
+        return {
+            key: round(self.timeout(key), 3)
+            for key in self.tracker.keys()
+            if self.tracker.count(key) >= self.min_samples
+        }
@@ -0,0 +1,47 @@
+"""Deferred, truncated payload previews for log messages.
+
+Request and response bodies are logged at DEBUG level on every API call.
+Rendering them with f-strings builds the whole text even when DEBUG is off, so
+payload-heavy code paths pass a :class:`Preview` as a %-style argument instead:
+nothing is rendered unless a handler actually emits the record, and then only
+the first few hundred characters are kept.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+PREVIEW_CHARS = 300
+
+
+class Preview:
+    """Render *value* for a log message only when the message is emitted, truncated."""
+
+    __slots__ = ("limit", "value")
+
+    def __init__(self, value: Any, limit: int = PREVIEW_CHARS):
+        """Initialize the preview.
+
+        Args:
+            value: Payload to preview: bytes, text or any object with a useful ``str``
+            limit: Longest rendering in characters before it is cut
+        """
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        value = self.value
+        if isinstance(value, bytes | bytearray | memoryview):
+            size = len(value)
+            # Decode only what is shown; a cut multi-byte character becomes U+FFFD
+            text = bytes(value[: self.limit]).decode("utf-8", "replace")
+            unit = "bytes"
+        else:
+            text = value if isinstance(value, str) else str(value)
+            size = len(text)
+            unit = "chars"
+        if size <= self.limit:
+            return text
+        return f"{text[: self.limit]}... ({size} {unit})"
+
+    __repr__ = __str__
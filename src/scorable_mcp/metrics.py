@@ -0,0 +1,279 @@
+"""Prometheus metrics for the Scorable MCP server.
+
+Instruments are only updated from the event loop, and an update never awaits,
+so it cannot interleave with another task's: plain dicts and floats are enough,
+without locks or atomics on the hot path. Values that other components already
+keep (circuit states, rate limiter queues, cache counters) are read at scrape
+time through callbacks instead of being copied on every call.
+
+The registry renders the Prometheus text exposition format (version 0.0.4).
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from typing import Literal
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+type Labels = tuple[str, ...]
+type Samples = Iterable[tuple[Labels, float]]
+
+MetricKind = Literal["counter", "gauge", "histogram"]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:  # noqa: PLR2004
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    kind: MetricKind
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        callback: Callable[[], Samples] | None = None,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def _check(self, labels: Labels) -> None:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {len(labels)} values"
+            )
+
+    def render(self) -> list[str]:
+        """Return the exposition lines of this metric, header included."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._sample_lines())
+        return lines
+
+    def _sample_lines(self) -> list[str]:
+        raise NotImplementedError
+
+
+class _ValueMetric(_Metric):
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        callback: Callable[[], Samples] | None = None,
+    ):
+        super().__init__(name, help_text, labelnames, callback)
+        self._values: dict[Labels, float] = {}
+
+    def declare(self, *labels: str) -> None:
+        """Expose the series for *labels* at zero before anything is recorded."""
+        self._check(labels)
+        self._values.setdefault(labels, 0.0)
+
+    def value(self, *labels: str) -> float:
+        """Current value of the series for *labels*."""
+        return self._values.get(labels, 0.0)
+
+    def _sample_lines(self) -> list[str]:
+        samples = self.callback() if self.callback is not None else self._values.items()
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in samples
+        ]
+
+
+class Counter(_ValueMetric):
+    """Monotonically increasing count, e.g. of calls or errors."""
+
+    kind: MetricKind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add *amount* to the series for *labels*."""
+        values = self._values
+        if labels not in values:
+            self._check(labels)
+            values[labels] = 0.0
+        values[labels] += amount
+
+
+class Gauge(_ValueMetric):
+    """Value that goes up and down, e.g. calls in flight."""
+
+    kind: MetricKind = "gauge"
+
+    def set(self, value: float, *labels: str) -> None:
+        """Set the series for *labels* to *value*."""
+        if labels not in self._values:
+            self._check(labels)
+        self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Add *amount* to the series for *labels*."""
+        self.set(self._values.get(labels, 0.0) + amount, *labels)
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Subtract *amount* from the series for *labels*."""
+        self.set(self._values.get(labels, 0.0) - amount, *labels)
+
+
+class _HistogramSeries:
+    __slots__ = ("buckets", "count", "sum")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(_Metric):
+    """Distribution of observed values, e.g. latencies, in cumulative buckets."""
+
+    kind: MetricKind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.bounds = tuple(sorted(buckets))
+        self._series: dict[Labels, _HistogramSeries] = {}
+
+    def declare(self, *labels: str) -> None:
+        """Expose the series for *labels* empty before anything is observed."""
+        if labels not in self._series:
+            self._check(labels)
+            self._series[labels] = _HistogramSeries(len(self.bounds))
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record *value* in the series for *labels*."""
+        series = self._series.get(labels)
+        if series is None:
+            self.declare(*labels)
+            series = self._series[labels]
+        index = bisect_left(self.bounds, value)
+        if index < len(self.bounds):
+            series.buckets[index] += 1
+        series.count += 1
+        series.sum += value
+
+    def count(self, *labels: str) -> int:
+        """Number of values observed in the series for *labels*."""
+        series = self._series.get(labels)
+        return series.count if series is not None else 0
+
+    def _sample_lines(self) -> list[str]:
+        names = (*self.labelnames, "le")
+        lines = []
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, hits in zip(self.bounds, series.buckets, strict=True):
+                cumulative += hits
+                le = _format_labels(names, (*labels, _format_value(bound)))
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            le = _format_labels(names, (*labels, "+Inf"))
+            lines.append(f"{self.name}_bucket{le} {series.count}")
+            plain = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{plain} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{plain} {series.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics rendered together for a scrape.
+
+    Registering a name that already exists returns the existing metric, so
+    components sharing a registry can each declare the metrics they use.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        callback: Callable[[], Samples] | None = None,
+    ) -> Counter:
+        """Return the counter *name*, creating it if needed.
+
+        Args:
+            name: Metric name, ending in ``_total`` by convention
+            help_text: One-line description
+            labelnames: Names of the labels distinguishing its series
+            callback: Reads the series at scrape time instead of recording them
+        """
+        return self._register(Counter(name, help_text, labelnames, callback))
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        callback: Callable[[], Samples] | None = None,
+    ) -> Gauge:
+        """Return the gauge *name*, creating it if needed; see :meth:`counter`."""
+        return self._register(Gauge(name, help_text, labelnames, callback))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram *name*, creating it if needed.
+
+        Args:
+            name: Metric name, e.g. ending in ``_seconds``
+            help_text: One-line description
+            labelnames: Names of the labels distinguishing its series
+            buckets: Upper bounds of the buckets
+        """
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def _register[M: _Metric](self, metric: M) -> M:
+        existing = self._metrics.get(metric.name)
+        if existing is None:
+            self._metrics[metric.name] = metric
+            return metric
+        if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+            raise ValueError(f"Metric {metric.name} is already registered differently")
+        if metric.callback is not None:
+            existing.callback = metric.callback
+        return existing  # type: ignore[return-value]
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
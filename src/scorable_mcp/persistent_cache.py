@@ -0,0 +1,292 @@
+"""SQLite persistence for cached evaluation results and catalog snapshots.
+
+The in-memory caches are lost whenever the container restarts. This store keeps
+a copy on disk so a freshly started server can warm up from it instead of
+re-fetching catalogs and re-running evaluations against the Scorable API.
+
+All database access runs on a single worker thread. Writes are queued and
+flushed in batches by a background task, so cache updates never block the
+event loop on disk I/O.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger("scorable_mcp.persistent_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_updated_at ON results (updated_at);
+CREATE TABLE IF NOT EXISTS catalogs (
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (name, key)
+);
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class StoredResult:
+    """A persisted result row."""
+
+    key: str
+    model: str
+    value: str
+    expires_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class StoredCatalog:
+    """A persisted catalog snapshot."""
+
+    key: str
+    value: str
+    fetched_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _ResultWrite:
+    key: str
+    model: str
+    value: str
+    expires_at: float
+
+
+@dataclass(frozen=True, slots=True)
+class _CatalogWrite:
+    name: str
+    key: str
+    value: str
+    fetched_at: float
+
+
+class SQLiteCacheStore:
+    """Size-bounded SQLite store (WAL mode) with batched background writes.
+
+    Timestamps are wall-clock (``time.time()``) so they survive restarts.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int,
+        max_bytes: int,
+        flush_interval: float = 1.0,
+        batch_size: int = 200,
+    ):
+        """Initialize the store; call :meth:`open` before use.
+
+        Args:
+            path: SQLite database file
+            max_entries: Maximum number of persisted results
+            max_bytes: Approximate size budget for persisted results
+            flush_interval: Maximum seconds a queued write waits for its batch
+            batch_size: Maximum number of writes committed in one transaction
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scorable-cache")
+        self._db: sqlite3.Connection | None = None
+        self._queue: asyncio.Queue[_ResultWrite | _CatalogWrite | None] = asyncio.Queue()
+        self._writer: asyncio.Task[None] | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._db is not None
+
+    async def open(self) -> None:
+        """Open (and create if needed) the database and start the writer task."""
+        if self._db is not None:
+            return
+        await self._run(self._open_db)
+        self._writer = asyncio.create_task(self._write_loop())
+        logger.info("Opened persistent cache at %s", self.path)
+
+    async def aclose(self) -> None:
+        """Flush queued writes and close the database. The store cannot be reopened."""
+        if self._writer is not None:
+            self._queue.put_nowait(None)
+            await self._writer
+            self._writer = None
+        if self._db is not None:
+            await self._run(self._close_db)
+            logger.info("Closed persistent cache")
+        self._executor.shutdown(wait=True)
+
+    def put_result(self, key: str, model: str, value: str, expires_at: float) -> None:
+        """Queue a result for persistence; a no-op while the store is closed."""
+        if self._db is not None:
+            self._queue.put_nowait(_ResultWrite(key, model, value, expires_at))
+
+    def put_catalog(self, name: str, key: str, value: str, fetched_at: float) -> None:
+        """Queue a catalog snapshot for persistence; a no-op while the store is closed."""
+        if self._db is not None:
+            self._queue.put_nowait(_CatalogWrite(name, key, value, fetched_at))
+
+    async def load_results(self, limit: int) -> list[StoredResult]:
+        """Return up to *limit* unexpired results, oldest first."""
+        if self._db is None:
+            return []
+        return await self._run(self._select_results, limit)
+
+    async def load_catalogs(self, name: str) -> list[StoredCatalog]:
+        """Return every persisted snapshot of catalog *name*."""
+        if self._db is None:
+            return []
+        return await self._run(self._select_catalogs, name)
+
+    # ------------------------------------------------------------------
+    # Event loop side
+    # ------------------------------------------------------------------
+
+    async def _run[R](self, func: Callable[..., R], *args: object) -> R:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            item = await self._queue.get()
+            if item is None:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    next_item = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if next_item is None:
+                    closing = True
+                    break
+                batch.append(next_item)
+            try:
+                await self._run(self._write_batch, batch)
+            except sqlite3.Error as e:
+                logger.warning("Failed to persist %d cache entries: %s", len(batch), e)
+            except Exception:
+                # Keep the writer alive: the queue would otherwise grow without a consumer
+                logger.exception("Unexpected error persisting %d cache entries", len(batch))
+
+    # ------------------------------------------------------------------
+    # Worker thread side
+    # ------------------------------------------------------------------
+
+    def _open_db(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        try:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.executescript(_SCHEMA)
+        except sqlite3.Error:
+            db.close()
+            raise
+        self._db = db
+
+    def _close_db(self) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _write_batch(self, batch: list[_ResultWrite | _CatalogWrite]) -> None:
+        assert self._db is not None
+        now = time.time()
+        results = [
+            (w.key, w.model, w.value, w.expires_at, len(w.value), now)
+            for w in batch
+            if isinstance(w, _ResultWrite)
+        ]
+        catalogs = [
+            (w.name, w.key, w.value, w.fetched_at) for w in batch if isinstance(w, _CatalogWrite)
+        ]
+        with self._transaction() as db:
+            if results:
+                db.executemany(
+                    "INSERT OR REPLACE INTO results "
+                    "(key, model, value, expires_at, size, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    results,
+                )
+            if catalogs:
+                db.executemany(
+                    "INSERT OR REPLACE INTO catalogs (name, key, value, fetched_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    catalogs,
+                )
+            self._evict(db, now)
+
+    def _evict(self, db: sqlite3.Connection, now: float) -> None:
+        db.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+        count, total = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        excess_rows = max(count - self.max_entries, 0)
+        excess_bytes = max(total - self.max_bytes, 0)
+        doomed: list[tuple[str]] = []
+        freed = 0
+        for key, size in db.execute("SELECT key, size FROM results ORDER BY updated_at ASC"):
+            if len(doomed) >= excess_rows and freed >= excess_bytes:
+                break
+            doomed.append((key,))
+            freed += size
+        db.executemany("DELETE FROM results WHERE key = ?", doomed)
+        logger.debug("Evicted %d persisted results", len(doomed))
+
+    def _select_results(self, limit: int) -> list[StoredResult]:
+        assert self._db is not None
+        rows = self._db.execute(
+            "SELECT key, model, value, expires_at FROM results WHERE expires_at > ? "
+            "ORDER BY updated_at DESC LIMIT ?",
+            (time.time(), limit),
+        ).fetchall()
+        return [StoredResult(*row) for row in reversed(rows)]
+
+    def _select_catalogs(self, name: str) -> list[StoredCatalog]:
+        assert self._db is not None
+        rows = self._db.execute(
+            "SELECT key, value, fetched_at FROM catalogs WHERE name = ?", (name,)
+        ).fetchall()
+        return [StoredCatalog(*row) for row in rows]
+
+    def _transaction(self) -> _Transaction:
+        assert self._db is not None
+        return _Transaction(self._db)
+
+
+class _Transaction:
+    """Explicit BEGIN/COMMIT for a connection opened in autocommit mode."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.db.execute("BEGIN")
+        return self.db
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> None:
+        self.db.execute("COMMIT" if exc_type is None else "ROLLBACK")
@@ -0,0 +1,46 @@
+"""Progress notifications for long-running tool calls.
+
+A client asks for progress by sending a progress token with its tool call. The
+transport then installs a reporter for the call in a context variable, and
+services deep in the call stack report each step without knowing which session
+or request they serve. Without a token, reporting does nothing.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+logger = logging.getLogger("scorable_mcp.progress")
+
+type ProgressReporter = Callable[[float, float | None, str | None], Awaitable[None]]
+
+current_reporter: ContextVar[ProgressReporter | None] = ContextVar(
+    "scorable_mcp_progress", default=None
+)
+
+
+@contextmanager
+def progress_scope(reporter: ProgressReporter | None) -> Iterator[None]:
+    """Send the progress reported inside the block to *reporter*."""
+    token = current_reporter.set(reporter)
+    try:
+        yield
+    finally:
+        current_reporter.reset(token)
+
+
+async def report_progress(progress: float, total: float | None, message: str | None) -> None:
+    """Notify the client of the current tool call, if it asked for progress.
+
+    A failure to deliver the notification is logged; it never fails the call.
+    """
+    reporter = current_reporter.get()
+    if reporter is None:
+        return
+    try:
+        await reporter(progress, total, message)
+    except Exception as exc:
+        logger.debug("Cannot send progress notification: %s", exc)
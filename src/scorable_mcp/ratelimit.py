@@ -0,0 +1,295 @@
+"""Client-side rate limiting for the Scorable API.
+
+All sessions of a server share one API key, so bursts from a few agents can
+exhaust the key's upstream quota for everybody. A token bucket per endpoint
+class smooths the outgoing request rate. Waiting sessions take turns, and each
+session's own requests are served in arrival order, so one bursty agent cannot
+starve the others. The buckets also follow what the API tells us: a 429 or an
+exhausted ``RateLimit-Remaining`` header pauses the bucket until the quota
+resets, and a 429 halves the sending rate, which then recovers gradually.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, Literal
+
+from scorable_mcp.retry import parse_retry_after
+from scorable_mcp.session import current_session
+
+logger = logging.getLogger("scorable_mcp.ratelimit")
+
+BucketName = Literal["execute", "list"]
+
+# Reset values above this are Unix timestamps rather than delays in seconds.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Pause applied after a 429 that does not say when to come back.
+_DEFAULT_THROTTLE_PAUSE = 1.0
+
+# Tolerance for refills that land a hair below a whole token.
+_TOKEN_EPSILON = 1e-9
+
+
+def _header(headers: Mapping[str, str], name: str) -> str | None:
+    return headers.get(f"RateLimit-{name}") or headers.get(f"X-RateLimit-{name}")
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str], now: float | None = None
+) -> tuple[int | None, float | None]:
+    """Extract the remaining quota and seconds until it resets.
+
+    Both the ``RateLimit-*`` and the ``X-RateLimit-*`` spellings are accepted;
+    the reset may be given in seconds or as a Unix timestamp.
+
+    Returns:
+        ``(remaining, reset_after)``, each None when absent or malformed
+    """
+    remaining: int | None = None
+    reset_after: float | None = None
+    if (raw := _header(headers, "Remaining")) is not None:
+        try:
+            remaining = int(float(raw))
+        except ValueError:
+            pass
+    if (raw := _header(headers, "Reset")) is not None:
+        try:
+            reset = float(raw)
+        except ValueError:
+            reset = None
+        if reset is not None:
+            if reset > _EPOCH_THRESHOLD:
+                reset -= now if now is not None else time.time()
+            reset_after = max(reset, 0.0)
+    return remaining, reset_after
+
+
+class TokenBucket:
+    """Token bucket with per-session fair queuing that adapts to upstream throttling.
+
+    Waiters are queued per session and the sessions are served round-robin,
+    each in FIFO order. A ``rate`` of zero or less leaves requests unlimited;
+    the bucket then only enforces pauses requested by the API.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        burst: int,
+        min_rate_fraction: float = 0.1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            name: Endpoint class limited by the bucket, used in logs and stats
+            rate: Sustained requests per second (0 for unlimited)
+            burst: Requests that may be sent at once after an idle period
+            min_rate_fraction: Lowest fraction of *rate* the bucket adapts down to
+            clock: Monotonic time source, mainly for tests
+            sleep: Coroutine used to wait, mainly for tests
+        """
+        self.name = name
+        self.configured_rate = max(rate, 0.0)
+        self.rate = self.configured_rate
+        self.burst = max(burst, 1)
+        self.min_rate = self.configured_rate * min_rate_fraction
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._queues: dict[str, deque[asyncio.Future[None]]] = {}
+        self._dispatcher: asyncio.Task[None] | None = None
+        self.waiting = 0
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def limited(self) -> bool:
+        return self.configured_rate > 0
+
+    async def acquire(self, session: str | None = None) -> float:
+        """Wait for a token, taking turns with the other waiting sessions.
+
+        Args:
+            session: Session the request belongs to, defaults to the current one
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = self._clock()
+        if not self._queues and self._try_take(started):
+            self._record_wait(0.0)
+            return 0.0
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session or current_session.get(), deque()).append(waiter)
+        self.waiting += 1
+        if self._dispatcher is None:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._refund()
+            raise
+        finally:
+            self.waiting -= 1
+
+        waited = self._clock() - started
+        self._record_wait(waited)
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for *seconds*, e.g. until the upstream quota resets."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def on_throttled(self, retry_after: float | None) -> None:
+        """React to a 429: pause, drain the bucket and halve the sending rate."""
+        self.throttled += 1
+        self.pause(retry_after if retry_after is not None else _DEFAULT_THROTTLE_PAUSE)
+        if self.limited:
+            self._refill()
+            self._tokens = 0.0
+            self.rate = max(self.rate / 2, self.min_rate)
+            logger.warning(
+                "Scorable API throttled %s requests, slowing down to %.2f/s", self.name, self.rate
+            )
+
+    def on_success(self) -> None:
+        """Recover a reduced rate by a small step after each accepted request."""
+        if self.limited and self.rate < self.configured_rate:
+            self._refill()
+            self.rate = min(self.configured_rate, self.rate + self.configured_rate * 0.05)
+
+    def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Align the bucket with the quota reported by the API."""
+        remaining, reset_after = parse_rate_limit_headers(headers)
+        if remaining is None:
+            return
+        if self.limited:
+            self._refill()
+            self._tokens = min(self._tokens, float(remaining))
+        if remaining <= 0 and reset_after:
+            self.pause(reset_after)
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, wait times and the current rate."""
+        return {
+            "rate": round(self.rate, 3) if self.limited else None,
+            "queue_depth": self.waiting,
+            "sessions_waiting": len(self._queues),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "avg_wait": round(self.total_wait / self.acquired, 6) if self.acquired else 0.0,
+            "max_wait": round(self.max_wait, 6),
+            "paused_for": round(max(self._paused_until - self._clock(), 0.0), 3),
+        }
+
+    def _record_wait(self, waited: float) -> None:
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def _try_take(self, now: float) -> bool:
+        """Consume a token if one is available right now."""
+        if now < self._paused_until:
+            return False
+        if not self.limited:
+            return True
+        self._refill(now)
+        if self._tokens >= 1 - _TOKEN_EPSILON:
+            self._tokens = max(self._tokens - 1, 0.0)
+            return True
+        return False
+
+    def _refund(self) -> None:
+        """Return the token of a waiter that was cancelled after being granted it."""
+        if self.limited:
+            self._refill()
+            self._tokens = min(float(self.burst), self._tokens + 1)
+
+    def _next_waiter(self) -> asyncio.Future[None] | None:
+        """Pop the oldest live waiter of the next session in round-robin order."""
+        while self._queues:
+            session = next(iter(self._queues))
+            queue = self._queues.pop(session)
+            waiter = queue.popleft()
+            if queue:
+                self._queues[session] = queue  # re-inserting moves the session to the back
+            if not waiter.done():
+                return waiter
+        return None
+
+    async def _dispatch(self) -> None:
+        try:
+            while self._queues:
+                now = self._clock()
+                if not self._try_take(now):
+                    if now < self._paused_until:
+                        delay = self._paused_until - now
+                    else:
+                        delay = max((1 - self._tokens) / self.rate, _TOKEN_EPSILON)
+                    await self._sleep(delay)
+                    continue
+                waiter = self._next_waiter()
+                if waiter is None:
+                    self._refund()
+                else:
+                    waiter.set_result(None)
+        finally:
+            self._dispatcher = None
+
+    def _refill(self, now: float | None = None) -> None:
+        now = self._clock() if now is None else now
+        if self.limited:
+            elapsed = max(now - self._updated_at, 0.0)
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter:
+    """Separate token buckets for evaluation/judge executions and catalog listings."""
+
+    def __init__(
+        self,
+        execute_rate: float,
+        execute_burst: int,
+        list_rate: float,
+        list_burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        """Create the execute and list buckets."""
+        self.buckets: dict[BucketName, TokenBucket] = {
+            "execute": TokenBucket(
+                "execute", execute_rate, execute_burst, clock=clock, sleep=sleep
+            ),
+            "list": TokenBucket("list", list_rate, list_burst, clock=clock, sleep=sleep),
+        }
+
+    def bucket_for(self, method: str) -> TokenBucket:
+        """Executions are POSTs; everything else lists catalogs."""
+        return self.buckets["execute" if method.upper() == "POST" else "list"]
+
+    def observe(self, bucket: TokenBucket, status_code: int, headers: Mapping[str, str]) -> None:
+        """Feed the outcome of a request back into *bucket*."""
+        if status_code == 429:  # noqa: PLR2004
+            bucket.on_throttled(parse_retry_after(headers.get("Retry-After")))
+        else:
+            bucket.on_success()
+        bucket.observe_headers(headers)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return the stats of every bucket."""
+        return {name: bucket.stats() for name, bucket in self.buckets.items()}
@@ -0,0 +1,193 @@
+"""Content-addressed cache for evaluation and judge results.
+
+Identical evaluation inputs (the same evaluator, request, response, contexts, …)
+produce a stable key, so retries and replayed regression suites can be answered
+locally instead of re-running the evaluator upstream.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from scorable_mcp.persistent_cache import SQLiteCacheStore
+from scorable_mcp.schema import BaseEvaluationRequest, EvaluationResponse, RunJudgeResponse
+
+logger = logging.getLogger("scorable_mcp.result_cache")
+
+# Fields that determine an evaluation outcome. Tracking metadata (tags, user_id,
+# session_id) is deliberately left out so it does not fragment the cache.
+CACHE_KEY_FIELDS = frozenset(
+    {"request", "response", "contexts", "expected_output", "turns", "system_prompt"}
+)
+
+# Result types that may be restored from the persistent store, by class name.
+_PERSISTED_MODELS: dict[str, type[BaseModel]] = {
+    model.__name__: model for model in (EvaluationResponse, RunJudgeResponse)
+}
+
+
+def fingerprint(kind: str, target: str, payload: dict[str, Any]) -> str:
+    """Return a stable hash of a canonicalized evaluation payload.
+
+    Args:
+        kind: What is being executed, e.g. ``evaluator`` or ``judge``
+        target: ID or name of the evaluator or judge
+        payload: JSON-serializable inputs of the execution
+
+    Returns:
+        Hex encoded SHA-256 digest
+    """
+    canonical = json.dumps(
+        [kind, target, payload], sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def evaluation_cache_key(kind: str, target: str, request: BaseEvaluationRequest) -> str:
+    """Return the cache key of *request* executed against *target*."""
+    payload = request.model_dump(include=set(CACHE_KEY_FIELDS), exclude_none=True)
+    return fingerprint(kind, target, payload)
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: BaseModel
+    expires_at: float
+    size: int
+
+
+class ResultCache:
+    """LRU cache with per-entry TTL and a memory cap.
+
+    Entries are evicted least-recently-used first whenever either the entry
+    count or the approximate memory use (size of the serialized result) exceeds
+    its limit. Values are returned with ``cached=True`` set.
+
+    With a *store* every stored result is also written through to disk, and
+    :meth:`warm` reloads the unexpired ones after a restart.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        max_bytes: int,
+        store: SQLiteCacheStore | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a result stays valid
+            max_entries: Maximum number of cached results
+            max_bytes: Approximate memory budget for cached results
+            store: Optional persistent store backing the cache
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.store = store
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get[M: BaseModel](self, key: str, model: type[M]) -> M | None:
+        """Return the cached result for *key*, marked as cached, or None.
+
+        Args:
+            key: Cache key from :func:`evaluation_cache_key`
+            model: Expected result type
+        """
+        entry = self._entries.get(key)
+        if entry is None or not isinstance(entry.value, model):
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value.model_copy(update={"cached": True})
+
+    def set(self, key: str, value: BaseModel) -> None:
+        """Store *value* under *key*, evicting older entries if needed."""
+        serialized = value.model_dump_json()
+        if self._insert(key, value, self.ttl, len(serialized)) and self.store is not None:
+            self.store.put_result(key, type(value).__name__, serialized, time.time() + self.ttl)
+
+    async def warm(self) -> int:
+        """Load unexpired results from the persistent store.
+
+        Returns:
+            Number of results restored
+        """
+        if self.store is None:
+            return 0
+
+        restored = 0
+        now = time.time()
+        for row in await self.store.load_results(self.max_entries):
+            model = _PERSISTED_MODELS.get(row.model)
+            if model is None or row.expires_at <= now:
+                continue
+            try:
+                value = model.model_validate_json(row.value)
+            except ValidationError as e:
+                logger.debug("Skipping unreadable persisted result %s: %s", row.key, e)
+                continue
+            self._insert(row.key, value, row.expires_at - now, len(row.value))
+            restored += 1
+
+        logger.info("Restored %d results from the persistent cache", restored)
+        return restored
+
+    def _insert(self, key: str, value: BaseModel, ttl: float, size: int) -> bool:
+        if size > self.max_bytes:
+            logger.debug("Result of %d bytes exceeds the cache budget, not caching", size)
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(value=value, expires_at=time.monotonic() + ttl, size=size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
@@ -0,0 +1,212 @@
+"""Retry policy for transient Scorable API failures.
+
+Requests are retried only when doing so is safe: idempotent requests on any
+transient failure, evaluation and judge executions only when the API cannot
+have processed them (it asked us to back off, or the connection was never
+established). Delays grow exponentially with full jitter, ``Retry-After`` is
+honored, and a shared budget caps retries to a fraction of regular traffic so
+that they cannot amplify an outage.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+logger = logging.getLogger("scorable_mcp.retry")
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses worth retrying for requests that can safely be repeated.
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Statuses guaranteeing the request was not processed, so even a non-idempotent
+# request can be sent again.
+UNPROCESSED_STATUSES = frozenset({429, 503})
+
+# Errors raised before the request reached the API.
+UNSENT_ERRORS: tuple[type[httpx.RequestError], ...] = (httpx.ConnectError, httpx.ConnectTimeout)
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header into seconds to wait.
+
+    Both the delta-seconds and the HTTP-date forms are accepted.
+
+    Args:
+        value: Raw header value
+        now: Current wall-clock time, defaults to :func:`time.time`
+
+    Returns:
+        Seconds to wait, or None when the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    current = datetime.fromtimestamp(now if now is not None else time.time(), UTC)
+    return max((retry_at - current).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """Cap retries to a fraction of the requests sent in a sliding window.
+
+    Every request deposits ``ratio`` of a retry; on top of that ``min_per_second``
+    retries are always allowed so that a quiet server can still recover from a
+    single failure.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        min_per_second: float,
+        window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per request sent, e.g. 0.1 for 10%
+            min_per_second: Retries always allowed per second regardless of traffic
+            window: Seconds of history taken into account
+            clock: Monotonic time source, mainly for tests
+        """
+        self.ratio = max(ratio, 0.0)
+        self.min_per_second = max(min_per_second, 0.0)
+        self.window = window
+        self._clock = clock
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self.exhausted = 0
+
+    def record_request(self) -> None:
+        """Account for a new request (not a retry)."""
+        now = self._clock()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_acquire(self) -> bool:
+        """Take one retry from the budget.
+
+        Returns:
+            Whether a retry may be attempted
+        """
+        now = self._clock()
+        self._prune(now)
+        allowed = self.min_per_second * self.window + self.ratio * len(self._requests)
+        if len(self._retries) + 1 > allowed:
+            self.exhausted += 1
+            return False
+        self._retries.append(now)
+        return True
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window
+        for history in (self._requests, self._retries):
+            while history and history[0] <= horizon:
+                history.popleft()
+
+
+class RetryPolicy:
+    """Decide whether and when a failed Scorable API request is retried."""
+
+    def __init__(
+        self,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+        retry_after_max: float,
+        budget: RetryBudget | None = None,
+        rng: random.Random | None = None,
+    ):
+        """Initialize the policy.
+
+        Args:
+            max_retries: Retries per request after the first attempt (0 disables)
+            backoff_base: Upper bound in seconds of the first backoff delay
+            backoff_max: Upper bound in seconds of any backoff delay
+            retry_after_max: Longest ``Retry-After`` honored; longer waits fail fast
+            budget: Shared retry budget, unlimited when omitted
+            rng: Random source for jitter, mainly for tests
+        """
+        self.max_retries = max(max_retries, 0)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_after_max = retry_after_max
+        self.budget = budget
+        self._rng = rng or random.Random()
+
+    def record_request(self) -> None:
+        """Account for a new request in the retry budget."""
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def is_retryable(
+        self,
+        method: str,
+        status_code: int | None = None,
+        error: httpx.RequestError | None = None,
+    ) -> bool:
+        """Whether a request failing with *status_code* or *error* may be sent again."""
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        if error is not None:
+            return idempotent or isinstance(error, UNSENT_ERRORS)
+        if status_code is None:
+            return False
+        return status_code in (RETRYABLE_STATUSES if idempotent else UNPROCESSED_STATUSES)
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered delay before retry number *attempt* (starting at 0)."""
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return self._rng.uniform(0.0, ceiling)
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        error: httpx.RequestError | None = None,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """Return how long to wait before retrying, or None to give up.
+
+        Args:
+            method: HTTP method of the failed request
+            attempt: Number of retries already made for this request
+            status_code: HTTP status of the failed response, if any
+            error: Transport error raised instead of a response, if any
+            retry_after: Delay requested by the API through ``Retry-After``
+
+        Returns:
+            Seconds to sleep before the next attempt, or None when the failure
+            must be reported
+        """
+        if attempt >= self.max_retries:
+            return None
+        if not self.is_retryable(method, status_code=status_code, error=error):
+            return None
+        if retry_after is not None and retry_after > self.retry_after_max:
+            logger.debug("Not retrying: Retry-After of %.1fs is too long", retry_after)
+            return None
+        if self.budget is not None and not self.budget.try_acquire():
+            logger.warning("Retry budget exhausted, not retrying %s request", method)
+            return None
+        if retry_after is not None:
+            return retry_after
+        return self.backoff(attempt)
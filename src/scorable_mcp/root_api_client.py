@@ -4,12 +4,26 @@ This module provides a simple httpx-based client for the Scorable API,
 replacing the official SDK with a minimal implementation for our specific needs.
 """
 
+import asyncio
+import importlib.util
+import json
 import logging
-from datetime import datetime
-from typing import Any, Literal, cast
+import time
+from collections.abc import AsyncGenerator, Callable
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal, NoReturn
 
 import httpx
-
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from scorable_mcp.circuit import CircuitBreaker, CircuitBreakers, CircuitState
+from scorable_mcp.hedging import HedgePolicy
+from scorable_mcp.latency import AdaptiveTimeouts, LatencyTracker
+from scorable_mcp.logpreview import Preview
+from scorable_mcp.metrics import MetricsRegistry, Samples
+from scorable_mcp.ratelimit import RateLimiter
+from scorable_mcp.retry import RetryBudget, RetryPolicy, parse_retry_after
 from scorable_mcp.schema import (
     EvaluationResponse,
     EvaluatorInfo,
@@ -19,10 +33,117 @@ from scorable_mcp.schema import (
     RunJudgeResponse,
 )
 from scorable_mcp.settings import settings
+from scorable_mcp.tracing import current_span, tracer
 
 logger = logging.getLogger("scorable_mcp.root_client")
 
 
+def build_evaluation_payload(
+    request: str | None = None,
+    response: str | None = None,
+    contexts: list[str] | None = None,
+    expected_output: str | None = None,
+    tags: list[str] | None = None,
+    user_id: str | None = None,
+    session_id: str | None = None,
+    system_prompt: str | None = None,
+    turns: list[MessageTurn] | None = None,
+) -> dict[str, Any]:
+    """Build the JSON body shared by the evaluator and judge execute endpoints.
+
+    Empty values are left out; ``turns`` takes precedence over request/response.
+    """
+    payload: dict[str, Any] = {}
+
+    if turns:
+        payload["turns"] = [t.model_dump(exclude_none=True) for t in turns]
+    else:
+        if request:
+            payload["request"] = request
+        if response:
+            payload["response"] = response
+
+    if contexts:
+        payload["contexts"] = contexts
+    if expected_output:
+        payload["expected_output"] = expected_output
+    if tags:
+        payload["tags"] = tags
+    if user_id:
+        payload["user_id"] = user_id
+    if session_id:
+        payload["session_id"] = session_id
+    if system_prompt:
+        payload["system_prompt"] = system_prompt
+
+    return payload
+
+
+def encode_payload(payload: dict[str, Any]) -> bytes:
+    """Serialize *payload* once so it can be sent to several endpoints."""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode(
+        "utf-8"
+    )
+
+
+# Query parameters of page links that can be predicted: page numbers and offsets.
+_PAGE_CURSORS = ("page", "offset")
+
+# Catalog pages whose validators and parsed items are kept for conditional GETs.
+_PAGE_CACHE_SIZE = 256
+
+# Returned by _make_request when a conditional request was answered with 304.
+NOT_MODIFIED: Any = object()
+
+
+class _EvaluationEnvelope(BaseModel):
+    result: EvaluationResponse
+
+
+class _CatalogPage[T](BaseModel):
+    next: str | None = None
+    count: int | None = None
+    results: list[T]
+
+
+# Response bodies are validated straight from bytes, without building dicts first.
+_EVALUATION_RESULT: TypeAdapter[_EvaluationEnvelope | EvaluationResponse] = TypeAdapter(
+    Annotated[_EvaluationEnvelope | EvaluationResponse, Field(union_mode="left_to_right")]
+)
+_JUDGE_RESULT = TypeAdapter(RunJudgeResponse)
+_PAGE_ADAPTERS: dict[str, tuple[TypeAdapter[_CatalogPage[Any]], TypeAdapter[list[Any]]]] = {
+    "evaluators": (TypeAdapter(_CatalogPage[EvaluatorInfo]), TypeAdapter(list[EvaluatorInfo])),
+    "judges": (TypeAdapter(_CatalogPage[JudgeInfo]), TypeAdapter(list[JudgeInfo])),
+}
+
+
+def _page_cursor(url: str) -> tuple[str, int] | None:
+    """Return the numeric page or offset cursor of a page URL, None for opaque cursors."""
+    params = httpx.URL(url).params
+    for name in _PAGE_CURSORS:
+        value = params.get(name)
+        if value is not None and value.isdigit():
+            return name, int(value)
+    return None
+
+
+def _following_page_urls(next_url: str, page_len: int, count: int) -> list[str]:
+    """Return *next_url* and the URLs of the pages after it, up to *count* in total.
+
+    Only *next_url* is returned when its cursor is opaque.
+    """
+    cursor = _page_cursor(next_url)
+    if cursor is None or count <= 1:
+        return [next_url]
+    name, value = cursor
+    url = httpx.URL(next_url)
+    step = 1
+    if name == "offset":
+        limit = url.params.get("limit", "")
+        step = int(limit) if limit.isdigit() and int(limit) > 0 else page_len
+    return [next_url] + [str(url.copy_set_param(name, value + i * step)) for i in range(1, count)]
+
+
 class ScorableAPIError(Exception):
     """Exception raised for Scorable API errors."""
 
@@ -38,6 +159,25 @@ class ScorableAPIError(Exception):
         super().__init__(f"Scorable API error (HTTP {status_code}): {detail}")
 
 
+class CircuitOpenError(ScorableAPIError):
+    """Raised instead of calling the Scorable API while its circuit is open."""
+
+    def __init__(self, endpoint: str, retry_after: float):
+        """Initialize CircuitOpenError.
+
+        Args:
+            endpoint: Endpoint class whose circuit is open
+            retry_after: Seconds until the circuit lets a probe call through
+        """
+        self.endpoint = endpoint
+        self.retry_after = retry_after
+        super().__init__(
+            503,
+            f"Scorable API {endpoint} endpoints are failing, "
+            f"not calling them for another {retry_after:.0f}s",
+        )
+
+
 class ResponseValidationError(Exception):
     """Exception raised when API response doesn't match expected schema."""
 
@@ -52,6 +192,268 @@ class ResponseValidationError(Exception):
         super().__init__(f"Response validation error: {message}")
 
 
+def _listing_error(
+    e: ValidationError, offset: int, resource_type: str, response_data: Any
+) -> ResponseValidationError:
+    """Describe the first problem of an invalid listing page."""
+    error = e.errors()[0]
+    loc = error["loc"]
+    if error["type"] == "json_invalid":
+        return ResponseValidationError(
+            f"Response body is not valid JSON: {error['msg']}", response_data
+        )
+    if not loc:
+        return ResponseValidationError(
+            f"Expected response to be a dict or list, got {type(error['input']).__name__}",
+            response_data,
+        )
+    if error["type"] == "missing" and loc == ("results",):
+        return ResponseValidationError("Could not find 'results' field in response", response_data)
+    index = next((part for part in loc if isinstance(part, int)), None)
+    if error["type"] == "missing" and index is not None:
+        label = "Evaluator" if resource_type == "evaluators" else "Judge"
+        return ResponseValidationError(
+            f"{label} at index {offset + index} missing required field: '{loc[-1]}'",
+            response_data,
+        )
+    return ResponseValidationError(f"Invalid {resource_type} response format: {e}", response_data)
+
+
+@dataclass
+class _CachedPage:
+    """A validated catalog page and the headers revalidating it."""
+
+    validators: dict[str, str]
+    items: list[Any]
+    next_url: str
+    count: int | None
+
+
+class ScorableConnection:
+    """Long-lived, pooled HTTP connection to the Scorable API.
+
+    One instance is meant to be shared by all repositories so that requests reuse
+    warm keep-alive connections instead of paying a TCP/TLS handshake per call.
+    Its ``metrics`` registry collects the upstream request metrics of all of them.
+    """
+
+    def __init__(
+        self,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        http2: bool | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breakers: CircuitBreakers | None = None,
+        rate_limiter: RateLimiter | None = None,
+        hedging: HedgePolicy | None = None,
+        timeouts: AdaptiveTimeouts | None = None,
+    ):
+        """Initialize the connection pool configuration.
+
+        The underlying ``httpx.AsyncClient`` is created lazily on first use so that
+        it is bound to the event loop actually serving requests.
+
+        Args:
+            max_connections: Maximum number of concurrent connections
+                (defaults to settings.scorable_api_max_connections)
+            max_keepalive_connections: Maximum number of idle connections kept alive
+                (defaults to settings.scorable_api_max_keepalive_connections)
+            keepalive_expiry: Seconds before an idle connection is closed
+                (defaults to settings.scorable_api_keepalive_expiry)
+            http2: Whether to negotiate HTTP/2 so concurrent requests are multiplexed
+                over few connections (defaults to settings.scorable_api_http2)
+            transport: Optional custom transport, mainly for tests and benchmarks
+            retry_policy: Retry policy shared by every request on this connection
+                (defaults to one configured from the scorable_api_retry_* settings)
+            breakers: Circuit breakers shared by every request on this connection
+                (defaults to ones configured from the circuit_breaker_* settings)
+            rate_limiter: Token buckets shared by every request on this connection
+                (defaults to ones configured from the rate_limit_* settings)
+            hedging: Hedging policy for evaluator executions (defaults to one configured
+                from the hedge_* settings when settings.hedge_enabled is set, else none)
+            timeouts: Per-endpoint request timeouts (defaults to ones configured from
+                the scorable_api_*timeout* settings)
+        """
+        self.limits = httpx.Limits(
+            max_connections=(
+                max_connections
+                if max_connections is not None
+                else settings.scorable_api_max_connections
+            ),
+            max_keepalive_connections=(
+                max_keepalive_connections
+                if max_keepalive_connections is not None
+                else settings.scorable_api_max_keepalive_connections
+            ),
+            keepalive_expiry=(
+                keepalive_expiry
+                if keepalive_expiry is not None
+                else settings.scorable_api_keepalive_expiry
+            ),
+        )
+        self.http2 = http2 if http2 is not None else settings.scorable_api_http2
+        if self.http2 and importlib.util.find_spec("h2") is None:
+            logger.warning(
+                "HTTP/2 requested but the 'h2' package is not installed, falling back to "
+                "HTTP/1.1. Install scorable-mcp[http2] to enable it."
+            )
+            self.http2 = False
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+        self.retry_policy = (
+            retry_policy
+            if retry_policy is not None
+            else RetryPolicy(
+                max_retries=settings.scorable_api_max_retries,
+                backoff_base=settings.scorable_api_retry_backoff_base,
+                backoff_max=settings.scorable_api_retry_backoff_max,
+                retry_after_max=settings.scorable_api_retry_after_max,
+                budget=RetryBudget(
+                    ratio=settings.scorable_api_retry_budget_ratio,
+                    min_per_second=settings.scorable_api_retry_budget_min_per_second,
+                ),
+            )
+        )
+        self.breakers = (
+            breakers
+            if breakers is not None
+            else CircuitBreakers(
+                failure_threshold=settings.circuit_breaker_failure_threshold,
+                recovery_timeout=settings.circuit_breaker_recovery_timeout,
+                half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+            )
+        )
+        self.rate_limiter = (
+            rate_limiter
+            if rate_limiter is not None
+            else RateLimiter(
+                execute_rate=settings.rate_limit_execute_per_second,
+                execute_burst=settings.rate_limit_execute_burst,
+                list_rate=settings.rate_limit_list_per_second,
+                list_burst=settings.rate_limit_list_burst,
+            )
+        )
+        if hedging is None and settings.hedge_enabled:
+            hedging = HedgePolicy(
+                tracker=LatencyTracker(),
+                percentile=settings.hedge_percentile,
+                min_delay=settings.hedge_min_delay,
+                budget=RetryBudget(ratio=settings.hedge_budget_ratio, min_per_second=0.0),
+            )
+        self.hedging = hedging
+        self.timeouts = (
+            timeouts
+            if timeouts is not None
+            else AdaptiveTimeouts(
+                tracker=LatencyTracker(window=1000),
+                default=settings.scorable_api_timeout,
+                connect=settings.scorable_api_connect_timeout,
+                quantile=settings.scorable_api_timeout_quantile,
+                factor=settings.scorable_api_timeout_factor,
+                floor=settings.scorable_api_timeout_floor,
+                ceiling=settings.scorable_api_timeout_ceiling,
+                enabled=settings.scorable_api_adaptive_timeouts,
+            )
+        )
+        self.metrics = MetricsRegistry()
+        self.request_duration = self.metrics.histogram(
+            "scorable_upstream_request_duration_seconds",
+            "Latency of Scorable API requests by endpoint class and status",
+            ("method", "endpoint", "status"),
+        )
+        self.pages = self.metrics.counter(
+            "scorable_catalog_pages_total",
+            "Catalog pages received from the Scorable API, parsed or not modified",
+            ("resource", "outcome"),
+        )
+        self._register_collectors()
+
+    def _register_collectors(self) -> None:
+        """Expose circuit and rate limiter state, read from them at scrape time."""
+
+        def _circuit_states() -> Samples:
+            for name, snapshot in self.breakers.snapshot().items():
+                for state in CircuitState:
+                    yield (name, state.value), float(snapshot["state"] == state.value)
+
+        def _circuit_stat(key: str) -> Callable[[], Samples]:
+            def _collect() -> Samples:
+                for name, snapshot in self.breakers.snapshot().items():
+                    yield (name,), snapshot[key]
+
+            return _collect
+
+        def _bucket_stat(key: str) -> Callable[[], Samples]:
+            def _collect() -> Samples:
+                for name, stats in self.rate_limiter.stats().items():
+                    yield (name,), stats[key]
+
+            return _collect
+
+        self.metrics.gauge(
+            "scorable_circuit_state",
+            "Current state of the circuit of each endpoint class (1 for the active state)",
+            ("endpoint", "state"),
+            callback=_circuit_states,
+        )
+        self.metrics.counter(
+            "scorable_circuit_opened_total",
+            "Times the circuit of an endpoint class opened",
+            ("endpoint",),
+            callback=_circuit_stat("times_opened"),
+        )
+        self.metrics.counter(
+            "scorable_circuit_rejected_total",
+            "Calls failed fast while the circuit of an endpoint class was open",
+            ("endpoint",),
+            callback=_circuit_stat("rejected"),
+        )
+        self.metrics.gauge(
+            "scorable_rate_limit_queue_depth",
+            "Requests waiting for a rate limit token",
+            ("bucket",),
+            callback=_bucket_stat("queue_depth"),
+        )
+        self.metrics.counter(
+            "scorable_rate_limit_throttled_total",
+            "Responses from the Scorable API that signalled throttling",
+            ("bucket",),
+            callback=_bucket_stat("throttled"),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first access."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                follow_redirects=True,
+                limits=self.limits,
+                timeout=settings.scorable_api_timeout,
+                http2=self.http2,
+                transport=self._transport,
+            )
+            logger.debug(
+                "Opened pooled Scorable API client with limits %s (http2=%s)",
+                self.limits,
+                self.http2,
+            )
+        return self._client
+
+    @property
+    def is_open(self) -> bool:
+        """Whether a pooled client has been created and not closed yet."""
+        return self._client is not None and not self._client.is_closed
+
+    async def aclose(self) -> None:
+        """Close the pooled client and all of its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.debug("Closed pooled Scorable API client")
+
+
 class ScorableRepositoryBase:
     """Base class for Scorable API clients."""
 
@@ -59,15 +461,23 @@ class ScorableRepositoryBase:
         self,
         api_key: str = settings.scorable_api_key.get_secret_value(),
         base_url: str = settings.scorable_api_url,
+        connection: ScorableConnection | None = None,
     ):
         """Initialize the HTTP client for Scorable API.
 
         Args:
             api_key: Scorable API key
             base_url: Base URL for the Scorable API
+            connection: Shared connection pool. When omitted the repository creates
+                and owns a private one, which is closed by :meth:`aclose`.
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
+        self._owns_connection = connection is None
+        self.connection = connection if connection is not None else ScorableConnection()
+        self._page_cache: dict[str, _CachedPage] = {}
+        self.pages_fetched = 0
+        self.pages_not_modified = 0
 
         self.headers = {
             "Authorization": f"Api-Key {api_key}",
@@ -77,140 +487,400 @@ class ScorableRepositoryBase:
         }
 
         logger.debug(
-            f"Initialized Scorable API client with User-Agent: {self.headers['User-Agent']}"
+            "Initialized Scorable API client with User-Agent: %s", self.headers["User-Agent"]
         )
 
+    async def aclose(self) -> None:
+        """Release the connection pool if this repository owns it."""
+        if self._owns_connection:
+            await self.connection.aclose()
+
     async def _make_request(
         self,
         method: str,
         path: str,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        content: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        on_response: Callable[[httpx.Response], None] | None = None,
+        raw: bool = False,
     ) -> Any:
         """Make an HTTP request to the Scorable API.
 
+        While the circuit of the endpoint class is open the call fails immediately.
+        Otherwise it waits for the connection's rate limiter, and transient failures
+        are retried according to the connection's retry policy. The timeout of each
+        attempt adapts to the latencies observed on the endpoint. With tracing enabled,
+        encoding the payload and sending the request are recorded as spans.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API endpoint path
             params: URL parameters
             json_data: JSON body data for POST/PUT requests
+            content: Pre-serialized JSON body, used instead of *json_data*
+            headers: Extra request headers, e.g. conditional request validators
+            on_response: Called with the final successful response, e.g. to read its headers
+            raw: Return the undecoded body, for callers validating it with a TypeAdapter
 
         Returns:
-            Response data as a dictionary or list
+            Response data as a dictionary or list (bytes when *raw*), or NOT_MODIFIED for a 304
 
         Raises:
+            CircuitOpenError: If the endpoint's circuit is open
             ScorableAPIError: If the API returns an error
         """
         url = f"{self.base_url}/{path.lstrip('/')}"
 
-        logger.debug(f"Making {method} request to {url}")
-        if settings.debug:
-            logger.debug(f"Request headers: {self.headers}")
-            if params:
-                logger.debug(f"Request params: {params}")
-            if json_data:
-                logger.debug(f"Request payload: {json_data}")
+        self._log_request(method, url, params, json_data, content)
+        if json_data is not None:
+            with tracer.span("scorable.encode_payload"):
+                content = encode_payload(json_data)
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
+        with tracer.span("scorable.request") as span:
+            if tracer.enabled:
+                span.set_attribute("http.request.method", method.upper())
+                span.set_attribute("url.path", httpx.URL(url).path)
+                span.set_attribute("http.request.body.size", len(content or b""))
+            return await self._send(method, url, path, params, content, headers, on_response, raw)
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        path: str,
+        params: dict[str, Any] | None,
+        content: bytes | None,
+        headers: dict[str, str] | None,
+        on_response: Callable[[httpx.Response], None] | None,
+        raw: bool,
+    ) -> Any:
+        """Send a request through the breaker, rate limiter and retry policy of the connection."""
+        policy = self.connection.retry_policy
+        breaker = self.connection.breakers.for_request(method, path)
+        limiter = self.connection.rate_limiter
+        bucket = limiter.bucket_for(method)
+        endpoint = f"{method.upper()} {httpx.URL(url).path}"
+        policy.record_request()
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(breaker.name, breaker.retry_after())
             try:
-                response = await client.request(
+                await bucket.acquire()
+                sent_at = time.perf_counter()
+                response = await self.connection.client.request(
                     method=method,
                     url=url,
                     params=params,
-                    json=json_data,
-                    headers=self.headers,
-                    timeout=settings.scorable_api_timeout,
+                    content=content,
+                    headers=self.headers if headers is None else {**self.headers, **headers},
+                    timeout=self.connection.timeouts.for_request(endpoint),
                 )
+            except httpx.RequestError as e:
+                self._record_error(breaker, method, endpoint, e, time.perf_counter() - sent_at)
+                delay = policy.next_delay(method, attempt, error=e)
+                if delay is None:
+                    logger.error("Request error: %s", e)
+                    raise ScorableAPIError(0, f"Connection error: {str(e)}") from e
+                logger.warning(
+                    "Request error on %s %s: %s, retrying in %.2fs", method, url, e, delay
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                breaker.release()
+                raise
+
+            self._record_outcome(
+                breaker, method, endpoint, response.status_code, time.perf_counter() - sent_at
+            )
+            span = current_span()
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("scorable.attempts", attempt + 1)
+            limiter.observe(bucket, response.status_code, response.headers)
+            logger.debug("Response status: %s", response.status_code)
+            if settings.debug and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response headers: %s", dict(response.headers))
+
+            if response.status_code >= 400:  # noqa: PLR2004
+                delay = policy.next_delay(
+                    method,
+                    attempt,
+                    status_code=response.status_code,
+                    retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                )
+                if delay is not None:
+                    logger.warning(
+                        "HTTP %s on %s %s, retrying in %.2fs",
+                        response.status_code,
+                        method,
+                        url,
+                        delay,
+                    )
+                    attempt += 1
+                    await asyncio.sleep(delay)
+                    continue
 
-                logger.debug(f"Response status: {response.status_code}")
-                if settings.debug:
-                    logger.debug(f"Response headers: {dict(response.headers)}")
+                self._raise_api_error(response)
 
-                if response.status_code >= 400:  # noqa: PLR2004
-                    try:
-                        error_data = response.json()
-                        error_message = error_data.get("detail", str(error_data))
-                    except Exception:
-                        error_message = response.text or f"HTTP {response.status_code}"
+            if on_response is not None:
+                on_response(response)
+            return self._decode_response(response, raw)
 
-                    logger.error(f"API error response: {error_message}")
-                    raise ScorableAPIError(response.status_code, error_message)
+    def _log_request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        json_data: dict[str, Any] | None,
+        content: bytes | None,
+    ) -> None:
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("Making %s request to %s", method, url)
+        if settings.debug:
+            logger.debug("Request headers: %s", self.headers)
+            if params:
+                logger.debug("Request params: %s", params)
+            if json_data or content:
+                logger.debug("Request payload: %s", Preview(json_data or content))
+
+    @staticmethod
+    def _decode_response(response: httpx.Response, raw: bool) -> Any:
+        """Return the JSON body of a successful *response*, or its bytes when *raw*."""
+        if response.status_code == 304:  # noqa: PLR2004
+            return NOT_MODIFIED
+        if raw:
+            return response.content
+        if response.status_code == 204:  # noqa: PLR2004
+            return {}
+
+        response_data = response.json()
+        if settings.debug:
+            logger.debug("Response data: %s", Preview(response_data))
+        return response_data
 
-                if response.status_code == 204:  # noqa: PLR2004
-                    return {}
+    @staticmethod
+    def _raise_api_error(response: httpx.Response) -> NoReturn:
+        """Raise a ScorableAPIError carrying the detail of an error *response*."""
+        try:
+            error_data = response.json()
+            error_message = error_data.get("detail", str(error_data))
+        except Exception:
+            error_message = response.text or f"HTTP {response.status_code}"
 
-                response_data = response.json()
-                if settings.debug:
-                    logger.debug(f"Response data: {response_data}")
-                return response_data
+        logger.error("API error response: %s", Preview(error_message))
+        raise ScorableAPIError(response.status_code, error_message)
 
-            except httpx.RequestError as e:
-                logger.error(f"Request error: {str(e)}")
-                raise ScorableAPIError(0, f"Connection error: {str(e)}") from e
+    def _record_error(
+        self,
+        breaker: CircuitBreaker,
+        method: str,
+        endpoint: str,
+        error: httpx.RequestError,
+        elapsed: float,
+    ) -> None:
+        """Count a transport error against *breaker*.
 
-    async def _fetch_paginated_results(  # noqa: PLR0915, PLR0912
+        A timeout is fed to the endpoint's adaptive timeout as a latency of at least *elapsed*.
+        """
+        breaker.record_failure()
+        if isinstance(error, httpx.TimeoutException):
+            self.connection.timeouts.record_timeout(endpoint, elapsed)
+        self.connection.request_duration.observe(elapsed, method, breaker.name, "error")
+
+    def _record_outcome(
+        self,
+        breaker: CircuitBreaker,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        elapsed: float,
+    ) -> None:
+        """Count server errors against *breaker*; rate limiting says nothing about health.
+
+        The latency of successful responses feeds the endpoint's adaptive timeout.
+        """
+        self.connection.request_duration.observe(elapsed, method, breaker.name, str(status_code))
+        if status_code < 400:  # noqa: PLR2004
+            self.connection.timeouts.record(endpoint, elapsed)
+        if status_code >= 500:  # noqa: PLR2004
+            breaker.record_failure()
+        elif status_code == 429:  # noqa: PLR2004
+            breaker.release()
+        else:
+            breaker.record_success()
+
+    async def _iter_pages(
         self,
         initial_url: str,
         max_to_fetch: int,
         resource_type: Literal["evaluators", "judges"],
         url_params: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:  # noqa: PLR0915, PLR0912
-        items_raw: list[dict[str, Any]] = []
+    ) -> AsyncGenerator[list[Any]]:
+        """Yield the validated items of a listing page by page, in order, up to *max_to_fetch*.
+
+        When the ``next`` links carry a page number or offset, the following pages
+        are predicted and up to settings.catalog_prefetch_pages of them are fetched
+        concurrently; opaque cursors are followed one page at a time.
+
+        Args:
+            initial_url: Path of the first page
+            max_to_fetch: Maximum number of items to yield
+            resource_type: Kind of item listed, selecting the models pages are validated into
+            url_params: Query parameters carried over to every page
+        """
+        fetched = 0
+        total: int | None = None
+        page_len = 0
         next_page_url = initial_url
 
-        while next_page_url and len(items_raw) < max_to_fetch:
-            if next_page_url.startswith("http"):
-                next_page_url = "/" + next_page_url.split("/", 3)[3]
-
-            response = await self._make_request("GET", next_page_url)
-            logger.debug(f"Raw {resource_type} response: {response}")
-
-            if isinstance(response, dict):
-                next_page_url = response.get("next", "")
-
-                # Preserve any specified URL parameters
-                if next_page_url and url_params:
-                    for param_name, param_value in url_params.items():
-                        if param_value is not None and f"{param_name}=" not in next_page_url:
-                            if "?" in next_page_url:
-                                next_page_url += f"&{param_name}={param_value}"
-                            else:
-                                next_page_url += f"?{param_name}={param_value}"
-
-                if "results" in response and isinstance(response["results"], list):
-                    current_page_items = response["results"]
-                    logger.debug(
-                        f"Found {len(current_page_items)} {resource_type} in 'results' field"
-                    )
-                else:
-                    raise ResponseValidationError(
-                        "Could not find 'results' field in response", response
-                    )
+        while next_page_url and fetched < max_to_fetch:
+            remaining = max_to_fetch if total is None else min(max_to_fetch, total)
+            remaining -= fetched
+            batch = [next_page_url]
+            if page_len:
+                wanted = min(settings.catalog_prefetch_pages, -(-remaining // page_len))
+                batch = _following_page_urls(next_page_url, page_len, wanted)
+
+            if len(batch) == 1:
+                pages: list[_CachedPage | BaseException] = [
+                    await self._fetch_page(batch[0], fetched, resource_type, url_params)
+                ]
+            else:
+                logger.debug("Prefetching %d %s pages concurrently", len(batch), resource_type)
+                pages = await asyncio.gather(
+                    *(
+                        self._fetch_page(url, fetched + i * page_len, resource_type, url_params)
+                        for i, url in enumerate(batch)
+                    ),
+                    return_exceptions=True,
+                )
+
+            next_page_url = ""
+            for i, page in enumerate(pages):
+                if isinstance(page, BaseException):
+                    raise page
+                next_page_url = page.next_url
+                total = page.count if page.count is not None else total
+                page_len = max(page_len, len(page.items))
+
+                current_page_items = page.items[: max_to_fetch - fetched]
+                fetched += len(current_page_items)
+                logger.info(
+                    "Fetched %d more %s, total now: %d",
+                    len(current_page_items),
+                    resource_type,
+                    fetched,
+                )
+                if not current_page_items:
+                    logger.debug("Received empty page, stopping pagination")
+                    return
+                yield current_page_items
+
+                if fetched >= max_to_fetch:
+                    return
+                if i + 1 < len(batch) and _page_cursor(next_page_url) != _page_cursor(batch[i + 1]):
+                    # The API did not page as predicted: drop the rest and follow its link
+                    break
+
+    async def _fetch_page(
+        self,
+        url: str,
+        offset: int,
+        resource_type: Literal["evaluators", "judges"],
+        url_params: dict[str, Any] | None,
+    ) -> _CachedPage:
+        """Fetch and validate one listing page, revalidating a previously fetched copy.
+
+        Pages served with an ``ETag`` or ``Last-Modified`` header are kept along
+        with their validated items. Fetching them again sends a conditional request,
+        and a 304 answer returns the kept items without parsing anything.
+        """
+        cached = self._page_cache.get(url)
+        validators: dict[str, str] = {}
+
+        def _remember_validators(response: httpx.Response) -> None:
+            if etag := response.headers.get("ETag"):
+                validators["If-None-Match"] = etag
+            if last_modified := response.headers.get("Last-Modified"):
+                validators["If-Modified-Since"] = last_modified
+
+        response = await self._make_request(
+            "GET",
+            url,
+            headers=cached.validators if cached is not None else None,
+            on_response=_remember_validators,
+            raw=True,
+        )
+        if response is NOT_MODIFIED and cached is not None:
+            logger.debug("%s page %s not modified, reusing parsed items", resource_type, url)
+            self.pages_not_modified += 1
+            self.connection.pages.inc(resource_type, "not_modified")
+            return cached
+
+        logger.debug("Raw %s response: %s", resource_type, Preview(response))
+        items, next_url, count = self._parse_page(response, offset, resource_type, url_params)
+        page = _CachedPage(validators=validators, items=items, next_url=next_url, count=count)
+        self.pages_fetched += 1
+        self.connection.pages.inc(resource_type, "fetched")
+
+        self._page_cache.pop(url, None)
+        if validators:
+            if len(self._page_cache) >= _PAGE_CACHE_SIZE:
+                del self._page_cache[next(iter(self._page_cache))]
+            self._page_cache[url] = page
+        return page
+
+    @staticmethod
+    def _parse_page(
+        response: Any,
+        offset: int,
+        resource_type: Literal["evaluators", "judges"],
+        url_params: dict[str, Any] | None,
+    ) -> tuple[list[Any], str, int | None]:
+        """Validate a listing response into its items, the next page path and the total count.
+
+        Raw bodies are validated straight from bytes; already decoded responses,
+        a page envelope or a bare list, go through the same adapters.
+        """
+        page_adapter, list_adapter = _PAGE_ADAPTERS[resource_type]
+        try:
+            if isinstance(response, bytes):
+                if response.lstrip()[:1] == b"[":
+                    return list_adapter.validate_json(response), "", None
+                page = page_adapter.validate_json(response)
             elif isinstance(response, list):
-                logger.debug(f"Response is a direct list of {resource_type}")
-                current_page_items = response
-                next_page_url = ""
+                logger.debug("Response is a direct list of %s", resource_type)
+                return list_adapter.validate_python(response), "", None
+            elif isinstance(response, dict):
+                page = page_adapter.validate_python(response)
             else:
                 raise ResponseValidationError(
                     f"Expected response to be a dict or list, got {type(response).__name__}",
-                    cast(dict[str, Any], response),
+                    response,
                 )
+        except ValidationError as e:
+            raise _listing_error(e, offset, resource_type, response) from e
 
-            items_raw.extend(current_page_items)
-            logger.info(
-                f"Fetched {len(current_page_items)} more {resource_type}, total now: {len(items_raw)}"
-            )
-
-            if len(current_page_items) == 0:
-                logger.debug("Received empty page, stopping pagination")
-                break
+        next_page_url = page.next or ""
+        if next_page_url.startswith("http"):
+            next_page_url = "/" + next_page_url.split("/", 3)[3]
 
-        if len(items_raw) > max_to_fetch:
-            items_raw = items_raw[:max_to_fetch]
-            logger.debug(f"Trimmed results to {max_to_fetch} {resource_type}")
+        # Preserve any specified URL parameters
+        if next_page_url and url_params:
+            for param_name, param_value in url_params.items():
+                if param_value is not None and f"{param_name}=" not in next_page_url:
+                    if "?" in next_page_url:
+                        next_page_url += f"&{param_name}={param_value}"
+                    else:
+                        next_page_url += f"?{param_name}={param_value}"
 
-        logger.info(f"Found {len(items_raw)} {resource_type} total after pagination")
-        return items_raw
+        logger.debug("Found %d %s in 'results' field", len(page.results), resource_type)
+        return page.results, next_page_url, page.count
 
 
 class ScorableEvaluatorRepository(ScorableRepositoryBase):
@@ -228,53 +898,32 @@ class ScorableEvaluatorRepository(ScorableRepositoryBase):
         Raises:
             ResponseValidationError: If a required field is missing in any evaluator
         """
-        max_to_fetch = max_count if max_count is not None else settings.max_evaluators
-        page_size = min(max_to_fetch, 40)
-        initial_url = f"/v1/evaluators?page_size={page_size}"
-
-        evaluators_raw = await self._fetch_paginated_results(
-            initial_url=initial_url,
-            max_to_fetch=max_to_fetch,
-            resource_type="evaluators",
-        )
-
-        evaluators = []
-        for i, evaluator_data in enumerate(evaluators_raw):
-            try:
-                logger.debug(f"Processing evaluator {i}: {evaluator_data}")
+        async with aclosing(self.iter_evaluators(max_count)) as evaluators:
+            return [evaluator async for evaluator in evaluators]
 
-                id_value = evaluator_data["id"]
-                name_value = evaluator_data["name"]
-                created_at = evaluator_data["created_at"]
+    async def iter_evaluators(self, max_count: int | None = None) -> AsyncGenerator[EvaluatorInfo]:
+        """Yield the available evaluators as their pages arrive.
 
-                if isinstance(created_at, datetime):
-                    created_at = created_at.isoformat()
+        Only one page of raw items is held at a time, and stopping the iteration
+        early leaves the remaining pages unfetched.
 
-                intent = None
-                if "objective" in evaluator_data and isinstance(evaluator_data["objective"], dict):
-                    objective = evaluator_data["objective"]
-                    intent = objective.get("intent")
+        Args:
+            max_count: Maximum number of evaluators to fetch (defaults to settings.max_evaluators)
 
-                inputs = evaluator_data["inputs"]
+        Yields:
+            Evaluator information, in catalog order
 
-                evaluator = EvaluatorInfo(
-                    id=id_value,
-                    name=name_value,
-                    created_at=created_at,
-                    intent=intent,
-                    inputs=inputs,
-                )
-                evaluators.append(evaluator)
-            except KeyError as e:
-                missing_field = str(e).strip("'")
-                logger.warning(f"Evaluator at index {i} missing required field: '{missing_field}'")
-                logger.warning(f"Evaluator data: {evaluator_data}")
-                raise ResponseValidationError(
-                    f"Evaluator at index {i} missing required field: '{missing_field}'",
-                    evaluator_data,
-                ) from e
+        Raises:
+            ResponseValidationError: If a required field is missing in any evaluator
+        """
+        max_to_fetch = max_count if max_count is not None else settings.max_evaluators
+        page_size = min(max_to_fetch, 40)
+        initial_url = f"/v1/evaluators?page_size={page_size}"
 
-        return evaluators
+        async with aclosing(self._iter_pages(initial_url, max_to_fetch, "evaluators")) as pages:
+            async for page in pages:
+                for evaluator in page:
+                    yield evaluator
 
     async def run_evaluator(
         self,
@@ -309,48 +958,45 @@ class ScorableEvaluatorRepository(ScorableRepositoryBase):
         Raises:
             ResponseValidationError: If the response is missing required fields
         """
-        payload: dict[str, Any] = {}
+        payload = build_evaluation_payload(
+            request=request,
+            response=response,
+            contexts=contexts,
+            expected_output=expected_output,
+            tags=tags,
+            user_id=user_id,
+            session_id=session_id,
+            system_prompt=system_prompt,
+            turns=turns,
+        )
 
-        if turns:
-            payload["turns"] = [t.model_dump(exclude_none=True) for t in turns]
-        else:
-            if request:
-                payload["request"] = request
-            if response:
-                payload["response"] = response
-
-        if contexts:
-            payload["contexts"] = contexts
-        if expected_output:
-            payload["expected_output"] = expected_output
-        if tags:
-            payload["tags"] = tags
-        if user_id:
-            payload["user_id"] = user_id
-        if session_id:
-            payload["session_id"] = session_id
-        if system_prompt:
-            payload["system_prompt"] = system_prompt
+        response_data = await self._execute(evaluator_id, json_data=payload)
 
-        response_data = await self._make_request(
-            "POST", f"/v1/evaluators/execute/{evaluator_id}/", json_data=payload
-        )
+        logger.debug("Raw evaluation response: %s", Preview(response_data))
 
-        logger.debug(f"Raw evaluation response: {response_data}")
+        return self._parse_evaluation_response(response_data)
 
-        try:
-            result_data = (
-                response_data.get("result", response_data)
-                if isinstance(response_data, dict)
-                else response_data
-            )
+    async def run_evaluator_payload(self, evaluator_id: str, body: bytes) -> EvaluationResponse:
+        """Run an evaluator with a payload serialized by :func:`encode_payload`.
 
-            return EvaluationResponse.model_validate(result_data)
-        except ValueError as e:
-            raise ResponseValidationError(
-                f"Invalid evaluation response format: {str(e)}",
-                response_data,
-            ) from e
+        Lets callers that send one interaction to several evaluators build and
+        encode the payload only once.
+
+        Args:
+            evaluator_id: ID of the evaluator to use
+            body: Encoded evaluation payload
+
+        Returns:
+            Evaluation response with score and justification
+
+        Raises:
+            ResponseValidationError: If the response is missing required fields
+        """
+        response_data = await self._execute(evaluator_id, content=body)
+
+        logger.debug("Raw evaluation response: %s", Preview(response_data))
+
+        return self._parse_evaluation_response(response_data)
 
     async def run_evaluator_by_name(
         self,
@@ -385,38 +1031,84 @@ class ScorableEvaluatorRepository(ScorableRepositoryBase):
         Raises:
             ResponseValidationError: If the response is missing required fields
         """
-        payload: dict[str, Any] = {}
-
-        if turns:
-            payload["turns"] = [t.model_dump(exclude_none=True) for t in turns]
-        else:
-            if request:
-                payload["request"] = request
-            if response:
-                payload["response"] = response
-
-        if contexts:
-            payload["contexts"] = contexts
-        if expected_output:
-            payload["expected_output"] = expected_output
-        if tags:
-            payload["tags"] = tags
-        if user_id:
-            payload["user_id"] = user_id
-        if session_id:
-            payload["session_id"] = session_id
-        if system_prompt:
-            payload["system_prompt"] = system_prompt
+        payload = build_evaluation_payload(
+            request=request,
+            response=response,
+            contexts=contexts,
+            expected_output=expected_output,
+            tags=tags,
+            user_id=user_id,
+            session_id=session_id,
+            system_prompt=system_prompt,
+            turns=turns,
+        )
 
         params = {"name": evaluator_name}
 
         response_data = await self._make_request(
-            "POST", "/v1/evaluators/execute/by-name/", params=params, json_data=payload
+            "POST", "/v1/evaluators/execute/by-name/", params=params, json_data=payload, raw=True
+        )
+
+        logger.debug("Raw evaluation by name response: %s", Preview(response_data))
+
+        return self._parse_evaluation_response(response_data)
+
+    async def run_evaluator_by_name_payload(
+        self, evaluator_name: str, body: bytes
+    ) -> EvaluationResponse:
+        """Run an evaluator specified by name with a payload from :func:`encode_payload`.
+
+        Args:
+            evaluator_name: Name of the evaluator to use
+            body: Encoded evaluation payload
+
+        Returns:
+            Evaluation response with score and justification
+
+        Raises:
+            ResponseValidationError: If the response is missing required fields
+        """
+        response_data = await self._make_request(
+            "POST",
+            "/v1/evaluators/execute/by-name/",
+            params={"name": evaluator_name},
+            content=body,
+            raw=True,
         )
 
-        logger.debug(f"Raw evaluation by name response: {response_data}")
+        logger.debug("Raw evaluation by name response: %s", Preview(response_data))
+
+        return self._parse_evaluation_response(response_data)
+
+    async def _execute(
+        self,
+        evaluator_id: str,
+        json_data: dict[str, Any] | None = None,
+        content: bytes | None = None,
+    ) -> Any:
+        """Execute an evaluator, hedging slow calls when the connection enables it."""
+
+        def attempt() -> Any:
+            return self._make_request(
+                "POST",
+                f"/v1/evaluators/execute/{evaluator_id}/",
+                json_data=json_data,
+                content=content,
+                raw=True,
+            )
+
+        hedging = self.connection.hedging
+        if hedging is None:
+            return await attempt()
+        return await hedging.run(evaluator_id, attempt)
 
+    @staticmethod
+    def _parse_evaluation_response(response_data: Any) -> EvaluationResponse:
         try:
+            if isinstance(response_data, bytes):
+                parsed = _EVALUATION_RESULT.validate_json(response_data)
+                return parsed.result if isinstance(parsed, _EvaluationEnvelope) else parsed
+
             # Extract the result field if it exists, otherwise use the whole response
             result_data = (
                 response_data.get("result", response_data)
@@ -446,6 +1138,21 @@ class ScorableJudgeRepository(ScorableRepositoryBase):
         Returns:
             List of judge information
 
+        Raises:
+            ResponseValidationError: If a required field is missing in any judge
+        """
+        async with aclosing(self.iter_judges(max_count)) as judges:
+            return [judge async for judge in judges]
+
+    async def iter_judges(self, max_count: int | None = None) -> AsyncGenerator[JudgeInfo]:
+        """Yield the available judges as their pages arrive.
+
+        Args:
+            max_count: Maximum number of judges to fetch (defaults to settings.max_judges)
+
+        Yields:
+            Judge information, in catalog order
+
         Raises:
             ResponseValidationError: If a required field is missing in any judge
         """
@@ -456,49 +1163,12 @@ class ScorableJudgeRepository(ScorableRepositoryBase):
         )
         url_params = {"include_public": settings.show_public_judges}
 
-        judges_raw = await self._fetch_paginated_results(
-            initial_url=initial_url,
-            max_to_fetch=max_to_fetch,
-            resource_type="judges",
-            url_params=url_params,
-        )
-
-        judges = []
-        for i, judge_data in enumerate(judges_raw):
-            try:
-                logger.debug(f"Processing judge {i}: {judge_data}")
-
-                id_value = judge_data["id"]
-                name_value = judge_data["name"]
-                created_at = judge_data["created_at"]
-
-                if isinstance(created_at, datetime):
-                    created_at = created_at.isoformat()
-
-                description = judge_data.get("intent")
-
-                evaluators: list[JudgeInfo.NestedEvaluatorInfo] = []
-                for evaluator_data in judge_data.get("evaluators", []):
-                    evaluators.append(JudgeInfo.NestedEvaluatorInfo.model_validate(evaluator_data))
-
-                judge = JudgeInfo(
-                    id=id_value,
-                    name=name_value,
-                    created_at=created_at,
-                    description=description,
-                    evaluators=evaluators,
-                )
-                judges.append(judge)
-            except KeyError as e:
-                missing_field = str(e).strip("'")
-                logger.warning(f"Judge at index {i} missing required field: '{missing_field}'")
-                logger.warning(f"Judge data: {judge_data}")
-                raise ResponseValidationError(
-                    f"Judge at index {i} missing required field: '{missing_field}'",
-                    judge_data,
-                ) from e
-
-        return judges
+        async with aclosing(
+            self._iter_pages(initial_url, max_to_fetch, "judges", url_params)
+        ) as pages:
+            async for page in pages:
+                for judge in page:
+                    yield judge
 
     async def run_judge(
         self,
@@ -516,42 +1186,34 @@ class ScorableJudgeRepository(ScorableRepositoryBase):
             ResponseValidationError: If response cannot be parsed
             ScorableAPIError: If API returns an error
         """
-        logger.info(f"Running judge {run_judge_request.judge_id}")
+        logger.info("Running judge %s", run_judge_request.judge_id)
         if run_judge_request.turns:
-            logger.debug(f"Judge turns: {len(run_judge_request.turns)} turns")
+            logger.debug("Judge turns: %d turns", len(run_judge_request.turns))
         else:
-            logger.debug(f"Judge request: {(run_judge_request.request or '')[:100]}...")
-            logger.debug(f"Judge response: {(run_judge_request.response or '')[:100]}...")
-
-        payload: dict[str, Any] = {}
-
-        if run_judge_request.turns:
-            payload["turns"] = [t.model_dump(exclude_none=True) for t in run_judge_request.turns]
-        else:
-            if run_judge_request.request:
-                payload["request"] = run_judge_request.request
-            if run_judge_request.response:
-                payload["response"] = run_judge_request.response
-
-        if run_judge_request.contexts:
-            payload["contexts"] = run_judge_request.contexts
-        if run_judge_request.expected_output:
-            payload["expected_output"] = run_judge_request.expected_output
-        if run_judge_request.tags:
-            payload["tags"] = run_judge_request.tags
-        if run_judge_request.user_id:
-            payload["user_id"] = run_judge_request.user_id
-        if run_judge_request.session_id:
-            payload["session_id"] = run_judge_request.session_id
-        if run_judge_request.system_prompt:
-            payload["system_prompt"] = run_judge_request.system_prompt
+            logger.debug("Judge request: %s", Preview(run_judge_request.request or "", 100))
+            logger.debug("Judge response: %s", Preview(run_judge_request.response or "", 100))
+
+        payload = build_evaluation_payload(
+            request=run_judge_request.request,
+            response=run_judge_request.response,
+            contexts=run_judge_request.contexts,
+            expected_output=run_judge_request.expected_output,
+            tags=run_judge_request.tags,
+            user_id=run_judge_request.user_id,
+            session_id=run_judge_request.session_id,
+            system_prompt=run_judge_request.system_prompt,
+            turns=run_judge_request.turns,
+        )
 
         result = await self._make_request(
             method="POST",
             path=f"/v1/judges/{run_judge_request.judge_id}/execute/",
             json_data=payload,
+            raw=True,
         )
         try:
+            if isinstance(result, bytes):
+                return _JUDGE_RESULT.validate_json(result)
             return RunJudgeResponse.model_validate(result)
         except ValueError as e:
             raise ResponseValidationError(
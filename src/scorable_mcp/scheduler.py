@@ -0,0 +1,211 @@
+"""Bounded, fair scheduling of tool calls.
+
+Every tool call holds slots while it talks to the Scorable API: one per
+upstream execution it may run at once, so a batch running eight evaluations
+concurrently holds eight slots. The number of slots is capped globally and per
+session, and waiting calls are ordered by
+start-time fair queuing: each session's calls are stamped with a virtual start
+time that advances by ``cost / weight`` per call, so a session submitting large
+batches is served after lighter sessions instead of ahead of them. When too many
+calls are waiting, new ones are rejected right away rather than letting latency
+grow without bound. A wide call at the head of the queue is not overtaken by
+narrower calls that would fit into the slots freed so far.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+from scorable_mcp.session import current_session
+
+logger = logging.getLogger("scorable_mcp.scheduler")
+
+
+class SchedulerFullError(Exception):
+    """Raised when a tool call cannot even be queued because the server is saturated."""
+
+    def __init__(self, queued: int):
+        """Initialize SchedulerFullError.
+
+        Args:
+            queued: Number of calls already waiting
+        """
+        self.queued = queued
+        super().__init__(
+            f"Server is busy: {queued} tool calls are already waiting for the Scorable API, "
+            "retry later"
+        )
+
+
+@dataclass
+class _Waiter:
+    session: str
+    start: float
+    seq: int
+    width: int
+    future: asyncio.Future[None] = field(repr=False)
+
+
+class FairScheduler:
+    """Concurrency limiter with per-session caps and weighted fair queuing."""
+
+    def __init__(self, max_concurrency: int, session_max_concurrency: int, max_queue: int):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Slots (concurrent upstream executions) across all sessions
+                (0 disables)
+            session_max_concurrency: Slots held at once per session (0 for no cap)
+            max_queue: Tool calls allowed to wait for a slot before new ones are rejected
+        """
+        self.max_concurrency = max_concurrency
+        self.session_max_concurrency = session_max_concurrency
+        self.max_queue = max(max_queue, 0)
+        self._running = 0
+        self._active: dict[str, int] = {}
+        self._finish: dict[str, float] = {}
+        self._weights: dict[str, float] = {}
+        self._waiting: list[_Waiter] = []
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+        self.admitted = 0
+        self.rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrency > 0
+
+    def set_weight(self, session: str, weight: float) -> None:
+        """Give *session* a larger (or smaller) share of the slots; the default is 1."""
+        if weight <= 0:
+            raise ValueError("Session weight must be positive")
+        self._weights[session] = weight
+
+    @asynccontextmanager
+    async def slot(
+        self, cost: float = 1.0, session: str | None = None, width: int = 1
+    ) -> AsyncIterator[None]:
+        """Hold slots for the duration of the block.
+
+        Args:
+            cost: Relative amount of upstream work of the call, e.g. its batch size
+            session: Session of the call, defaults to the current one
+            width: Upstream executions the call may run at once; that many slots are
+                held, capped to what the global and per-session limits allow
+
+        Raises:
+            SchedulerFullError: If the wait queue is full
+        """
+        if not self.enabled:
+            yield
+            return
+
+        session = session or current_session.get()
+        width = min(max(width, 1), self.max_concurrency)
+        if self.session_max_concurrency > 0:
+            width = min(width, self.session_max_concurrency)
+        await self._acquire(session, max(cost, 0.0), width)
+        try:
+            yield
+        finally:
+            self._release(session, width)
+
+    def stats(self) -> dict[str, Any]:
+        """Return held slots and waiting and rejected call counts."""
+        return {
+            "running": self._running,
+            "queued": sum(1 for w in self._waiting if not w.future.done()),
+            "sessions_active": len(self._active),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+        }
+
+    async def _acquire(self, session: str, cost: float, width: int) -> None:
+        start = max(self._virtual_time, self._finish.get(session, 0.0))
+        finish = start + cost / self._weights.get(session, 1.0)
+
+        self._waiting = [w for w in self._waiting if not w.future.done()]
+        waiter = _Waiter(
+            session=session,
+            start=start,
+            seq=next(self._seq),
+            width=width,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        # Queue the call and dispatch right away: it is admitted now only if no
+        # waiter ahead of it in fair order is still waiting for slots.
+        self._waiting.append(waiter)
+        self._dispatch()
+        if waiter.future.done():
+            self._finish[session] = finish
+            return
+
+        self._waiting.remove(waiter)
+        if len(self._waiting) >= self.max_queue:
+            waiter.future.cancel()
+            self.rejected += 1
+            logger.warning("Rejecting tool call: %d calls already waiting", len(self._waiting))
+            raise SchedulerFullError(len(self._waiting))
+
+        self._finish[session] = finish
+        self._waiting.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slots were granted just before the caller gave up
+                self._release(session, width)
+            else:
+                # Slots held back for this waiter may now fit the next one
+                if waiter in self._waiting:
+                    self._waiting.remove(waiter)
+                self._dispatch()
+            raise
+
+    def _has_session_capacity(self, waiter: _Waiter) -> bool:
+        return (
+            self.session_max_concurrency <= 0
+            or self._active.get(waiter.session, 0) + waiter.width <= self.session_max_concurrency
+        )
+
+    def _admit(self, waiter: _Waiter) -> None:
+        self._running += waiter.width
+        self._active[waiter.session] = self._active.get(waiter.session, 0) + waiter.width
+        self._virtual_time = max(self._virtual_time, waiter.start)
+        self.admitted += 1
+
+    def _release(self, session: str, width: int) -> None:
+        self._running -= width
+        remaining = self._active[session] - width
+        if remaining:
+            self._active[session] = remaining
+        else:
+            del self._active[session]
+        self._dispatch()
+        self._forget_idle_sessions()
+
+    def _dispatch(self) -> None:
+        while True:
+            eligible = [
+                w for w in self._waiting if not w.future.done() and self._has_session_capacity(w)
+            ]
+            if not eligible:
+                break
+            waiter = min(eligible, key=lambda w: (w.start, w.seq))
+            if self._running + waiter.width > self.max_concurrency:
+                break  # hold the freed slots for the next call in fair order
+            self._waiting.remove(waiter)
+            self._admit(waiter)
+            waiter.future.set_result(None)
+
+    def _forget_idle_sessions(self) -> None:
+        busy = set(self._active) | {w.session for w in self._waiting}
+        for session in [s for s in self._finish if s not in busy]:
+            if self._finish[session] <= self._virtual_time:
+                del self._finish[session]
@@ -5,7 +5,7 @@ This module defines Pydantic models and other types used across the server.
 
 from typing import Literal, TypeVar
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AliasChoices, AliasPath, BaseModel, Field, model_validator
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -21,12 +21,13 @@ class BaseToolRequest(BaseModel):
 
 
 class ListEvaluatorsRequest(BaseToolRequest):
-    """Request model for listing evaluators.
+    """Request model for listing evaluators."""
 
-    This is an empty request as list_evaluators doesn't require any parameters.
-    """
-
-    pass
+    limit: int | None = Field(
+        None,
+        ge=1,
+        description="Return only the first N evaluators; small values answer faster",
+    )
 
 
 #####################################################################
@@ -169,6 +170,56 @@ class EvaluationRequest(BaseEvaluationRequest):
     evaluator_id: str = Field(..., description="The ID of the evaluator to use")
 
 
+class BatchEvaluationItem(BaseEvaluationRequest):
+    """One row of a batch evaluation, addressing its evaluator by ID or by name."""
+
+    evaluator_id: str | None = Field(
+        default=None,
+        description="The ID of the evaluator to use. Provide either this or 'evaluator_name'.",
+    )
+    evaluator_name: str | None = Field(
+        default=None,
+        description="The EXACT name of the evaluator as returned by the `list_evaluators` tool. Provide either this or 'evaluator_id'.",
+    )
+
+    @model_validator(mode="after")
+    def validate_evaluator_reference(self) -> "BatchEvaluationItem":
+        if (self.evaluator_id is None) == (self.evaluator_name is None):
+            raise ValueError("Provide exactly one of 'evaluator_id' or 'evaluator_name'")
+        return self
+
+
+class EvaluationBatchRequest(BaseToolRequest):
+    """Request model for run_evaluation_batch tool."""
+
+    items: list[BatchEvaluationItem] = Field(
+        ...,
+        min_length=1,
+        description="Evaluations to run, for example one per dataset row. Results are returned in the same order.",
+    )
+
+
+class MultiEvaluationRequest(BaseEvaluationRequest):
+    """Request model for run_evaluations tool: one interaction, several evaluators."""
+
+    evaluator_ids: list[str] = Field(
+        default_factory=list,
+        description="IDs of the evaluators to run",
+    )
+    evaluator_names: list[str] = Field(
+        default_factory=list,
+        description="EXACT names of further evaluators to run, as returned by the `list_evaluators` tool",
+    )
+
+    @model_validator(mode="after")
+    def validate_evaluators(self) -> "MultiEvaluationRequest":
+        if not self.evaluator_ids and not self.evaluator_names:
+            raise ValueError(
+                "Provide at least one evaluator in 'evaluator_ids' or 'evaluator_names'"
+            )
+        return self
+
+
 class CodingPolicyAdherenceEvaluationRequest(BaseToolRequest):
     """Request model for coding policy adherence evaluation tool."""
 
@@ -197,6 +248,45 @@ class EvaluationResponse(BaseScorableModel):
     execution_log_id: str | None = Field(None, description="Execution log ID for use in monitoring")
     cost: float | int | None = Field(None, description="Cost of the evaluation")
     confidence: float | None = Field(None, description="Confidence score of the evaluation (0-1)")
+    cached: bool | None = Field(
+        None, description="True when the result was served from the local result cache"
+    )
+
+
+class BatchEvaluationResult(BaseScorableModel):
+    """Outcome of one batch item: either a result or an error."""
+
+    index: int = Field(..., description="Position of the item in the request")
+    result: EvaluationResponse | None = Field(None, description="Evaluation result on success")
+    error: str | None = Field(None, description="Error message on failure")
+
+
+class EvaluationBatchResponse(BaseScorableModel):
+    """Model for run_evaluation_batch response."""
+
+    results: list[BatchEvaluationResult] = Field(
+        ..., description="One entry per request item, in input order"
+    )
+    succeeded: int = Field(..., description="Number of items evaluated successfully")
+    failed: int = Field(..., description="Number of items that failed")
+
+
+class EvaluatorOutcome(BaseScorableModel):
+    """Outcome of one evaluator in a run_evaluations call: either a result or an error."""
+
+    evaluator: str = Field(..., description="Evaluator ID or name as given in the request")
+    result: EvaluationResponse | None = Field(None, description="Evaluation result on success")
+    error: str | None = Field(None, description="Error message on failure")
+
+
+class MultiEvaluationResponse(BaseScorableModel):
+    """Model for run_evaluations response."""
+
+    results: list[EvaluatorOutcome] = Field(
+        ..., description="One entry per requested evaluator, IDs first, then names"
+    )
+    total_cost: float = Field(..., description="Sum of the reported evaluation costs")
+    wall_time: float = Field(..., description="Seconds taken to run all evaluators")
 
 
 class ArrayInputItem(BaseModel):
@@ -218,7 +308,12 @@ class EvaluatorInfo(BaseScorableModel):
     name: str = Field(..., description="Name of the evaluator")
     id: str = Field(..., description="ID of the evaluator")
     created_at: str = Field(..., description="Creation timestamp of the evaluator")
-    intent: str | None = Field(None, description="Intent of the evaluator")
+    intent: str | None = Field(
+        None,
+        description="Intent of the evaluator",
+        # The API nests it in the evaluator's objective
+        validation_alias=AliasChoices(AliasPath("objective", "intent"), "intent"),
+    )
     inputs: dict[str, RequiredInput] = Field(
         ...,
         description="Schema defining the input parameters required for running the evaluator (run_evaluation parameters).",
@@ -240,12 +335,13 @@ class EvaluatorsListResponse(BaseScorableModel):
 
 
 class ListJudgesRequest(BaseToolRequest):
-    """Request model for listing judges.
+    """Request model for listing judges."""
 
-    This is an empty request as list_judges doesn't require any parameters.
-    """
-
-    pass
+    limit: int | None = Field(
+        None,
+        ge=1,
+        description="Return only the first N judges; small values answer faster",
+    )
 
 
 class JudgeInfo(BaseScorableModel):
@@ -263,8 +359,15 @@ class JudgeInfo(BaseScorableModel):
     name: str = Field(..., description="Name of the judge")
     id: str = Field(..., description="ID of the judge")
     created_at: str = Field(..., description="Creation timestamp of the judge")
-    evaluators: list[NestedEvaluatorInfo] = Field(..., description="List of evaluators")
-    description: str | None = Field(None, description="Description of the judge")
+    evaluators: list[NestedEvaluatorInfo] = Field(
+        default_factory=list, description="List of evaluators"
+    )
+    description: str | None = Field(
+        None,
+        description="Description of the judge",
+        # The API calls it the judge's intent
+        validation_alias=AliasChoices("intent", "description"),
+    )
 
 
 class JudgesListResponse(BaseScorableModel):
@@ -298,6 +401,9 @@ class RunJudgeResponse(BaseScorableModel):
     evaluator_results: list[JudgeEvaluatorResult] = Field(
         ..., description="List of evaluator results"
     )
+    cached: bool | None = Field(
+        None, description="True when the result was served from the local result cache"
+    )
 
 
 # Re-export MessageTurn so callers can import it from this module
@@ -306,11 +412,16 @@ __all__ = [
     "BaseEvaluationRequest",
     "BaseScorableModel",
     "BaseToolRequest",
+    "BatchEvaluationItem",
+    "BatchEvaluationResult",
     "CodingPolicyAdherenceEvaluationRequest",
+    "EvaluationBatchRequest",
+    "EvaluationBatchResponse",
     "EvaluationRequest",
     "EvaluationRequestByName",
     "EvaluationResponse",
     "EvaluatorInfo",
+    "EvaluatorOutcome",
     "EvaluatorsListResponse",
     "JudgeEvaluatorResult",
     "JudgeInfo",
@@ -318,6 +429,8 @@ __all__ = [
     "ListEvaluatorsRequest",
     "ListJudgesRequest",
     "MessageTurn",
+    "MultiEvaluationRequest",
+    "MultiEvaluationResponse",
     "RequiredInput",
     "RunJudgeRequest",
     "RunJudgeResponse",
@@ -0,0 +1,27 @@
+"""Identity of the MCP session a tool call belongs to.
+
+The transports serve many agent sessions from one process and one API key.
+The session of the running tool call is kept in a context variable so that
+shared components deep in the call stack, such as the rate limiter, can treat
+sessions fairly without threading an argument through every layer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+DEFAULT_SESSION = "default"
+
+current_session: ContextVar[str] = ContextVar("scorable_mcp_session", default=DEFAULT_SESSION)
+
+
+@contextmanager
+def session_scope(session: str) -> Iterator[None]:
+    """Attribute everything run inside the block to *session*."""
+    token = current_session.set(session)
+    try:
+        yield
+    finally:
+        current_session.reset(token)
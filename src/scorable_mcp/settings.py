@@ -52,6 +52,114 @@ class Settings(BaseSettings):
         default=30.0,
         description="Timeout in seconds for Scorable API requests",
     )
+    scorable_api_connect_timeout: float = Field(
+        default=10.0,
+        description="Longest time in seconds to wait for a connection to the Scorable API",
+    )
+    scorable_api_adaptive_timeouts: bool = Field(
+        default=False,
+        description="Derive per-endpoint timeouts from observed latencies",
+    )
+    scorable_api_timeout_quantile: float = Field(
+        default=0.999,
+        description="Latency percentile adaptive timeouts are based on",
+    )
+    scorable_api_timeout_factor: float = Field(
+        default=3.0,
+        description="Multiplier applied to the latency percentile of an endpoint",
+    )
+    scorable_api_timeout_floor: float = Field(
+        default=2.0,
+        description="Shortest adaptive timeout in seconds",
+    )
+    scorable_api_timeout_ceiling: float = Field(
+        default=120.0,
+        description="Longest adaptive timeout in seconds",
+    )
+    scorable_api_max_connections: int = Field(
+        default=100,
+        description="Maximum number of concurrent connections to the Scorable API",
+    )
+    scorable_api_max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum number of idle keep-alive connections kept in the pool",
+    )
+    scorable_api_keepalive_expiry: float = Field(
+        default=30.0,
+        description="Seconds an idle keep-alive connection is kept before being closed",
+    )
+    scorable_api_http2: bool = Field(
+        default=False,
+        description="Negotiate HTTP/2 with the Scorable API (requires the 'http2' extra)",
+    )
+    scorable_api_max_retries: int = Field(
+        default=2,
+        description="Times a transiently failing Scorable API request is retried (0 disables)",
+    )
+    scorable_api_retry_backoff_base: float = Field(
+        default=0.5,
+        description="Upper bound in seconds of the first jittered retry delay",
+    )
+    scorable_api_retry_backoff_max: float = Field(
+        default=8.0,
+        description="Upper bound in seconds of any jittered retry delay",
+    )
+    scorable_api_retry_after_max: float = Field(
+        default=30.0,
+        description="Longest Retry-After in seconds that is waited for before retrying",
+    )
+    scorable_api_retry_budget_ratio: float = Field(
+        default=0.1,
+        description="Retries allowed as a fraction of requests sent in the last 10 seconds",
+    )
+    scorable_api_retry_budget_min_per_second: float = Field(
+        default=1.0,
+        description="Retries per second always allowed regardless of the retry budget ratio",
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive Scorable API failures that open an endpoint's circuit (0 disables)",
+    )
+    circuit_breaker_recovery_timeout: float = Field(
+        default=30.0,
+        description="Seconds an open circuit fails fast before probe calls are let through",
+    )
+    circuit_breaker_half_open_max_calls: int = Field(
+        default=1,
+        description="Concurrent probe calls allowed while a circuit is half-open",
+    )
+    rate_limit_execute_per_second: float = Field(
+        default=0.0,
+        description="Evaluator and judge executions sent per second (0 only honors API throttling)",
+    )
+    rate_limit_execute_burst: int = Field(
+        default=20,
+        description="Executions that may be sent at once after an idle period",
+    )
+    rate_limit_list_per_second: float = Field(
+        default=0.0,
+        description="Catalog listing requests sent per second (0 only honors API throttling)",
+    )
+    rate_limit_list_burst: int = Field(
+        default=10,
+        description="Catalog listing requests that may be sent at once after an idle period",
+    )
+    hedge_enabled: bool = Field(
+        default=False,
+        description="Send a second evaluator execution when the first is slower than usual",
+    )
+    hedge_percentile: float = Field(
+        default=0.95,
+        description="Latency percentile of an evaluator after which a hedged request is sent",
+    )
+    hedge_min_delay: float = Field(
+        default=0.05,
+        description="Shortest delay in seconds before a hedged request is sent",
+    )
+    hedge_budget_ratio: float = Field(
+        default=0.05,
+        description="Largest fraction of evaluator executions that may be hedged",
+    )
     max_evaluators: int = Field(
         default=40,
         description="Maximum number of evaluators to fetch",
@@ -60,6 +168,115 @@ class Settings(BaseSettings):
         default=40,
         description="Maximum number of judges to fetch",
     )
+    catalog_prefetch_pages: int = Field(
+        default=4,
+        description="Catalog pages fetched concurrently when the API pages by number or offset",
+    )
+    catalog_cache_ttl: float = Field(
+        default=60.0,
+        description="Seconds evaluator and judge catalogs are served from memory (0 disables)",
+    )
+    catalog_cache_stale_ttl: float = Field(
+        default=300.0,
+        description="Extra seconds a stale catalog is served while it is refreshed in the background",
+    )
+    resolve_evaluator_names_locally: bool = Field(
+        default=False,
+        description="Resolve evaluator names against the cached catalog and run them by ID",
+    )
+    evaluator_name_negative_ttl: float = Field(
+        default=30.0,
+        description="Seconds an evaluator name missing from the catalog is remembered as unknown",
+    )
+    result_cache_enabled: bool = Field(
+        default=False,
+        description="Serve identical evaluation and judge requests from a local result cache",
+    )
+    result_cache_ttl: float = Field(
+        default=3600.0,
+        description="Seconds a cached evaluation or judge result stays valid",
+    )
+    result_cache_max_entries: int = Field(
+        default=10_000,
+        description="Maximum number of cached evaluation and judge results",
+    )
+    result_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Approximate memory budget in bytes for cached results",
+    )
+    coalesce_inflight_requests: bool = Field(
+        default=True,
+        description="Share one upstream call between concurrent identical requests",
+    )
+    judge_execution_mode: Literal["server", "parallel"] = Field(
+        default="server",
+        description=(
+            "How judges run: 'server' calls the judge endpoint, 'parallel' fans the judge's "
+            "evaluators out concurrently from this server"
+        ),
+    )
+    judge_max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of judge evaluators run concurrently in parallel mode",
+    )
+    batch_max_items: int = Field(
+        default=500,
+        description="Maximum number of evaluations accepted by run_evaluation_batch and run_evaluations",
+    )
+    batch_max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of evaluations a batch or fan-out tool call runs concurrently",
+    )
+    scheduler_max_concurrency: int = Field(
+        default=64,
+        description=(
+            "Upstream executions running at once across all sessions; a batch, fan-out or "
+            "parallel judge call holds one slot per evaluation it may run concurrently "
+            "(0 disables scheduling)"
+        ),
+    )
+    scheduler_session_max_concurrency: int = Field(
+        default=8,
+        description=(
+            "Upstream executions a single session may run at once (0 for no per-session cap)"
+        ),
+    )
+    scheduler_max_queue: int = Field(
+        default=256,
+        description="Tool calls allowed to wait for a slot before new calls are rejected",
+    )
+    cache_db_path: str | None = Field(
+        default=None,
+        description="SQLite file persisting cached results and catalog snapshots across restarts",
+    )
+    cache_db_max_entries: int = Field(
+        default=100_000,
+        description="Maximum number of results kept in the persistent cache",
+    )
+    cache_db_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Approximate size budget in bytes for results in the persistent cache",
+    )
+    cache_db_flush_interval: float = Field(
+        default=1.0,
+        description="Maximum seconds a cache write waits before its batch is written to disk",
+    )
+    tracing_exporter: Literal["none", "file", "otlp"] = Field(
+        default="none",
+        description="Where tracing spans of tool calls are exported (none disables tracing)",
+    )
+    tracing_file_path: str = Field(
+        default="scorable-mcp-traces.jsonl",
+        description="File the spans are appended to as JSON lines with the file exporter",
+    )
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318",
+        description="Base URL of the OpenTelemetry collector receiving OTLP/HTTP spans",
+    )
+    tracing_batch_size: int = Field(
+        default=64,
+        description="Finished spans buffered before they are exported",
+    )
     show_public_judges: bool = Field(
         default=False,
         description="Whether to show public judges",
@@ -0,0 +1,83 @@
+"""In-flight request coalescing.
+
+When several sessions issue the same call at the same moment, only the first
+one goes upstream; the others await its result instead of sending duplicates.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+
+from scorable_mcp.result_cache import fingerprint
+from scorable_mcp.schema import BaseEvaluationRequest
+
+logger = logging.getLogger("scorable_mcp.singleflight")
+
+
+def request_key(kind: str, target: str, request: BaseEvaluationRequest) -> str:
+    """Return the coalescing key of *request* executed against *target*.
+
+    Unlike the result cache key this covers every field sent upstream, including
+    tags and session metadata, so only truly identical calls are merged.
+    """
+    return fingerprint(kind, target, request.model_dump(mode="json", exclude_none=True))
+
+
+class SingleFlight[K: Hashable, V]:
+    """Share one running call between concurrent callers with the same key.
+
+    The shared call is shielded: a caller that is cancelled stops waiting, but
+    the call keeps running for everyone else. Once it finishes the key is
+    forgotten, so later calls start afresh.
+    """
+
+    def __init__(self, name: str, enabled: bool = True):
+        """Initialize the group.
+
+        Args:
+            name: Human readable name used in logs
+            enabled: When False every call runs independently
+        """
+        self.name = name
+        self.enabled = enabled
+        self._calls: dict[K, asyncio.Task[V]] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: K, factory: Callable[[], Awaitable[V]]) -> V:
+        """Run *factory*, or join the call already running under *key*.
+
+        Args:
+            key: Identity of the call
+            factory: Coroutine factory performing the call
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raises
+        """
+        if not self.enabled:
+            return await factory()
+
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+            logger.debug("Joining in-flight %s call", self.name)
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the outcome as retrieved in case every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -7,6 +7,8 @@ Server-Sent Events (SSE) transport for network/Docker environments.
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 import uvicorn
@@ -15,10 +17,11 @@ from mcp.server.sse import SseServerTransport
 from mcp.types import TextContent
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import JSONResponse, PlainTextResponse, Response
 from starlette.routing import Mount, Route
 
 from scorable_mcp.core import RootMCPServerCore
+from scorable_mcp.metrics import CONTENT_TYPE
 from scorable_mcp.settings import settings
 
 logging.basicConfig(
@@ -46,20 +49,43 @@ class SSEMCPServer:
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[TextContent]:
         return await self.core.call_tool(name, arguments)
 
+    def health(self) -> dict[str, Any]:
+        return self.core.health()
+
+    def metrics(self) -> str:
+        """Render the server metrics in the Prometheus text format."""
+        return self.core.metrics.render()
+
+    async def start(self) -> None:
+        """Warm the server core's caches before accepting connections."""
+        await self.core.start()
+
+    async def aclose(self) -> None:
+        """Release resources held by the server core."""
+        await self.core.aclose()
+
 
 def create_app(server: SSEMCPServer) -> Starlette:
     """Create a Starlette app with SSE routes.
 
     Includes the /sse endpoint from <1.5.0 for backward compatibility and the identical /mcp endpoint.
+    Prometheus can scrape the server's metrics from /metrics.
     """
     sse_transport = SseServerTransport("/sse/message/")
     mcp_transport = SseServerTransport("/mcp/message/")
+    sessions = server.core.metrics.gauge(
+        "scorable_sse_sessions_active", "Open SSE connections by endpoint", ("endpoint",)
+    )
+    sessions.declare("/sse")
+    sessions.declare("/mcp")
 
     async def _run_server_app(
         request: Request, transport: SseServerTransport
     ) -> Any:  # pragma: no cover – trivial helper
         """Internal helper to bridge ASGI request with a given SSE transport."""
         logger.debug("SSE connection initiated")
+        endpoint = request.url.path
+        sessions.inc(endpoint)
         try:
             async with transport.connect_sse(
                 request.scope, request.receive, request._send
@@ -70,6 +96,8 @@ def create_app(server: SSEMCPServer) -> Starlette:
         except Exception as exc:
             logger.error("Error handling SSE/MCP connection", exc_info=True)
             return Response(f"Error: {exc}", status_code=500)
+        finally:
+            sessions.dec(endpoint)
 
     async def handle_sse(request: Request) -> Any:  # /sse
         return await _run_server_app(request, sse_transport)
@@ -82,10 +110,23 @@ def create_app(server: SSEMCPServer) -> Starlette:
         Mount("/sse/message/", app=sse_transport.handle_post_message),
         Route("/mcp", endpoint=handle_mcp),
         Mount("/mcp/message/", app=mcp_transport.handle_post_message),
-        Route("/health", endpoint=lambda r: Response("OK", status_code=200)),
+        Route("/health", endpoint=lambda r: JSONResponse(server.health())),
+        Route(
+            "/metrics",
+            endpoint=lambda r: PlainTextResponse(server.metrics(), media_type=CONTENT_TYPE),
+        ),
     ]
 
-    return Starlette(routes=routes)
+    @asynccontextmanager
+    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+        await server.start()
+        try:
+            yield
+        finally:
+            logger.info("Shutting down, closing Scorable API connections")
+            await server.aclose()
+
+    return Starlette(routes=routes, lifespan=lifespan)
 
 
 def run_server(host: str = "0.0.0.0", port: int = 9090) -> None:
@@ -41,7 +41,11 @@ class StdioMCPServer:
 
     async def run(self) -> None:
         """Run the stdio server."""
-        await self.mcp.run_stdio_async()
+        await self.core.start()
+        try:
+            await self.mcp.run_stdio_async()
+        finally:
+            await self.core.aclose()
 
 
 def main() -> None:
@@ -0,0 +1,180 @@
+"""Unit tests for the catalog cache."""
+
+import asyncio
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from scorable_mcp.catalog import CatalogCache, CatalogIndex
+from scorable_mcp.schema import JudgeInfo
+
+
+@pytest.fixture
+def clock() -> Generator[MagicMock]:
+    """Patch the monotonic clock used by the catalog cache."""
+    with patch("scorable_mcp.catalog.time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+async def _settle() -> None:
+    """Give background refresh tasks a few loop iterations to finish."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__serves_fresh_value_without_reloading(clock: MagicMock) -> None:
+    """Test that a fresh value is returned from memory."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60, stale_ttl=60)
+    loader = AsyncMock(return_value=["a"])
+
+    assert await cache.get(None, loader) == ["a"]
+    clock.return_value += 30
+    assert await cache.get(None, loader) == ["a"]
+
+    loader.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__serves_stale_value_and_refreshes_in_background(
+    clock: MagicMock,
+) -> None:
+    """Test that a stale value is returned immediately while one refresh runs."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60, stale_ttl=60)
+    loader = AsyncMock(side_effect=[["old"], ["new"]])
+
+    await cache.get(None, loader)
+    clock.return_value += 90
+
+    assert await cache.get(None, loader) == ["old"]
+    assert await cache.get(None, loader) == ["old"]
+    await _settle()
+
+    assert loader.await_count == 2
+    assert await cache.get(None, loader) == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__reloads_expired_value(clock: MagicMock) -> None:
+    """Test that a value past the stale window is reloaded synchronously."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60, stale_ttl=60)
+    loader = AsyncMock(side_effect=[["old"], ["new"]])
+
+    await cache.get(None, loader)
+    clock.return_value += 121
+
+    assert await cache.get(None, loader) == ["new"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__failed_background_refresh_keeps_stale_value(
+    clock: MagicMock,
+) -> None:
+    """Test that a failing refresh does not evict the stale value."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60, stale_ttl=60)
+    loader = AsyncMock(side_effect=[["old"], RuntimeError("API down")])
+
+    await cache.get(None, loader)
+    clock.return_value += 90
+
+    assert await cache.get(None, loader) == ["old"]
+    await _settle()
+    assert await cache.get(None, loader) == ["old"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__keys_are_cached_separately(clock: MagicMock) -> None:
+    """Test that different keys (e.g. max counts) do not share entries."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60)
+
+    assert await cache.get(5, AsyncMock(return_value=["five"])) == ["five"]
+    assert await cache.get(10, AsyncMock(return_value=["ten"])) == ["ten"]
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__disabled_with_zero_ttl() -> None:
+    """Test that a zero TTL always calls the loader."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=0)
+    loader = AsyncMock(return_value=["a"])
+
+    await cache.get(None, loader)
+    await cache.get(None, loader)
+
+    assert loader.await_count == 2
+
+
+def test_catalog_index__looks_up_by_id_and_name() -> None:
+    """Test ID, exact name and normalized name lookups."""
+    index = CatalogIndex(
+        [
+            JudgeInfo(
+                id="j-1",
+                name="Safety Judge",
+                created_at="2024-01-01",
+                evaluators=[],
+                description=None,
+            ),
+            JudgeInfo(
+                id="j-2",
+                name="safety  judge",
+                created_at="2024-01-02",
+                evaluators=[],
+                description=None,
+            ),
+            JudgeInfo(
+                id="j-3", name="Relevance", created_at="2024-01-03", evaluators=[], description=None
+            ),
+        ]
+    )
+
+    assert len(index) == 3
+    assert "j-3" in index
+    assert index.get("j-3") is index.items[2]
+    assert index.get("missing") is None
+    assert index.id_for_name("safety  judge") == "j-2"
+    assert index.id_for_name("SAFETY JUDGE") == "j-1"
+    assert index.get_by_name(" relevance ") is index.items[2]
+    assert index.get_by_name("Unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__seeded_snapshot_is_served_stale(clock: MagicMock) -> None:
+    """Test that an old persisted snapshot is served once and refreshed in the background."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60, stale_ttl=60)
+    loader = AsyncMock(return_value=["new"])
+
+    assert cache.seed(None, ["persisted"], age=3600)
+    assert not cache.seed(None, ["other"], age=0)
+
+    assert await cache.get(None, loader) == ["persisted"]
+    await _settle()
+    assert await cache.get(None, loader) == ["new"]
+
+
+def test_catalog_cache__seed_skipped_without_stale_window(clock: MagicMock) -> None:
+    """Test that an expired snapshot is not installed when stale serving is disabled."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60)
+
+    assert not cache.seed(None, ["persisted"], age=120)
+    assert cache.seed(None, ["persisted"], age=10)
+
+
+@pytest.mark.asyncio
+async def test_catalog_cache__concurrent_cold_loads_share_one_fetch() -> None:
+    """Test that a burst of requests on a cold cache walks the API once."""
+    cache: CatalogCache[list[str]] = CatalogCache("test", ttl=60)
+    release = asyncio.Event()
+
+    async def _slow_load() -> list[str]:
+        await release.wait()
+        return ["a"]
+
+    loader = AsyncMock(side_effect=_slow_load)
+    waiters = [asyncio.create_task(cache.get(None, loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [["a"]] * 5
+    loader.assert_awaited_once()
@@ -0,0 +1,123 @@
+"""Unit tests for the Scorable API circuit breakers."""
+
+from scorable_mcp.circuit import CircuitBreaker, CircuitBreakers, CircuitState, endpoint_class
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock, threshold: int = 3) -> CircuitBreaker:
+    return CircuitBreaker(
+        "execute", failure_threshold=threshold, recovery_timeout=10.0, clock=clock
+    )
+
+
+def test_circuit__opens_after_consecutive_failures() -> None:
+    """Test that the threshold of consecutive failures opens the circuit."""
+    breaker = _breaker(_Clock())
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert not breaker.allow()
+    assert breaker.rejected == 1
+    assert breaker.retry_after() == 10.0
+
+
+def test_circuit__success_resets_failure_count() -> None:
+    """Test that only consecutive failures count."""
+    breaker = _breaker(_Clock())
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit__half_open_probe_closes_on_success() -> None:
+    """Test that a single probe is let through after the cool-down and closes the circuit."""
+    clock = _Clock()
+    breaker = _breaker(clock, threshold=1)
+    breaker.record_failure()
+
+    clock.now = 10.0
+    assert breaker.state is CircuitState.HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_success()
+
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.allow()
+
+
+def test_circuit__half_open_probe_failure_reopens() -> None:
+    """Test that a failed probe starts a new cool-down."""
+    clock = _Clock()
+    breaker = _breaker(clock, threshold=1)
+    breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after() == 10.0
+    assert breaker.times_opened == 2
+
+
+def test_circuit__released_probe_frees_its_slot() -> None:
+    """Test that a probe ending without an outcome lets another probe through."""
+    clock = _Clock()
+    breaker = _breaker(clock, threshold=1)
+    breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.allow()
+
+    breaker.release()
+
+    assert breaker.allow()
+
+
+def test_circuit__disabled_never_opens() -> None:
+    """Test that a zero threshold disables the breaker."""
+    breaker = _breaker(_Clock(), threshold=0)
+
+    for _ in range(10):
+        breaker.record_failure()
+
+    assert breaker.allow()
+    assert breaker.state is CircuitState.CLOSED
+
+
+def test_circuit_breakers__are_independent_per_endpoint_class() -> None:
+    """Test that a failing execute endpoint does not block catalog listings."""
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=10.0, clock=_Clock())
+
+    breakers.for_request("POST", "/v1/evaluators/execute/e/").record_failure()
+
+    assert breakers["execute"].state is CircuitState.OPEN
+    assert breakers.for_request("GET", "/v1/evaluators").allow()
+    assert not breakers.healthy
+    assert breakers.snapshot()["execute"]["state"] == "open"
+    assert breakers.snapshot()["list"]["state"] == "closed"
+
+
+def test_endpoint_class__classifies_requests() -> None:
+    """Test the endpoint classes used for circuit breaking."""
+    assert endpoint_class("POST", "/v1/evaluators/execute/by-name/") == "execute"
+    assert endpoint_class("GET", "/v1/evaluators?page_size=40") == "list"
+    assert endpoint_class("GET", "/v1/judges") == "judges"
+    assert endpoint_class("POST", "/v1/judges/j/execute/") == "judges"
@@ -0,0 +1,503 @@
+"""Unit tests for the pooled Scorable API connection."""
+
+import asyncio
+import json
+from contextlib import aclosing
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from scorable_mcp.circuit import CircuitBreakers
+from scorable_mcp.ratelimit import RateLimiter
+from scorable_mcp.retry import RetryPolicy
+from scorable_mcp.root_api_client import (
+    CircuitOpenError,
+    ResponseValidationError,
+    ScorableAPIError,
+    ScorableConnection,
+    ScorableEvaluatorRepository,
+    ScorableJudgeRepository,
+    build_evaluation_payload,
+    encode_payload,
+)
+from scorable_mcp.settings import settings
+
+
+def _evaluation_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"result": {"evaluator_name": "Clarity", "score": 0.5}})
+
+
+@pytest.mark.asyncio
+async def test_connection__reuses_single_client_across_requests() -> None:
+    """Test that consecutive requests go through the same pooled client."""
+    connection = ScorableConnection(transport=httpx.MockTransport(_evaluation_handler))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    first_client = connection.client
+    await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+
+    assert connection.client is first_client
+    await connection.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connection__shared_between_repositories_is_not_closed_by_them() -> None:
+    """Test that repositories do not close a connection they were given."""
+    connection = ScorableConnection(transport=httpx.MockTransport(_evaluation_handler))
+    evaluators = ScorableEvaluatorRepository(api_key="key", connection=connection)
+    judges = ScorableJudgeRepository(api_key="key", connection=connection)
+
+    await evaluators.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    await evaluators.aclose()
+    await judges.aclose()
+
+    assert evaluators.connection is judges.connection
+    assert connection.is_open
+
+    await connection.aclose()
+    assert not connection.is_open
+
+
+@pytest.mark.asyncio
+async def test_connection__owned_connection_closed_with_repository() -> None:
+    """Test that a repository closes the connection it created itself."""
+    repository = ScorableEvaluatorRepository(api_key="key")
+    repository.connection = ScorableConnection(transport=httpx.MockTransport(_evaluation_handler))
+
+    await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    assert repository.connection.is_open
+
+    await repository.aclose()
+    assert not repository.connection.is_open
+
+
+def test_connection__pool_limits_from_arguments() -> None:
+    """Test that explicit pool limits override settings."""
+    connection = ScorableConnection(
+        max_connections=7, max_keepalive_connections=3, keepalive_expiry=1.5
+    )
+
+    assert connection.limits.max_connections == 7
+    assert connection.limits.max_keepalive_connections == 3
+    assert connection.limits.keepalive_expiry == 1.5
+
+
+def test_connection__http2_falls_back_without_h2_package() -> None:
+    """Test that HTTP/2 is disabled when the optional h2 dependency is missing."""
+    with patch("scorable_mcp.root_api_client.importlib.util.find_spec", return_value=None):
+        connection = ScorableConnection(http2=True)
+
+    assert connection.http2 is False
+
+
+def test_connection__http2_enabled_when_requested() -> None:
+    """Test that HTTP/2 is kept when h2 is importable."""
+    with patch("scorable_mcp.root_api_client.importlib.util.find_spec", return_value=object()):
+        connection = ScorableConnection(http2=True)
+
+    assert connection.http2 is True
+
+
+@pytest.mark.asyncio
+async def test_run_evaluator_payload__sends_pre_encoded_body_to_each_evaluator() -> None:
+    """Test that one encoded payload is sent unchanged to several evaluators."""
+    seen: list[tuple[str, bytes, str]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.content, request.headers["content-type"]))
+        return _evaluation_handler(request)
+
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+    body = encode_payload(build_evaluation_payload(request="q", response="ä", tags=["t"]))
+
+    await repository.run_evaluator_payload("eval-1", body)
+    await repository.run_evaluator_by_name_payload("Clarity", body)
+    await connection.aclose()
+
+    assert [path for path, _, _ in seen] == [
+        "/v1/evaluators/execute/eval-1/",
+        "/v1/evaluators/execute/by-name/",
+    ]
+    assert all(content == body for _, content, _ in seen)
+    assert all(content_type == "application/json" for _, _, content_type in seen)
+    assert json.loads(body) == {"request": "q", "response": "ä", "tags": ["t"]}
+
+
+def _no_wait_policy(max_retries: int = 2) -> RetryPolicy:
+    return RetryPolicy(
+        max_retries=max_retries, backoff_base=0.0, backoff_max=0.0, retry_after_max=1.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_make_request__retries_transient_failures() -> None:
+    """Test that a GET succeeds after transient errors and a 503."""
+    calls: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("slow", request=request)
+        if len(calls) == 2:  # noqa: PLR2004
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"results": []})
+
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(_handler), retry_policy=_no_wait_policy()
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    assert await repository._make_request("GET", "/v1/evaluators") == {"results": []}
+    assert len(calls) == 3
+    await connection.aclose()
+
+
+@pytest.mark.asyncio
+async def test_make_request__does_not_repeat_executions_that_may_have_run() -> None:
+    """Test that a POST failing with 502 is reported without being sent again."""
+    calls = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(502, json={"detail": "bad gateway"})
+
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(_handler), retry_policy=_no_wait_policy()
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with pytest.raises(ScorableAPIError) as excinfo:
+        await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    await connection.aclose()
+
+    assert excinfo.value.status_code == 502
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_make_request__gives_up_after_max_retries() -> None:
+    """Test that a persistently rate limited request fails after the last retry."""
+    calls = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(429, headers={"Retry-After": "0"}, json={"detail": "slow down"})
+
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(_handler), retry_policy=_no_wait_policy(max_retries=2)
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with pytest.raises(ScorableAPIError) as excinfo:
+        await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    await connection.aclose()
+
+    assert excinfo.value.status_code == 429
+    assert calls == 3
+
+
+@pytest.mark.asyncio
+async def test_make_request__open_circuit_fails_fast() -> None:
+    """Test that repeated server errors open the circuit and later calls skip the API."""
+    calls = 0
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(500, json={"detail": "down"})
+
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(_handler),
+        retry_policy=_no_wait_policy(max_retries=0),
+        breakers=CircuitBreakers(failure_threshold=2, recovery_timeout=60.0),
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    for _ in range(2):
+        with pytest.raises(ScorableAPIError):
+            await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    with pytest.raises(CircuitOpenError) as excinfo:
+        await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    await connection.aclose()
+
+    assert calls == 2
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.endpoint == "execute"
+
+
+@pytest.mark.asyncio
+async def test_make_request__open_circuit_does_not_wait_for_rate_limiter() -> None:
+    """Test that an open circuit fails fast even while the rate limiter is paused."""
+    limiter = RateLimiter(execute_rate=0, execute_burst=1, list_rate=0, list_burst=1)
+    limiter.buckets["execute"].pause(60.0)
+    breakers = CircuitBreakers(failure_threshold=1, recovery_timeout=60.0)
+    breakers["execute"].record_failure()
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(_evaluation_handler),
+        breakers=breakers,
+        rate_limiter=limiter,
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with pytest.raises(CircuitOpenError):
+        await asyncio.wait_for(
+            repository.run_evaluator(evaluator_id="eval-1", request="q", response="a"), 1.0
+        )
+    await connection.aclose()
+
+    assert limiter.stats()["execute"]["acquired"] == 0
+
+
+def _paged_catalog_handler(
+    size: int, seen: list[str], in_flight: list[int], cursor: str = "page"
+) -> httpx.MockTransport:
+    """Serve a catalog of *size* evaluators, paged by number, offset or an opaque token."""
+    active = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal active
+        seen.append(str(request.url.params))
+        active += 1
+        in_flight.append(active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+        params = request.url.params
+        page_size = int(params.get("page_size", params.get("limit", "10")))
+        if cursor == "page":
+            start = (int(params.get("page", "1")) - 1) * page_size
+            next_query = f"page={start // page_size + 2}&page_size={page_size}"
+        elif cursor == "offset":
+            start = int(params.get("offset", "0"))
+            next_query = f"limit={page_size}&offset={start + page_size}"
+        else:
+            start = int(params.get("cursor", "0x0"), 16)
+            next_query = f"cursor={hex(start + page_size)}&page_size={page_size}"
+        results = [
+            {
+                "id": f"eval-{i}",
+                "name": f"Evaluator {i}",
+                "created_at": "2025-01-01T00:00:00Z",
+                "inputs": {},
+            }
+            for i in range(start, min(start + page_size, size))
+        ]
+        next_url = (
+            f"https://api.example.com/v1/evaluators?{next_query}"
+            if start + page_size < size
+            else None
+        )
+        return httpx.Response(200, json={"count": size, "next": next_url, "results": results})
+
+    return httpx.MockTransport(_handler)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor", ["page", "offset"])
+async def test_list_evaluators__prefetches_numbered_pages_in_order(cursor: str) -> None:
+    """Test that predictable pages are fetched concurrently and returned in order."""
+    seen: list[str] = []
+    in_flight: list[int] = []
+    connection = ScorableConnection(transport=_paged_catalog_handler(230, seen, in_flight, cursor))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with patch.object(settings, "catalog_prefetch_pages", 4):
+        evaluators = await repository.list_evaluators(max_count=190)
+    await connection.aclose()
+
+    assert [e.id for e in evaluators] == [f"eval-{i}" for i in range(190)]
+    assert len(seen) == 5  # the first page of 40 items predicts the next 4
+    assert max(in_flight) == 4
+
+
+@pytest.mark.asyncio
+async def test_list_evaluators__prefetch_stops_at_total_count() -> None:
+    """Test that no page beyond the catalog's count is requested."""
+    seen: list[str] = []
+    in_flight: list[int] = []
+    connection = ScorableConnection(transport=_paged_catalog_handler(100, seen, in_flight))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with patch.object(settings, "catalog_prefetch_pages", 8):
+        evaluators = await repository.list_evaluators(max_count=200)
+    await connection.aclose()
+
+    assert len(evaluators) == 100
+    assert len(seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_list_evaluators__opaque_cursor_followed_sequentially() -> None:
+    """Test that pages are fetched one by one when the next link cannot be predicted."""
+    seen: list[str] = []
+    in_flight: list[int] = []
+    connection = ScorableConnection(
+        transport=_paged_catalog_handler(100, seen, in_flight, cursor="opaque")
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with patch.object(settings, "catalog_prefetch_pages", 4):
+        evaluators = await repository.list_evaluators(max_count=100)
+    await connection.aclose()
+
+    assert [e.id for e in evaluators] == [f"eval-{i}" for i in range(100)]
+    assert len(seen) == 3
+    assert max(in_flight) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_evaluators__stopping_early_leaves_later_pages_unfetched() -> None:
+    """Test that the streaming listing only requests the pages that are consumed."""
+    seen: list[str] = []
+    in_flight: list[int] = []
+    connection = ScorableConnection(transport=_paged_catalog_handler(200, seen, in_flight))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    first: list[str] = []
+    async with aclosing(repository.iter_evaluators(max_count=200)) as evaluators:
+        async for evaluator in evaluators:
+            first.append(evaluator.id)
+            if len(first) == 5:
+                break
+    await connection.aclose()
+
+    assert first == [f"eval-{i}" for i in range(5)]
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_evaluators__revalidates_pages_with_conditional_requests() -> None:
+    """Test that unchanged pages are revalidated and their parsed items reused."""
+    version = "v1"
+    conditional: list[str | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == f'"{version}"':
+            return httpx.Response(304, headers={"ETag": f'"{version}"'})
+        results = [
+            {"id": f"eval-{version}", "name": "Clarity", "created_at": "2025-01-01", "inputs": {}}
+        ]
+        return httpx.Response(
+            200, json={"next": None, "results": results}, headers={"ETag": f'"{version}"'}
+        )
+
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    first = await repository.list_evaluators()
+    second = await repository.list_evaluators()
+    version = "v2"
+    third = await repository.list_evaluators()
+    await connection.aclose()
+
+    assert conditional == [None, '"v1"', '"v1"']
+    assert second[0] is first[0]
+    assert third[0].id == "eval-v2"
+    assert repository.pages_fetched == 2
+    assert repository.pages_not_modified == 1
+    assert connection.pages.value("evaluators", "fetched") == 2
+    assert connection.pages.value("evaluators", "not_modified") == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"result": {"evaluator_name": "Clarity", "score": 0.5, "cost": 1}},
+        {"evaluator_name": "Clarity", "score": 0.5, "cost": 1},
+    ],
+)
+async def test_run_evaluator__validates_response_bytes(body: dict[str, object]) -> None:
+    """Test that execution results are validated from the raw body, enveloped or bare."""
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json=body))
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    result = await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    await connection.aclose()
+
+    assert (result.evaluator_name, result.score, result.cost) == ("Clarity", 0.5, 1)
+
+
+@pytest.mark.asyncio
+async def test_list_evaluators__validates_page_bytes_into_models() -> None:
+    """Test that listing pages map the API's nested fields and report missing ones by index."""
+    results: list[dict[str, object]] = [
+        {
+            "id": "eval-1",
+            "name": "Clarity",
+            "created_at": "2025-01-01T00:00:00Z",
+            "objective": {"intent": "Be clear", "version": 2},
+            "inputs": {"request": {"type": "string"}},
+            "unknown": True,
+        }
+    ]
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"count": len(results), "next": None, "results": results})
+
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    (evaluator,) = await repository.list_evaluators()
+    assert (evaluator.id, evaluator.intent) == ("eval-1", "Be clear")
+    assert evaluator.inputs["request"].type == "string"
+
+    results.append({"id": "eval-2", "created_at": "2025-01-01T00:00:00Z", "inputs": {}})
+    with pytest.raises(
+        ResponseValidationError, match="Evaluator at index 1 missing required field: 'name'"
+    ):
+        await repository.list_evaluators()
+    await connection.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        (b'{"results": [', "Response body is not valid JSON"),
+        (b"[{", "Response body is not valid JSON"),
+        (b'"page"', "Expected response to be a dict or list, got str"),
+    ],
+)
+async def test_list_evaluators__reports_malformed_page_bodies(body: bytes, message: str) -> None:
+    """Test that a truncated body is reported as invalid JSON, not as a wrong type."""
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    )
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    with pytest.raises(ResponseValidationError, match=message):
+        await repository.list_evaluators()
+    await connection.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_judges__validates_page_bytes_into_models() -> None:
+    """Test that a judge's intent becomes its description and nested evaluators are kept."""
+    judge = {
+        "id": "judge-1",
+        "name": "Judge",
+        "created_at": "2025-01-01T00:00:00Z",
+        "intent": "Check answers",
+        "evaluators": [{"id": "eval-1", "name": "Clarity", "intent": "Be clear"}],
+    }
+    connection = ScorableConnection(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"next": None, "results": [judge]})
+        )
+    )
+    repository = ScorableJudgeRepository(api_key="key", connection=connection)
+
+    (info,) = await repository.list_judges()
+    await connection.aclose()
+
+    assert info.description == "Check answers"
+    assert [e.id for e in info.evaluators] == ["eval-1"]
@@ -1,23 +1,30 @@
 """Unit tests for the EvaluatorService module."""
 
+import asyncio
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from scorable_mcp.evaluator import EvaluatorService
+from scorable_mcp.persistent_cache import SQLiteCacheStore
+from scorable_mcp.result_cache import ResultCache
 from scorable_mcp.root_api_client import (
     ResponseValidationError,
     ScorableAPIError,
 )
 from scorable_mcp.schema import (
     ArrayInputItem,
+    BatchEvaluationItem,
+    EvaluationBatchRequest,
     EvaluationRequest,
     EvaluationRequestByName,
     EvaluationResponse,
     EvaluatorInfo,
     MessageTurn,
+    MultiEvaluationRequest,
     RequiredInput,
 )
 
@@ -350,3 +357,421 @@ async def test_run_evaluation_by_name__forwards_new_fields(mock_api_client: Magi
         system_prompt="prompt",
         turns=None,
     )
+
+
+@pytest.mark.asyncio
+async def test_fetch_evaluators__serves_repeated_calls_from_catalog_cache(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that consecutive listings reuse the cached catalog."""
+    service = EvaluatorService()
+    mock_api_client.list_evaluators.return_value = [
+        EvaluatorInfo(
+            id="eval-1",
+            name="Evaluator 1",
+            created_at="2024-01-01T00:00:00Z",
+            intent=None,
+            inputs={},
+        )
+    ]
+
+    first = await service.fetch_evaluators()
+    second = await service.fetch_evaluators()
+
+    assert first == second
+    mock_api_client.list_evaluators.assert_called_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_get_evaluator_by_id__uses_cached_index(mock_api_client: MagicMock) -> None:
+    """Test that repeated lookups by ID and name do not refetch the catalog."""
+    service = EvaluatorService()
+    mock_api_client.list_evaluators.return_value = [
+        EvaluatorInfo(
+            id=f"eval-{i}",
+            name=f"Evaluator {i}",
+            created_at="2024-01-01T00:00:00Z",
+            intent=None,
+            inputs={},
+        )
+        for i in range(3)
+    ]
+
+    first = await service.get_evaluator_by_id("eval-1")
+    by_name = await service.get_evaluator_by_name("evaluator 2")
+    missing = await service.get_evaluator_by_id("eval-9")
+
+    assert first is not None and first.id == "eval-1"
+    assert by_name is not None and by_name.id == "eval-2"
+    assert missing is None
+    mock_api_client.list_evaluators.assert_called_once()
+
+
+def _catalog(*names: str) -> list[EvaluatorInfo]:
+    return [
+        EvaluatorInfo(
+            id=f"eval-{i}",
+            name=name,
+            created_at="2024-01-01T00:00:00Z",
+            intent=None,
+            inputs={},
+        )
+        for i, name in enumerate(names)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation_by_name__resolves_name_locally(mock_api_client: MagicMock) -> None:
+    """Test that a known name is executed through the by-id endpoint."""
+    mock_api_client.list_evaluators.return_value = _catalog("Clarity", "Relevance")
+    mock_api_client.run_evaluator.return_value = EvaluationResponse(
+        evaluator_name="Relevance", score=0.7
+    )
+
+    with patch("scorable_mcp.evaluator.settings.resolve_evaluator_names_locally", True):
+        service = EvaluatorService()
+        result = await service.run_evaluation_by_name(
+            EvaluationRequestByName(evaluator_name="Relevance", request="Hi", response="Hello")
+        )
+
+    assert result.score == 0.7
+    assert mock_api_client.run_evaluator.call_args.kwargs["evaluator_id"] == "eval-1"
+    mock_api_client.run_evaluator_by_name.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation_by_name__unknown_name_is_negatively_cached(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that unknown names fall back to the by-name endpoint without re-reading the catalog."""
+    mock_api_client.list_evaluators.return_value = _catalog("Clarity")
+    mock_api_client.run_evaluator_by_name.return_value = EvaluationResponse(
+        evaluator_name="Private", score=0.5
+    )
+    request = EvaluationRequestByName(evaluator_name="Private", request="Hi", response="Hello")
+
+    with (
+        patch("scorable_mcp.evaluator.settings.resolve_evaluator_names_locally", True),
+        patch("scorable_mcp.evaluator.settings.catalog_cache_ttl", 0),
+    ):
+        service = EvaluatorService()
+        await service.run_evaluation_by_name(request)
+        await service.run_evaluation_by_name(request)
+
+    assert mock_api_client.run_evaluator_by_name.call_count == 2
+    mock_api_client.list_evaluators.assert_called_once()
+    mock_api_client.run_evaluator.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation_by_name__falls_back_when_resolved_evaluator_is_gone(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that a stale catalog entry falls back to the by-name endpoint."""
+    mock_api_client.list_evaluators.return_value = _catalog("Clarity")
+    mock_api_client.run_evaluator.side_effect = ScorableAPIError(404, "Evaluator not found")
+    mock_api_client.run_evaluator_by_name.return_value = EvaluationResponse(
+        evaluator_name="Clarity", score=0.9
+    )
+
+    with patch("scorable_mcp.evaluator.settings.resolve_evaluator_names_locally", True):
+        service = EvaluatorService()
+        result = await service.run_evaluation_by_name(
+            EvaluationRequestByName(evaluator_name="Clarity", request="Hi", response="Hello")
+        )
+
+    assert result.score == 0.9
+    mock_api_client.run_evaluator_by_name.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation__serves_identical_request_from_result_cache(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that an identical evaluation is answered from the result cache."""
+    service = EvaluatorService(result_cache=ResultCache(ttl=60, max_entries=10, max_bytes=10_000))
+    mock_api_client.run_evaluator.return_value = EvaluationResponse(
+        evaluator_name="Test", score=0.9
+    )
+    request = EvaluationRequest(evaluator_id="eval-123", request="Hello", response="Hi")
+
+    first = await service.run_evaluation(request)
+    second = await service.run_evaluation(request)
+
+    assert first.cached is None
+    assert second.cached is True
+    assert second.score == 0.9
+    mock_api_client.run_evaluator.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_warm__restores_evaluator_catalog_from_store(
+    mock_api_client: MagicMock, tmp_path: Path
+) -> None:
+    """Test that a catalog persisted by one service instance warms the next one."""
+    mock_api_client.list_evaluators.return_value = _catalog("Clarity", "Relevance")
+    store = SQLiteCacheStore(tmp_path / "cache.db", max_entries=10, max_bytes=1_000_000)
+    await store.open()
+    await EvaluatorService(store=store).fetch_evaluators()
+    await store.aclose()
+
+    mock_api_client.list_evaluators.reset_mock()
+    store = SQLiteCacheStore(tmp_path / "cache.db", max_entries=10, max_bytes=1_000_000)
+    await store.open()
+    service = EvaluatorService(store=store)
+    assert await service.warm() == 1
+
+    evaluator = await service.get_evaluator_by_name("Relevance")
+    await store.aclose()
+
+    assert evaluator is not None
+    assert evaluator.id == "eval-1"
+    mock_api_client.list_evaluators.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation__coalesces_concurrent_identical_requests(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that identical evaluations in flight at the same time hit the API once."""
+    release = asyncio.Event()
+
+    async def _slow_run(**_kwargs: object) -> EvaluationResponse:
+        await release.wait()
+        return EvaluationResponse(evaluator_name="Test", score=0.9)
+
+    mock_api_client.run_evaluator.side_effect = _slow_run
+    service = EvaluatorService()
+    request = EvaluationRequest(evaluator_id="eval-123", request="Hello", response="Hi")
+    tagged = request.model_copy(update={"tags": ["other"]})
+
+    waiters = [asyncio.create_task(service.run_evaluation(r)) for r in (request, request, tagged)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert [r.score for r in results] == [0.9, 0.9, 0.9]
+    assert mock_api_client.run_evaluator.await_count == 2
+    assert service.stats() == {"inflight": 0, "coalesced": 1, "catalog_coalesced": 0}
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation_batch__returns_results_and_errors_in_input_order(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that batch items run independently and keep their order."""
+
+    async def _run(evaluator_id: str, **_kwargs: object) -> EvaluationResponse:
+        if evaluator_id == "broken":
+            raise ScorableAPIError(500, "boom")
+        return EvaluationResponse(evaluator_name=evaluator_id, score=0.5)
+
+    mock_api_client.run_evaluator.side_effect = _run
+    mock_api_client.run_evaluator_by_name.return_value = EvaluationResponse(
+        evaluator_name="Clarity", score=0.8
+    )
+    service = EvaluatorService()
+    batch = EvaluationBatchRequest(
+        items=[
+            BatchEvaluationItem(evaluator_id="eval-1", request="q1", response="a1"),
+            BatchEvaluationItem(evaluator_id="broken", request="q2", response="a2"),
+            BatchEvaluationItem(evaluator_name="Clarity", request="q3", response="a3", tags=["t"]),
+        ]
+    )
+
+    response = await service.run_evaluation_batch(batch)
+
+    assert [r.index for r in response.results] == [0, 1, 2]
+    assert response.results[0].result is not None
+    assert response.results[0].result.evaluator_name == "eval-1"
+    assert response.results[1].result is None
+    assert "boom" in (response.results[1].error or "")
+    assert response.results[2].result is not None
+    assert response.results[2].result.score == 0.8
+    assert (response.succeeded, response.failed) == (2, 1)
+    assert mock_api_client.run_evaluator_by_name.call_args.kwargs["tags"] == ["t"]
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation_batch__bounds_concurrency(mock_api_client: MagicMock) -> None:
+    """Test that no more than ``batch_max_concurrency`` items run at once."""
+    running = 0
+    peak = 0
+
+    async def _run(**_kwargs: object) -> EvaluationResponse:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return EvaluationResponse(evaluator_name="Test", score=1.0)
+
+    mock_api_client.run_evaluator.side_effect = _run
+    batch = EvaluationBatchRequest(
+        items=[
+            BatchEvaluationItem(evaluator_id="eval-1", request=f"q{i}", response="a")
+            for i in range(10)
+        ]
+    )
+
+    with patch("scorable_mcp.evaluator.settings.batch_max_concurrency", 3):
+        response = await EvaluatorService().run_evaluation_batch(batch)
+
+    assert response.succeeded == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_run_evaluation_batch__rejects_oversized_batch(mock_api_client: MagicMock) -> None:
+    """Test that batches above ``batch_max_items`` are refused up front."""
+    batch = EvaluationBatchRequest(
+        items=[BatchEvaluationItem(evaluator_id="eval-1", request="q", response="a")] * 3
+    )
+
+    with (
+        patch("scorable_mcp.evaluator.settings.batch_max_items", 2),
+        pytest.raises(RuntimeError, match="exceeds the limit"),
+    ):
+        await EvaluatorService().run_evaluation_batch(batch)
+
+    mock_api_client.run_evaluator.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_evaluations__fans_out_one_encoded_payload(mock_api_client: MagicMock) -> None:
+    """Test that every evaluator receives the same encoded body and costs are summed."""
+
+    async def _run(evaluator_id: str, body: bytes) -> EvaluationResponse:
+        if evaluator_id == "broken":
+            raise ScorableAPIError(500, "boom")
+        return EvaluationResponse(evaluator_name=evaluator_id, score=0.5, cost=0.25)
+
+    mock_api_client.run_evaluator_payload = AsyncMock(side_effect=_run)
+    mock_api_client.run_evaluator_by_name_payload = AsyncMock(
+        return_value=EvaluationResponse(evaluator_name="Clarity", score=0.9, cost=0.5)
+    )
+    request = MultiEvaluationRequest(
+        evaluator_ids=["eval-1", "broken"],
+        evaluator_names=["Clarity"],
+        request="Hello",
+        response="Hi",
+    )
+
+    response = await EvaluatorService().run_evaluations(request)
+
+    assert [o.evaluator for o in response.results] == ["eval-1", "broken", "Clarity"]
+    assert [o.result.score if o.result else None for o in response.results] == [0.5, None, 0.9]
+    assert "boom" in (response.results[1].error or "")
+    assert response.total_cost == 0.75
+    assert response.wall_time >= 0
+    bodies = {call.args[1] for call in mock_api_client.run_evaluator_payload.call_args_list}
+    bodies.add(mock_api_client.run_evaluator_by_name_payload.call_args.args[1])
+    assert len(bodies) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_evaluations__reuses_cached_results(mock_api_client: MagicMock) -> None:
+    """Test that evaluators with a cached result are not executed again."""
+    mock_api_client.run_evaluator_payload = AsyncMock(
+        return_value=EvaluationResponse(evaluator_name="Test", score=0.5, cost=1.0)
+    )
+    service = EvaluatorService(result_cache=ResultCache(ttl=60, max_entries=10, max_bytes=10_000))
+    request = MultiEvaluationRequest(evaluator_ids=["eval-1"], request="Hello", response="Hi")
+
+    await service.run_evaluations(request)
+    second = await service.run_evaluations(request)
+
+    assert second.results[0].result is not None
+    assert second.results[0].result.cached is True
+    assert second.total_cost == 0.0
+    mock_api_client.run_evaluator_payload.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_evaluations__joins_identical_evaluation_in_flight(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that a fan-out target shares the upstream call of an identical single evaluation."""
+    release = asyncio.Event()
+
+    async def _run(**_kwargs: object) -> EvaluationResponse:
+        await release.wait()
+        return EvaluationResponse(evaluator_name="Test", score=0.5, cost=1.0)
+
+    mock_api_client.run_evaluator.side_effect = _run
+    mock_api_client.run_evaluator_payload = AsyncMock()
+    service = EvaluatorService()
+
+    single = asyncio.create_task(
+        service.run_evaluation(
+            EvaluationRequest(evaluator_id="eval-1", request="Hello", response="Hi")
+        )
+    )
+    await asyncio.sleep(0)
+    fan_out = asyncio.create_task(
+        service.run_evaluations(
+            MultiEvaluationRequest(evaluator_ids=["eval-1"], request="Hello", response="Hi")
+        )
+    )
+    await asyncio.sleep(0.01)
+    release.set()
+    _, response = await asyncio.gather(single, fan_out)
+
+    assert response.results[0].result is not None
+    assert response.results[0].result.score == 0.5
+    mock_api_client.run_evaluator_payload.assert_not_called()
+    assert service.stats()["coalesced"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_evaluators__limit_stops_the_stream_early(mock_api_client: MagicMock) -> None:
+    """Test that a limited listing stops consuming the catalog once it has enough items."""
+    consumed: list[str] = []
+
+    async def _iter_evaluators(max_count: int | None = None) -> AsyncGenerator[EvaluatorInfo]:
+        for i in range(100):
+            consumed.append(f"eval-{i}")
+            yield EvaluatorInfo(
+                id=f"eval-{i}", name=f"Evaluator {i}", created_at="2024-01-01T00:00:00Z", inputs={}
+            )
+
+    mock_api_client.iter_evaluators = _iter_evaluators
+    service = EvaluatorService()
+
+    response = await service.list_evaluators(limit=3)
+
+    assert [e.id for e in response.evaluators] == ["eval-0", "eval-1", "eval-2"]
+    assert len(consumed) == 3
+    mock_api_client.list_evaluators.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_iter_evaluators__replays_cached_catalog(mock_api_client: MagicMock) -> None:
+    """Test that streaming a cached catalog does not call the API again."""
+    mock_api_client.list_evaluators.return_value = [
+        EvaluatorInfo(id="eval-1", name="Evaluator 1", created_at="2024-01-01T00:00:00Z", inputs={})
+    ]
+    mock_api_client.iter_evaluators = MagicMock()
+    service = EvaluatorService()
+    await service.fetch_evaluators()
+
+    streamed = [evaluator async for evaluator in service.iter_evaluators()]
+
+    assert [e.id for e in streamed] == ["eval-1"]
+    mock_api_client.iter_evaluators.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_iter_evaluators__wraps_api_errors(mock_api_client: MagicMock) -> None:
+    """Test that streaming reports API failures like the list methods do."""
+
+    async def _iter_evaluators(max_count: int | None = None) -> AsyncGenerator[EvaluatorInfo]:
+        raise ScorableAPIError(status_code=500, detail="Internal server error")
+        yield  # pragma: no cover
+
+    mock_api_client.iter_evaluators = _iter_evaluators
+    service = EvaluatorService()
+
+    with pytest.raises(RuntimeError, match="Cannot fetch evaluators"):
+        async for _evaluator in service.iter_evaluators():
+            pass
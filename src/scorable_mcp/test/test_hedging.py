@@ -0,0 +1,170 @@
+"""Unit tests for hedged evaluator executions."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from scorable_mcp.hedging import HedgePolicy
+from scorable_mcp.latency import LatencyTracker
+from scorable_mcp.retry import RetryBudget
+from scorable_mcp.root_api_client import ScorableConnection, ScorableEvaluatorRepository
+
+
+def _policy(
+    samples: float | None = 0.01, budget: RetryBudget | None = None, count: int = 20
+) -> HedgePolicy:
+    tracker = LatencyTracker(window=64, min_samples=20)
+    if samples is not None:
+        for _ in range(count):
+            tracker.record("eval-1", samples)
+    return HedgePolicy(
+        tracker=tracker,
+        percentile=0.95,
+        min_delay=0.01,
+        budget=budget or RetryBudget(ratio=1.0, min_per_second=0.0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_hedge_policy__fast_call_is_not_hedged() -> None:
+    """Test that a call answering before the threshold is sent once."""
+    policy = _policy()
+    calls = 0
+
+    async def _call() -> str:
+        nonlocal calls
+        calls += 1
+        return "done"
+
+    assert await policy.run("eval-1", _call) == "done"
+    assert calls == 1
+    assert policy.stats() == {"hedged": 0, "hedge_wins": 0}
+
+
+@pytest.mark.asyncio
+async def test_hedge_policy__slow_call_is_raced_and_loser_cancelled() -> None:
+    """Test that a slow first attempt is hedged and cancelled once the hedge answers."""
+    policy = _policy()
+    cancelled = asyncio.Event()
+    attempts = 0
+
+    async def _call() -> str:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return f"attempt-{attempts}"
+
+    result = await asyncio.wait_for(policy.run("eval-1", _call), 1.0)
+
+    assert result == "attempt-2"
+    assert cancelled.is_set()
+    assert policy.stats() == {"hedged": 1, "hedge_wins": 1}
+
+
+@pytest.mark.asyncio
+async def test_hedge_policy__no_hedge_without_latency_history() -> None:
+    """Test that calls are not hedged before the evaluator's latency is known."""
+    policy = _policy(samples=None)
+    attempts = 0
+
+    async def _call() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    assert await policy.run("eval-1", _call) == "done"
+    assert attempts == 1
+    assert policy.tracker.count("eval-1") == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_policy__budget_caps_hedges() -> None:
+    """Test that an exhausted hedge budget lets slow calls run alone."""
+    policy = _policy(budget=RetryBudget(ratio=0.0, min_per_second=0.0))
+    attempts = 0
+
+    async def _call() -> str:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.05)
+        return "done"
+
+    assert await policy.run("eval-1", _call) == "done"
+    assert attempts == 1
+    assert policy.budget.exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_policy__reports_first_error_when_both_attempts_fail() -> None:
+    """Test that the original error surfaces when the hedge fails as well."""
+    policy = _policy()
+    attempts = 0
+
+    async def _call() -> str:
+        nonlocal attempts
+        attempts += 1
+        attempt = attempts
+        await asyncio.sleep(0.05 if attempt == 1 else 0.0)
+        raise RuntimeError(f"attempt-{attempt}")
+
+    with pytest.raises(RuntimeError, match="attempt-1"):
+        await policy.run("eval-1", _call)
+
+
+@pytest.mark.asyncio
+async def test_hedge_policy__cancelled_caller_cancels_the_attempt() -> None:
+    """Test that cancelling the caller while waiting for the hedge delay cancels the attempt."""
+    policy = _policy(samples=10.0)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def _call() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "done"
+
+    caller = asyncio.create_task(policy.run("eval-1", _call))
+    await started.wait()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    assert cancelled.is_set()
+    assert policy.stats() == {"hedged": 0, "hedge_wins": 0}
+
+
+@pytest.mark.asyncio
+async def test_run_evaluator__hedges_slow_execution() -> None:
+    """Test that the repository sends a second execution when the first is slow."""
+    requests = 0
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests
+        requests += 1
+        if requests == 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json={"result": {"evaluator_name": "Clarity", "score": 0.5}})
+
+    policy = _policy()
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler), hedging=policy)
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    result = await asyncio.wait_for(
+        repository.run_evaluator(evaluator_id="eval-1", request="q", response="a"), 1.0
+    )
+    await connection.aclose()
+
+    assert result.score == 0.5
+    assert requests == 2
+    assert policy.stats()["hedge_wins"] == 1
@@ -1,14 +1,28 @@
 """Unit tests for the JudgeService module."""
 
+import asyncio
 import logging
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from contextlib import aclosing
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+from mcp.types import RequestParams
 
+from scorable_mcp.core import RootMCPServerCore
 from scorable_mcp.judge import JudgeService
+from scorable_mcp.progress import progress_scope
+from scorable_mcp.result_cache import ResultCache
 from scorable_mcp.root_api_client import ResponseValidationError, ScorableAPIError
-from scorable_mcp.schema import JudgeEvaluatorResult, RunJudgeRequest, RunJudgeResponse
+from scorable_mcp.schema import (
+    EvaluationResponse,
+    JudgeEvaluatorResult,
+    JudgeInfo,
+    RunJudgeRequest,
+    RunJudgeResponse,
+)
 
 logger = logging.getLogger("test_judge")
 
@@ -142,3 +156,278 @@ async def test_run_judge__returns_result_with_null_score_and_justification(
 
     assert result.evaluator_results[0].score is None
     assert result.evaluator_results[0].justification is None
+
+
+@pytest.mark.asyncio
+async def test_run_judge__serves_identical_request_from_result_cache(
+    mock_api_client: MagicMock,
+) -> None:
+    """Test that an identical judge run is answered from the result cache."""
+    service = JudgeService(result_cache=ResultCache(ttl=60, max_entries=10, max_bytes=10_000))
+    mock_api_client.run_judge.return_value = RunJudgeResponse(
+        evaluator_results=[JudgeEvaluatorResult(evaluator_name="Test", score=0.5, justification="")]
+    )
+    request = RunJudgeRequest(judge_id="judge-123", request="Hello", response="Hi")
+
+    await service.run_judge(request)
+    result = await service.run_judge(request)
+
+    assert result.cached is True
+    mock_api_client.run_judge.assert_called_once()
+
+
+def _judge(*evaluator_ids: str) -> JudgeInfo:
+    return JudgeInfo(
+        id="judge-1",
+        name="Judge",
+        created_at="2024-01-01",
+        description=None,
+        evaluators=[
+            JudgeInfo.NestedEvaluatorInfo(id=evaluator_id, name=f"Name {evaluator_id}")
+            for evaluator_id in evaluator_ids
+        ],
+    )
+
+
+@pytest.fixture
+def mock_evaluator_client() -> Generator[MagicMock]:
+    """Mock the evaluator repository used by the parallel judge mode."""
+    with patch("scorable_mcp.judge.ScorableEvaluatorRepository") as mock_client_class:
+        mock_client = MagicMock()
+        mock_client.run_evaluator_payload = AsyncMock()
+        mock_client_class.return_value = mock_client
+        yield mock_client
+
+
+@pytest.mark.asyncio
+async def test_run_judge__parallel_mode_assembles_results_in_judge_order(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that parallel mode runs the nested evaluators and keeps the judge's order."""
+    mock_api_client.list_judges.return_value = [_judge("e-1", "e-2", "e-3")]
+    delays = {"e-1": 0.03, "e-2": 0.0, "e-3": 0.01}
+
+    async def _run(evaluator_id: str, body: bytes) -> EvaluationResponse:
+        await asyncio.sleep(delays[evaluator_id])
+        return EvaluationResponse(evaluator_name=f"Name {evaluator_id}", score=0.5)
+
+    mock_evaluator_client.run_evaluator_payload.side_effect = _run
+    request = RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+
+    with patch("scorable_mcp.judge.settings.judge_execution_mode", "parallel"):
+        result = await JudgeService().run_judge(request)
+
+    assert [r.evaluator_name for r in result.evaluator_results] == [
+        "Name e-1",
+        "Name e-2",
+        "Name e-3",
+    ]
+    mock_api_client.run_judge.assert_not_called()
+    bodies = {c.args[1] for c in mock_evaluator_client.run_evaluator_payload.call_args_list}
+    assert len(bodies) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_judge__parallel_mode_falls_back_for_unknown_judge(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that a judge missing from the catalog runs through the judge endpoint."""
+    mock_api_client.list_judges.return_value = []
+    mock_api_client.run_judge.return_value = RunJudgeResponse(evaluator_results=[])
+
+    with patch("scorable_mcp.judge.settings.judge_execution_mode", "parallel"):
+        await JudgeService().run_judge(
+            RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+        )
+
+    mock_api_client.run_judge.assert_awaited_once()
+    mock_evaluator_client.run_evaluator_payload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_judge__parallel_mode_fails_when_an_evaluator_fails(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that a failing evaluator fails the assembled judge result."""
+    mock_api_client.list_judges.return_value = [_judge("e-1", "e-2")]
+    mock_evaluator_client.run_evaluator_payload.side_effect = ScorableAPIError(502, "bad gateway")
+
+    with (
+        patch("scorable_mcp.judge.settings.judge_execution_mode", "parallel"),
+        pytest.raises(RuntimeError, match="bad gateway"),
+    ):
+        await JudgeService().run_judge(
+            RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+        )
+
+
+@pytest.mark.asyncio
+async def test_run_judge__parallel_failure_cancels_remaining_evaluators(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that evaluators still running upstream are cancelled once the judge fails."""
+    mock_api_client.list_judges.return_value = [_judge("broken", "slow")]
+    cancelled = asyncio.Event()
+
+    async def _run(evaluator_id: str, body: bytes) -> EvaluationResponse:
+        if evaluator_id == "broken":
+            raise ScorableAPIError(502, "bad gateway")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return EvaluationResponse(evaluator_name="Slow", score=0.5)
+
+    mock_evaluator_client.run_evaluator_payload.side_effect = _run
+
+    with (
+        patch("scorable_mcp.judge.settings.judge_execution_mode", "parallel"),
+        pytest.raises(RuntimeError, match="bad gateway"),
+    ):
+        await JudgeService().run_judge(
+            RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+        )
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stream_judge__closing_early_cancels_remaining_evaluators(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that a consumer stopping after the first result cancels the others."""
+    mock_api_client.list_judges.return_value = [_judge("fast", "slow")]
+    cancelled = asyncio.Event()
+
+    async def _run(evaluator_id: str, body: bytes) -> EvaluationResponse:
+        if evaluator_id == "slow":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return EvaluationResponse(evaluator_name=f"Name {evaluator_id}", score=0.5)
+
+    mock_evaluator_client.run_evaluator_payload.side_effect = _run
+    request = RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+
+    async with aclosing(JudgeService().stream_judge(request)) as results:
+        async for result in results:
+            assert result.evaluator_name == "Name fast"
+            break
+
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_stream_judge__yields_results_as_they_finish(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that partial results arrive in completion order, including failures."""
+    mock_api_client.list_judges.return_value = [_judge("slow", "fast", "broken")]
+
+    async def _run(evaluator_id: str, body: bytes) -> EvaluationResponse:
+        if evaluator_id == "broken":
+            await asyncio.sleep(0.01)
+            raise ScorableAPIError(500, "boom")
+        await asyncio.sleep(0.05 if evaluator_id == "slow" else 0.0)
+        return EvaluationResponse(evaluator_name=f"Name {evaluator_id}", score=0.5)
+
+    mock_evaluator_client.run_evaluator_payload.side_effect = _run
+    request = RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+
+    streamed = [r async for r in JudgeService().stream_judge(request)]
+
+    assert [r.evaluator_name for r in streamed] == ["Name fast", "Name broken", "Name slow"]
+    assert streamed[1].score is None
+    assert "boom" in (streamed[1].justification or "")
+
+
+@pytest.mark.asyncio
+async def test_run_judge__parallel_mode_reports_each_evaluator_as_progress(
+    mock_api_client: MagicMock, mock_evaluator_client: MagicMock
+) -> None:
+    """Test that every finished evaluator reaches the client as a progress notification."""
+    mock_api_client.list_judges.return_value = [_judge("slow", "fast")]
+
+    async def _run(evaluator_id: str, body: bytes) -> EvaluationResponse:
+        await asyncio.sleep(0.02 if evaluator_id == "slow" else 0.0)
+        return EvaluationResponse(evaluator_name=f"Name {evaluator_id}", score=0.5)
+
+    mock_evaluator_client.run_evaluator_payload.side_effect = _run
+    notifications: list[tuple[float, float | None, str | None]] = []
+
+    async def _reporter(progress: float, total: float | None, message: str | None) -> None:
+        notifications.append((progress, total, message))
+
+    with (
+        patch("scorable_mcp.judge.settings.judge_execution_mode", "parallel"),
+        progress_scope(_reporter),
+    ):
+        result = await JudgeService().run_judge(
+            RunJudgeRequest(judge_id="judge-1", request="q", response="a")
+        )
+
+    assert len(result.evaluator_results) == 2
+    assert [(p, t) for p, t, _ in notifications] == [(1, 2), (2, 2)]
+    first = JudgeEvaluatorResult.model_validate_json(notifications[0][2] or "")
+    assert first.evaluator_name == "Name fast"
+
+
+@pytest.mark.asyncio
+async def test_core_progress_reporter__uses_the_request_progress_token() -> None:
+    """Test that progress goes to the MCP session only when the client sent a token."""
+    core = RootMCPServerCore()
+    session = MagicMock()
+    session.send_progress_notification = AsyncMock()
+
+    def _context(token: str | None) -> RequestContext:
+        return RequestContext(
+            request_id=7,
+            meta=RequestParams.Meta(progressToken=token),
+            session=session,
+            lifespan_context=None,
+        )
+
+    token = request_ctx.set(_context(None))
+    assert core._progress_reporter() is None
+    request_ctx.reset(token)
+
+    token = request_ctx.set(_context("tok"))
+    reporter = core._progress_reporter()
+    request_ctx.reset(token)
+    assert reporter is not None
+    await reporter(1, 2, "done")
+
+    session.send_progress_notification.assert_awaited_once_with(
+        "tok", 1, 2, "done", related_request_id="7"
+    )
+    await core.aclose()
+
+
+@pytest.mark.asyncio
+async def test_list_judges__limit_stops_the_stream_early(mock_api_client: MagicMock) -> None:
+    """Test that a limited judge listing stops consuming the catalog once it has enough."""
+    consumed = 0
+
+    async def _iter_judges(max_count: int | None = None) -> AsyncGenerator[JudgeInfo]:
+        nonlocal consumed
+        for i in range(50):
+            consumed += 1
+            yield JudgeInfo(
+                id=f"judge-{i}",
+                name=f"Judge {i}",
+                created_at="2024-01-01T00:00:00Z",
+                description=None,
+                evaluators=[],
+            )
+
+    mock_api_client.iter_judges = _iter_judges
+    service = JudgeService()
+
+    response = await service.list_judges(limit=2)
+
+    assert [j.id for j in response.judges] == ["judge-0", "judge-1"]
+    assert consumed == 2
+    mock_api_client.list_judges.assert_not_called()
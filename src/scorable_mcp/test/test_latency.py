@@ -0,0 +1,159 @@
+"""Unit tests for latency tracking and adaptive timeouts."""
+
+import httpx
+import pytest
+
+from scorable_mcp.latency import AdaptiveTimeouts, LatencyTracker
+from scorable_mcp.root_api_client import ScorableConnection, ScorableEvaluatorRepository
+
+
+def _timeouts(enabled: bool = True) -> AdaptiveTimeouts:
+    return AdaptiveTimeouts(
+        tracker=LatencyTracker(window=100, min_samples=5),
+        default=30.0,
+        connect=5.0,
+        quantile=0.8,
+        factor=3.0,
+        floor=1.0,
+        ceiling=60.0,
+        enabled=enabled,
+    )
+
+
+def test_latency_tracker__percentile_needs_enough_samples() -> None:
+    """Test that no percentile is reported until the window holds enough samples."""
+    tracker = LatencyTracker(window=10, min_samples=3)
+    tracker.record("a", 1.0)
+    tracker.record("a", 2.0)
+    assert tracker.percentile("a", 0.5) is None
+
+    tracker.record("a", 3.0)
+    assert tracker.percentile("a", 0.5) == 2.0
+    assert tracker.percentile("a", 1.0) == 3.0
+    assert tracker.percentile("b", 0.5) is None
+
+
+def test_latency_tracker__window_forgets_old_samples() -> None:
+    """Test that only the most recent samples of a key are kept."""
+    tracker = LatencyTracker(window=3, min_samples=1)
+    for seconds in (10.0, 1.0, 1.0, 1.0):
+        tracker.record("a", seconds)
+
+    assert tracker.count("a") == 3
+    assert tracker.percentile("a", 1.0) == 1.0
+
+
+def test_adaptive_timeouts__default_until_enough_samples() -> None:
+    """Test that the static timeout applies while an endpoint's latency is unknown."""
+    timeouts = _timeouts()
+    for _ in range(4):
+        timeouts.record("GET /v1/evaluators", 0.5)
+
+    assert timeouts.timeout("GET /v1/evaluators") == 30.0
+    assert timeouts.snapshot() == {}
+
+
+def test_adaptive_timeouts__follow_each_endpoint_within_bounds() -> None:
+    """Test that fast and slow endpoints get their own clamped timeouts."""
+    timeouts = _timeouts()
+    for _ in range(5):
+        timeouts.record("GET /v1/evaluators", 0.1)
+        timeouts.record("POST /v1/judges/judge-1/execute/", 8.0)
+        timeouts.record("POST /v1/judges/judge-2/execute/", 50.0)
+
+    assert timeouts.timeout("GET /v1/evaluators") == 1.0
+    assert timeouts.timeout("POST /v1/judges/judge-1/execute/") == 24.0
+    assert timeouts.timeout("POST /v1/judges/judge-2/execute/") == 60.0
+
+    timeout = timeouts.for_request("GET /v1/evaluators")
+    assert timeout.read == 1.0
+    assert timeout.connect == 1.0
+
+
+def test_adaptive_timeouts__disabled_keeps_static_timeout() -> None:
+    """Test that nothing adapts when adaptive timeouts are turned off."""
+    timeouts = _timeouts(enabled=False)
+    for _ in range(5):
+        timeouts.record("GET /v1/evaluators", 0.1)
+
+    assert timeouts.timeout("GET /v1/evaluators") == 30.0
+    assert timeouts.tracker.count("GET /v1/evaluators") == 0
+
+
+@pytest.mark.asyncio
+async def test_make_request__uses_adaptive_timeout_of_endpoint() -> None:
+    """Test that requests record their latency and then carry the adapted timeout."""
+    seen: list[dict[str, float | None]] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"result": {"evaluator_name": "Clarity", "score": 0.5}})
+
+    timeouts = _timeouts()
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler), timeouts=timeouts)
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    for _ in range(6):
+        await repository.run_evaluator(evaluator_id="eval-1", request="q", response="a")
+    await connection.aclose()
+
+    assert seen[0]["read"] == 30.0
+    assert seen[-1]["read"] == 1.0
+    assert list(timeouts.snapshot()) == ["POST /v1/evaluators/execute/eval-1/"]
+
+
+def test_adaptive_timeouts__need_enough_samples_for_the_quantile() -> None:
+    """Test that a high percentile is not taken from a handful of samples."""
+    timeouts = AdaptiveTimeouts(
+        tracker=LatencyTracker(window=1000, min_samples=20), default=30.0, connect=5.0
+    )
+    for _ in range(999):
+        timeouts.record("POST /v1/judges/judge-1/execute/", 0.4)
+    assert timeouts.min_samples == 1000
+    assert timeouts.timeout("POST /v1/judges/judge-1/execute/") == 30.0
+
+    timeouts.record("POST /v1/judges/judge-1/execute/", 0.4)
+    assert timeouts.timeout("POST /v1/judges/judge-1/execute/") == pytest.approx(1.2)
+
+
+def test_adaptive_timeouts__sustained_latency_increase_is_accepted() -> None:
+    """Test that an endpoint that became slower stops timing out and adapts upwards."""
+    key = "POST /v1/evaluators/execute/eval-1/"
+    timeouts = _timeouts()
+    for _ in range(5):
+        timeouts.record(key, 0.5)
+    assert timeouts.timeout(key) == 1.5
+
+    # The endpoint now takes 4s: the first request is cut at the learned 1.5s
+    timeouts.record_timeout(key, 1.5)
+    applied = []
+    for _ in range(10):
+        applied.append(timeouts.timeout(key))
+        timeouts.record(key, 4.0)
+
+    assert min(applied) > 4.0
+    assert timeouts.timeout(key) == 12.0
+
+
+@pytest.mark.asyncio
+async def test_make_request__timed_out_request_relaxes_the_timeout() -> None:
+    """Test that a timeout is recorded and the retry gets the static timeout."""
+    seen: list[float | None] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"]["read"])
+        if len(seen) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json=[])
+
+    timeouts = _timeouts()
+    for _ in range(5):
+        timeouts.record("GET /v1/evaluators", 0.1)
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler), timeouts=timeouts)
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    await repository._make_request("GET", "/v1/evaluators")
+    await connection.aclose()
+
+    assert seen == [1.0, 30.0]
+    assert timeouts.tracker.count("GET /v1/evaluators") == 7
@@ -0,0 +1,46 @@
+"""Unit tests for deferred log payload previews."""
+
+import logging
+
+import pytest
+
+from scorable_mcp.logpreview import Preview
+
+
+def test_preview__short_values_render_unchanged() -> None:
+    """Test that payloads within the limit are rendered as they are."""
+    assert str(Preview(b'{"score": 0.5}')) == '{"score": 0.5}'
+    assert str(Preview({"score": 0.5})) == "{'score': 0.5}"
+    assert str(Preview("text")) == "text"
+
+
+def test_preview__long_values_are_truncated() -> None:
+    """Test that long payloads are cut and report their full size."""
+    assert str(Preview("x" * 50, limit=10)) == "xxxxxxxxxx... (50 chars)"
+    assert str(Preview(b"y" * 50, limit=10)) == "yyyyyyyyyy... (50 bytes)"
+
+
+def test_preview__cut_multibyte_character_is_replaced() -> None:
+    """Test that cutting bytes inside a UTF-8 character does not raise."""
+    assert str(Preview("é".encode() * 10, limit=3)) == "é�... (20 bytes)"
+
+
+def test_preview__not_rendered_when_level_disabled(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a disabled log level never renders the payload."""
+    rendered = 0
+
+    class _Payload:
+        def __str__(self) -> str:
+            nonlocal rendered
+            rendered += 1
+            return "payload"
+
+    logger = logging.getLogger("scorable_mcp.test.logpreview")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        logger.debug("Raw response: %s", Preview(_Payload()))
+    assert rendered == 0
+
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        logger.debug("Raw response: %s", Preview(_Payload()))
+    assert rendered > 0
+    assert "Raw response: payload" in caplog.text
@@ -0,0 +1,88 @@
+"""Unit tests for the Prometheus metrics registry."""
+
+import httpx
+import pytest
+
+from scorable_mcp.metrics import MetricsRegistry
+from scorable_mcp.root_api_client import ScorableConnection, ScorableEvaluatorRepository
+
+
+def test_counter__renders_labelled_series() -> None:
+    """Test the exposition of a counter with escaped label values."""
+    registry = MetricsRegistry()
+    calls = registry.counter("tool_calls_total", "Tool calls", ("tool", "outcome"))
+    calls.inc("run_judge", "ok")
+    calls.inc("run_judge", "ok", amount=2)
+    calls.inc('odd"name', "error")
+
+    assert registry.render().splitlines() == [
+        "# HELP tool_calls_total Tool calls",
+        "# TYPE tool_calls_total counter",
+        'tool_calls_total{tool="run_judge",outcome="ok"} 3',
+        'tool_calls_total{tool="odd\\"name",outcome="error"} 1',
+    ]
+
+
+def test_histogram__renders_cumulative_buckets() -> None:
+    """Test that observations land in cumulative buckets with sum and count."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("endpoint",), buckets=(0.1, 1.0))
+    latency.observe(0.05, "list")
+    latency.observe(0.5, "list")
+    latency.observe(5.0, "list")
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{endpoint="list",le="0.1"} 1',
+        'latency_seconds_bucket{endpoint="list",le="1"} 2',
+        'latency_seconds_bucket{endpoint="list",le="+Inf"} 3',
+        'latency_seconds_sum{endpoint="list"} 5.55',
+        'latency_seconds_count{endpoint="list"} 3',
+    ]
+
+
+def test_gauge__callback_is_read_at_scrape_time() -> None:
+    """Test that callback metrics report the value current at render time."""
+    registry = MetricsRegistry()
+    depth = {"execute": 0}
+    registry.gauge(
+        "queue_depth",
+        "Queue depth",
+        ("bucket",),
+        callback=lambda: [(("execute",), depth["execute"])],
+    )
+
+    depth["execute"] = 4
+
+    assert 'queue_depth{bucket="execute"} 4' in registry.render()
+
+
+def test_registry__returns_existing_metric_and_checks_labels() -> None:
+    """Test that metrics are shared by name and label counts are enforced."""
+    registry = MetricsRegistry()
+    first = registry.gauge("in_flight", "In flight", ("tool",))
+
+    assert registry.gauge("in_flight", "In flight", ("tool",)) is first
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("in_flight", "In flight", ("tool",))
+    with pytest.raises(ValueError, match="expects labels"):
+        first.inc()
+
+
+@pytest.mark.asyncio
+async def test_make_request__records_upstream_latency_by_endpoint_and_status() -> None:
+    """Test that every upstream response is timed under its endpoint class and status."""
+    statuses = iter([200, 404])
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"detail": "x"})
+
+    connection = ScorableConnection(transport=httpx.MockTransport(_handler))
+    repository = ScorableEvaluatorRepository(api_key="key", connection=connection)
+
+    await repository._make_request("GET", "/v1/evaluators")
+    with pytest.raises(Exception, match="x"):
+        await repository._make_request("GET", "/v1/evaluators")
+    await connection.aclose()
+
+    assert connection.request_duration.count("GET", "list", "200") == 1
+    assert connection.request_duration.count("GET", "list", "404") == 1
@@ -0,0 +1,124 @@
+"""Unit tests for the SQLite-backed persistent cache."""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scorable_mcp.persistent_cache import SQLiteCacheStore
+from scorable_mcp.result_cache import ResultCache
+from scorable_mcp.schema import EvaluationResponse
+
+
+def _store(path: Path, **kwargs: int) -> SQLiteCacheStore:
+    options = {"max_entries": 100, "max_bytes": 1_000_000} | kwargs
+    return SQLiteCacheStore(path / "cache.db", flush_interval=0.01, **options)
+
+
+def _result(score: float) -> EvaluationResponse:
+    return EvaluationResponse(
+        evaluator_name="Clarity",
+        score=score,
+        justification="ok",
+        execution_log_id=None,
+        cost=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_store__persists_results_across_restarts(tmp_path: Path) -> None:
+    """Test that queued writes are flushed on close and loaded after reopening."""
+    store = _store(tmp_path)
+    await store.open()
+    store.put_result("k1", "EvaluationResponse", '{"a": 1}', time.time() + 60)
+    store.put_result("k2", "EvaluationResponse", '{"a": 2}', time.time() - 1)
+    store.put_catalog("evaluators", "null", "[]", 123.0)
+    await store.aclose()
+
+    reopened = _store(tmp_path)
+    await reopened.open()
+    results = await reopened.load_results(limit=10)
+    catalogs = await reopened.load_catalogs("evaluators")
+    await reopened.aclose()
+
+    assert [row.key for row in results] == ["k1"]
+    assert [(c.key, c.value, c.fetched_at) for c in catalogs] == [("null", "[]", 123.0)]
+
+
+@pytest.mark.asyncio
+async def test_store__evicts_oldest_results_over_limits(tmp_path: Path) -> None:
+    """Test that the store keeps at most ``max_entries`` results."""
+    store = _store(tmp_path, max_entries=2)
+    await store.open()
+    for i in range(4):
+        store.put_result(f"k{i}", "EvaluationResponse", "{}", time.time() + 60)
+    await store.aclose()
+
+    reopened = _store(tmp_path, max_entries=2)
+    await reopened.open()
+    keys = [row.key for row in await reopened.load_results(limit=10)]
+    await reopened.aclose()
+
+    assert len(keys) == 2
+
+
+@pytest.mark.asyncio
+async def test_store__writer_survives_unexpected_errors(tmp_path: Path) -> None:
+    """Test that a batch failing with a non-SQLite error does not stop later writes."""
+    store = _store(tmp_path)
+    await store.open()
+    write_batch = store._write_batch
+    calls = 0
+
+    def _flaky(batch: list) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise TypeError("unexpected")
+        write_batch(batch)
+
+    with patch.object(store, "_write_batch", _flaky):
+        store.put_result("lost", "EvaluationResponse", "{}", time.time() + 60)
+        await asyncio.sleep(0.05)
+        store.put_result("kept", "EvaluationResponse", "{}", time.time() + 60)
+        await store.aclose()
+
+    reopened = _store(tmp_path)
+    await reopened.open()
+    keys = [row.key for row in await reopened.load_results(limit=10)]
+    await reopened.aclose()
+
+    assert keys == ["kept"]
+
+
+@pytest.mark.asyncio
+async def test_store__writes_are_ignored_before_open(tmp_path: Path) -> None:
+    """Test that an unopened store silently drops writes."""
+    store = _store(tmp_path)
+    store.put_result("k", "EvaluationResponse", "{}", time.time() + 60)
+
+    assert await store.load_results(limit=10) == []
+    await store.aclose()
+
+
+@pytest.mark.asyncio
+async def test_result_cache__warms_from_store(tmp_path: Path) -> None:
+    """Test that results written through to disk are restored by a new cache."""
+    store = _store(tmp_path)
+    await store.open()
+    cache = ResultCache(ttl=60, max_entries=10, max_bytes=1_000_000, store=store)
+    cache.set("key", _result(0.9))
+    await store.aclose()
+
+    store = _store(tmp_path)
+    await store.open()
+    warmed = ResultCache(ttl=60, max_entries=10, max_bytes=1_000_000, store=store)
+    assert await warmed.warm() == 1
+    await store.aclose()
+
+    restored = warmed.get("key", EvaluationResponse)
+    assert restored is not None
+    assert restored.score == 0.9
+    assert restored.cached is True
@@ -0,0 +1,181 @@
+"""Unit tests for the client-side rate limiter."""
+
+import asyncio
+
+import pytest
+
+from scorable_mcp.ratelimit import RateLimiter, TokenBucket, parse_rate_limit_headers
+from scorable_mcp.session import session_scope
+
+
+class _FakeTime:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def _bucket(time: _FakeTime, rate: float = 10.0, burst: int = 2) -> TokenBucket:
+    return TokenBucket("execute", rate, burst, clock=time, sleep=time.sleep)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__bursts_then_paces_requests() -> None:
+    """Test that a burst goes out at once and later requests follow the rate."""
+    time = _FakeTime()
+    bucket = _bucket(time)
+
+    waits = [await bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2:] == pytest.approx([0.1, 0.1])
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__serves_waiters_in_arrival_order() -> None:
+    """Test FIFO fairness and queue depth reporting."""
+    time = _FakeTime()
+    bucket = _bucket(time, burst=1)
+    order: list[int] = []
+
+    async def _request(i: int) -> None:
+        await bucket.acquire()
+        order.append(i)
+
+    tasks = [asyncio.create_task(_request(i)) for i in range(5)]
+    await asyncio.sleep(0)
+    assert bucket.stats()["queue_depth"] == 4
+    await asyncio.gather(*tasks)
+
+    assert order == [0, 1, 2, 3, 4]
+    assert bucket.stats()["queue_depth"] == 0
+    assert bucket.stats()["max_wait"] == pytest.approx(0.4)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__sessions_take_turns() -> None:
+    """Test that a bursty session does not starve a session arriving later."""
+    time = _FakeTime()
+    bucket = _bucket(time, burst=1)
+    await bucket.acquire("busy")
+    order: list[str] = []
+
+    async def _request(session: str) -> None:
+        await bucket.acquire(session)
+        order.append(session)
+
+    tasks = [asyncio.create_task(_request("busy")) for _ in range(4)]
+    await asyncio.sleep(0)
+    tasks += [asyncio.create_task(_request("quiet")) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert bucket.stats()["sessions_waiting"] == 2
+    await asyncio.gather(*tasks)
+
+    assert order == ["busy", "quiet", "busy", "quiet", "busy", "busy"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__session_defaults_to_current_session() -> None:
+    """Test that waiters are grouped by the session of the running tool call."""
+    time = _FakeTime()
+    bucket = _bucket(time, burst=1)
+    await bucket.acquire()
+    order: list[str] = []
+
+    async def _request(session: str) -> None:
+        with session_scope(session):
+            await bucket.acquire()
+        order.append(session)
+
+    tasks = [asyncio.create_task(_request(s)) for s in ["a", "a", "a", "b"]]
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "b", "a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__cancelled_waiter_is_skipped() -> None:
+    """Test that a cancelled waiter neither blocks the queue nor loses a token."""
+    time = _FakeTime()
+    bucket = _bucket(time, burst=1)
+    await bucket.acquire()
+
+    first = asyncio.create_task(bucket.acquire())
+    second = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == pytest.approx(0.1)
+    assert first.cancelled()
+    assert bucket.stats()["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__unlimited_only_waits_for_pauses() -> None:
+    """Test that an unlimited bucket passes requests but honors API pauses."""
+    time = _FakeTime()
+    bucket = _bucket(time, rate=0.0)
+
+    assert [await bucket.acquire() for _ in range(50)] == [0.0] * 50
+
+    bucket.on_throttled(retry_after=3.0)
+    assert await bucket.acquire() == pytest.approx(3.0)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__throttling_halves_rate_and_recovers() -> None:
+    """Test the multiplicative decrease on 429 and gradual recovery."""
+    time = _FakeTime()
+    bucket = _bucket(time, rate=10.0)
+
+    bucket.on_throttled(retry_after=None)
+    assert bucket.rate == 5.0
+    assert await bucket.acquire() == pytest.approx(1.0)
+
+    for _ in range(20):
+        bucket.on_success()
+    assert bucket.rate == 10.0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket__exhausted_quota_header_pauses_until_reset() -> None:
+    """Test that RateLimit-Remaining: 0 holds requests until the reset."""
+    time = _FakeTime()
+    bucket = _bucket(time)
+
+    bucket.observe_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"})
+
+    assert await bucket.acquire() == pytest.approx(2.0)
+
+
+def test_parse_rate_limit_headers__delay_and_timestamp() -> None:
+    """Test both header spellings and reset formats."""
+    assert parse_rate_limit_headers({"RateLimit-Remaining": "5", "RateLimit-Reset": "7"}) == (
+        5,
+        7.0,
+    )
+    assert parse_rate_limit_headers(
+        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1700000010"}, now=1700000000.0
+    ) == (0, 10.0)
+    assert parse_rate_limit_headers({}) == (None, None)
+
+
+def test_rate_limiter__separates_executions_from_listings() -> None:
+    """Test that POSTs and GETs use different buckets."""
+    limiter = RateLimiter(execute_rate=5, execute_burst=5, list_rate=1, list_burst=1)
+
+    assert limiter.bucket_for("POST").name == "execute"
+    assert limiter.bucket_for("GET").name == "list"
+
+    limiter.observe(limiter.bucket_for("POST"), 429, {"Retry-After": "1"})
+    assert limiter.stats()["execute"]["throttled"] == 1
+    assert limiter.stats()["list"]["throttled"] == 0
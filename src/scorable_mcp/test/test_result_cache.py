@@ -0,0 +1,103 @@
+"""Unit tests for the evaluation result cache."""
+
+from unittest.mock import patch
+
+from scorable_mcp.result_cache import ResultCache, evaluation_cache_key, fingerprint
+from scorable_mcp.schema import (
+    EvaluationRequest,
+    EvaluationResponse,
+    MessageTurn,
+    RunJudgeResponse,
+)
+
+
+def _response(score: float = 0.5, justification: str = "ok") -> EvaluationResponse:
+    return EvaluationResponse(evaluator_name="Clarity", score=score, justification=justification)
+
+
+def test_fingerprint__is_independent_of_key_order() -> None:
+    """Test that canonicalization makes dict ordering irrelevant."""
+    assert fingerprint("evaluator", "e-1", {"a": 1, "b": [1, 2]}) == fingerprint(
+        "evaluator", "e-1", {"b": [1, 2], "a": 1}
+    )
+    assert fingerprint("evaluator", "e-1", {"a": 1}) != fingerprint("judge", "e-1", {"a": 1})
+
+
+def test_evaluation_cache_key__ignores_tracking_metadata() -> None:
+    """Test that tags, user_id and session_id do not change the key."""
+    plain = EvaluationRequest(evaluator_id="e-1", request="q", response="a")
+    tagged = EvaluationRequest(
+        evaluator_id="e-1", request="q", response="a", tags=["x"], user_id="u", session_id="s"
+    )
+    other = EvaluationRequest(evaluator_id="e-1", request="q", response="b")
+
+    assert evaluation_cache_key("evaluator", "e-1", plain) == evaluation_cache_key(
+        "evaluator", "e-1", tagged
+    )
+    assert evaluation_cache_key("evaluator", "e-1", plain) != evaluation_cache_key(
+        "evaluator", "e-1", other
+    )
+
+
+def test_evaluation_cache_key__includes_turns() -> None:
+    """Test that multi-turn conversations are part of the key."""
+    first = EvaluationRequest(evaluator_id="e-1", turns=[MessageTurn(role="user", content="a")])
+    second = EvaluationRequest(evaluator_id="e-1", turns=[MessageTurn(role="user", content="b")])
+
+    assert evaluation_cache_key("evaluator", "e-1", first) != evaluation_cache_key(
+        "evaluator", "e-1", second
+    )
+
+
+def test_result_cache__hit_is_marked_cached_and_counted() -> None:
+    """Test hits, misses and the cached marker."""
+    cache = ResultCache(ttl=60, max_entries=10, max_bytes=10_000)
+
+    assert cache.get("k", EvaluationResponse) is None
+    cache.set("k", _response())
+    hit = cache.get("k", EvaluationResponse)
+
+    assert hit is not None and hit.cached is True
+    assert cache.get("k", RunJudgeResponse) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_result_cache__expires_entries_after_ttl() -> None:
+    """Test TTL based expiry."""
+    cache = ResultCache(ttl=60, max_entries=10, max_bytes=10_000)
+    with patch("scorable_mcp.result_cache.time.monotonic", return_value=100.0):
+        cache.set("k", _response())
+    with patch("scorable_mcp.result_cache.time.monotonic", return_value=161.0):
+        assert cache.get("k", EvaluationResponse) is None
+    assert len(cache) == 0
+
+
+def test_result_cache__evicts_least_recently_used_entry() -> None:
+    """Test LRU eviction when the entry limit is exceeded."""
+    cache = ResultCache(ttl=60, max_entries=2, max_bytes=10_000)
+    cache.set("a", _response(0.1))
+    cache.set("b", _response(0.2))
+    cache.get("a", EvaluationResponse)
+    cache.set("c", _response(0.3))
+
+    assert cache.get("b", EvaluationResponse) is None
+    assert cache.get("a", EvaluationResponse) is not None
+    assert cache.get("c", EvaluationResponse) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_result_cache__respects_memory_budget() -> None:
+    """Test that the byte budget bounds the cache and oversized results are skipped."""
+    small = _response(justification="x" * 10)
+    size = len(small.model_dump_json())
+    cache = ResultCache(ttl=60, max_entries=100, max_bytes=size * 2)
+
+    cache.set("a", small)
+    cache.set("b", small)
+    cache.set("c", small)
+    cache.set("huge", _response(justification="x" * size * 3))
+
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] <= size * 2
+    assert cache.get("huge", EvaluationResponse) is None
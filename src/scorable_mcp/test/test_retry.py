@@ -0,0 +1,114 @@
+"""Unit tests for the retry policy and budget."""
+
+import random
+
+import httpx
+import pytest
+
+from scorable_mcp.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _policy(max_retries: int = 3, budget: RetryBudget | None = None) -> RetryPolicy:
+    return RetryPolicy(
+        max_retries=max_retries,
+        backoff_base=1.0,
+        backoff_max=4.0,
+        retry_after_max=10.0,
+        budget=budget,
+        rng=random.Random(0),
+    )
+
+
+@pytest.mark.parametrize("status_code", [429, 502, 503, 504])
+def test_retry_policy__idempotent_requests_retry_transient_statuses(status_code: int) -> None:
+    """Test that GET requests are retried on every transient status."""
+    assert _policy().is_retryable("GET", status_code=status_code)
+
+
+@pytest.mark.parametrize(("status_code", "expected"), [(429, True), (503, True), (502, False)])
+def test_retry_policy__post_retries_only_unprocessed_statuses(
+    status_code: int, expected: bool
+) -> None:
+    """Test that executions are only repeated when the API cannot have run them."""
+    assert _policy().is_retryable("POST", status_code=status_code) is expected
+
+
+def test_retry_policy__post_retries_only_connection_errors() -> None:
+    """Test that a POST is retried when it was never sent, but not after a read timeout."""
+    policy = _policy()
+
+    assert policy.is_retryable("POST", error=httpx.ConnectError("refused"))
+    assert not policy.is_retryable("POST", error=httpx.ReadTimeout("slow"))
+    assert policy.is_retryable("GET", error=httpx.ReadTimeout("slow"))
+
+
+def test_retry_policy__never_retries_client_errors() -> None:
+    """Test that 4xx responses other than 429 are reported immediately."""
+    assert _policy().next_delay("GET", 0, status_code=404) is None
+
+
+def test_retry_policy__backoff_is_capped_full_jitter() -> None:
+    """Test that delays stay within the exponential ceiling and the maximum."""
+    policy = _policy()
+
+    for attempt, ceiling in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 4.0)]:
+        delays = [policy.backoff(attempt) for _ in range(50)]
+        assert all(0.0 <= d <= ceiling for d in delays)
+
+
+def test_retry_policy__stops_after_max_retries() -> None:
+    """Test that a request is retried at most max_retries times."""
+    policy = _policy(max_retries=2)
+
+    assert policy.next_delay("GET", 1, status_code=503) is not None
+    assert policy.next_delay("GET", 2, status_code=503) is None
+
+
+def test_retry_policy__honors_retry_after() -> None:
+    """Test that Retry-After overrides backoff and overly long waits fail fast."""
+    policy = _policy()
+
+    assert policy.next_delay("POST", 0, status_code=429, retry_after=3.0) == 3.0
+    assert policy.next_delay("POST", 0, status_code=429, retry_after=60.0) is None
+
+
+def test_retry_budget__caps_retries_to_a_fraction_of_requests() -> None:
+    """Test that retries beyond the budget are refused until the window moves on."""
+    clock = _Clock()
+    budget = RetryBudget(ratio=0.1, min_per_second=0.0, window=10.0, clock=clock)
+    for _ in range(20):
+        budget.record_request()
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    assert budget.exhausted == 1
+
+    clock.now = 11.0
+    for _ in range(10):
+        budget.record_request()
+    assert budget.try_acquire()
+
+
+def test_retry_budget__exhausted_budget_disables_policy_retries() -> None:
+    """Test that the policy gives up once the shared budget is spent."""
+    budget = RetryBudget(ratio=0.0, min_per_second=0.1, window=10.0, clock=_Clock())
+    policy = _policy(budget=budget)
+
+    assert policy.next_delay("GET", 0, status_code=503) is not None
+    assert policy.next_delay("GET", 0, status_code=503) is None
+
+
+def test_parse_retry_after__seconds_and_http_date() -> None:
+    """Test both Retry-After formats and malformed values."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=10.0) == 20.0
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:30 GMT", now=60.0) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
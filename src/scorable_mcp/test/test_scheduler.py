@@ -0,0 +1,211 @@
+"""Unit tests for the fair tool-call scheduler."""
+
+import asyncio
+import json
+
+import pytest
+
+from scorable_mcp.core import RootMCPServerCore
+from scorable_mcp.scheduler import FairScheduler, SchedulerFullError
+from scorable_mcp.session import session_scope
+
+
+class _Calls:
+    """Tool calls that block until released and record their start order."""
+
+    def __init__(self, scheduler: FairScheduler):
+        self.scheduler = scheduler
+        self.started: list[str] = []
+        self.release = asyncio.Event()
+
+    async def run(self, label: str, session: str, cost: float = 1.0, width: int = 1) -> None:
+        async with self.scheduler.slot(cost=cost, session=session, width=width):
+            self.started.append(label)
+            await self.release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler__caps_global_and_per_session_concurrency() -> None:
+    """Test that neither the global nor the per-session cap is exceeded."""
+    scheduler = FairScheduler(max_concurrency=3, session_max_concurrency=2, max_queue=10)
+    calls = _Calls(scheduler)
+
+    tasks = [asyncio.create_task(calls.run(f"a{i}", "a")) for i in range(3)]
+    tasks += [asyncio.create_task(calls.run(f"b{i}", "b")) for i in range(2)]
+    await _settle()
+
+    assert calls.started == ["a0", "a1", "b0"]
+    assert scheduler.stats()["running"] == 3
+    assert scheduler.stats()["queued"] == 2
+
+    calls.release.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler__wide_calls_hold_one_slot_per_upstream_execution() -> None:
+    """Test that a wide call counts its concurrent executions and is not overtaken."""
+    scheduler = FairScheduler(max_concurrency=4, session_max_concurrency=0, max_queue=10)
+    calls = _Calls(scheduler)
+
+    running = asyncio.create_task(calls.run("single", "a"))
+    await _settle()
+    batch = asyncio.create_task(calls.run("batch", "b", width=4))
+    await _settle()
+    narrow = asyncio.create_task(calls.run("narrow", "c"))
+    await _settle()
+
+    assert calls.started == ["single"]
+    assert scheduler.stats()["running"] == 1
+    assert scheduler.stats()["queued"] == 2
+
+    calls.release.set()
+    await asyncio.gather(running, batch, narrow)
+    assert calls.started == ["single", "batch", "narrow"]
+    assert scheduler.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler__width_is_capped_by_the_limits() -> None:
+    """Test that a call wider than the caps still runs, holding every slot it may."""
+    scheduler = FairScheduler(max_concurrency=4, session_max_concurrency=2, max_queue=10)
+
+    async with scheduler.slot(session="a", width=16):
+        assert scheduler.stats()["running"] == 2
+
+
+@pytest.mark.asyncio
+async def test_scheduler__interleaves_sessions_fairly() -> None:
+    """Test that a session queuing many calls does not delay a later session's calls."""
+    scheduler = FairScheduler(max_concurrency=1, session_max_concurrency=0, max_queue=10)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def _run(label: str, session: str) -> None:
+        async with scheduler.slot(session=session):
+            order.append(label)
+            await gate.wait()
+
+    blocker = asyncio.create_task(_run("first", "a"))
+    await _settle()
+    tasks = [asyncio.create_task(_run(f"a{i}", "a")) for i in range(3)]
+    await _settle()
+    tasks += [asyncio.create_task(_run(f"b{i}", "b")) for i in range(2)]
+    await _settle()
+
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order == ["first", "b0", "a0", "b1", "a1", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler__weights_by_cost_and_session_weight() -> None:
+    """Test that an expensive call waits behind cheap calls of other sessions."""
+    scheduler = FairScheduler(max_concurrency=1, session_max_concurrency=0, max_queue=10)
+    scheduler.set_weight("vip", 4.0)
+    order: list[str] = []
+    gate = asyncio.Event()
+
+    async def _run(label: str, session: str, cost: float) -> None:
+        async with scheduler.slot(cost=cost, session=session):
+            order.append(label)
+            await gate.wait()
+
+    blocker = asyncio.create_task(_run("first", "other", 1))
+    await _settle()
+    tasks = [
+        asyncio.create_task(_run("batch-1", "batch", 10)),
+        asyncio.create_task(_run("batch-2", "batch", 10)),
+        asyncio.create_task(_run("vip-1", "vip", 4)),
+        asyncio.create_task(_run("vip-2", "vip", 4)),
+    ]
+    await _settle()
+    gate.set()
+    await asyncio.gather(blocker, *tasks)
+
+    assert order == ["first", "batch-1", "vip-1", "vip-2", "batch-2"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler__rejects_when_queue_is_full() -> None:
+    """Test that calls beyond the queue limit fail immediately with a clear error."""
+    scheduler = FairScheduler(max_concurrency=1, session_max_concurrency=0, max_queue=1)
+    calls = _Calls(scheduler)
+    running = asyncio.create_task(calls.run("running", "a"))
+    queued = asyncio.create_task(calls.run("queued", "a"))
+    await _settle()
+
+    with pytest.raises(SchedulerFullError, match="retry later"):
+        await calls.run("rejected", "b")
+
+    assert scheduler.stats()["rejected"] == 1
+    calls.release.set()
+    await asyncio.gather(running, queued)
+    assert calls.started == ["running", "queued"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler__cancelled_waiter_frees_its_place() -> None:
+    """Test that a call cancelled while waiting does not hold a slot or a queue place."""
+    scheduler = FairScheduler(max_concurrency=1, session_max_concurrency=0, max_queue=1)
+    calls = _Calls(scheduler)
+    running = asyncio.create_task(calls.run("running", "a"))
+    waiting = asyncio.create_task(calls.run("cancelled", "a"))
+    await _settle()
+
+    waiting.cancel()
+    await asyncio.gather(waiting, return_exceptions=True)
+    later = asyncio.create_task(calls.run("later", "b"))
+    await _settle()
+    calls.release.set()
+    await asyncio.gather(running, later)
+
+    assert calls.started == ["running", "later"]
+    assert scheduler.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler__uses_current_session_and_can_be_disabled() -> None:
+    """Test the session default and that a zero cap disables scheduling."""
+    scheduler = FairScheduler(max_concurrency=2, session_max_concurrency=1, max_queue=10)
+    with session_scope("s"):
+        async with scheduler.slot():
+            assert scheduler.stats()["sessions_active"] == 1
+
+    disabled = FairScheduler(max_concurrency=0, session_max_concurrency=1, max_queue=0)
+    async with disabled.slot(), disabled.slot():
+        assert disabled.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_core_call_tool__reports_rejection_as_tool_error() -> None:
+    """Test that a saturated server answers tool calls with a clear error."""
+    core = RootMCPServerCore()
+    core.scheduler = FairScheduler(max_concurrency=1, session_max_concurrency=0, max_queue=0)
+
+    async with core.scheduler.slot(session="other"):
+        result = await core.call_tool("list_evaluators", {})
+
+    assert "Server is busy" in json.loads(result[0].text)["error"]
+    await core.aclose()
+
+
+@pytest.mark.asyncio
+async def test_core_call_tool__batch_takes_a_slot_per_concurrent_evaluation() -> None:
+    """Test that a batch waits for as many free slots as evaluations it runs at once."""
+    core = RootMCPServerCore()
+    core.scheduler = FairScheduler(max_concurrency=4, session_max_concurrency=0, max_queue=0)
+    item = {"evaluator_id": "eval-1", "request": "q", "response": "a"}
+
+    async with core.scheduler.slot(session="other"):
+        result = await core.call_tool("run_evaluation_batch", {"items": [item] * 4})
+
+    assert "Server is busy" in json.loads(result[0].text)["error"]
+    await core.aclose()
@@ -5,11 +5,14 @@ from pydantic import ValidationError
 
 from scorable_mcp.schema import (
     BaseEvaluationRequest,
+    BatchEvaluationItem,
+    EvaluationBatchRequest,
     EvaluationRequest,
     EvaluationRequestByName,
     EvaluationResponse,
     JudgeEvaluatorResult,
     MessageTurn,
+    MultiEvaluationRequest,
     RunJudgeRequest,
 )
 
@@ -342,3 +345,34 @@ def test_evaluation_response__ignores_extra_api_fields() -> None:
     )
     assert result.evaluator_name == "Test"
     assert not hasattr(result, "some_future_field")
+
+
+# ---------------------------------------------------------------------------
+# Batch evaluation
+# ---------------------------------------------------------------------------
+
+
+def test_batch_evaluation_item__accepts_id_or_name() -> None:
+    by_id = BatchEvaluationItem(evaluator_id="e-1", request="q", response="a")
+    by_name = BatchEvaluationItem(evaluator_name="Clarity", request="q", response="a")
+    assert by_id.evaluator_name is None
+    assert by_name.evaluator_id is None
+
+
+@pytest.mark.parametrize(
+    "reference",
+    [{}, {"evaluator_id": "e-1", "evaluator_name": "Clarity"}],
+)
+def test_batch_evaluation_item__requires_exactly_one_reference(reference: dict[str, str]) -> None:
+    with pytest.raises(ValidationError, match="exactly one"):
+        BatchEvaluationItem(request="q", response="a", **reference)
+
+
+def test_evaluation_batch_request__rejects_empty_batch() -> None:
+    with pytest.raises(ValidationError):
+        EvaluationBatchRequest(items=[])
+
+
+def test_multi_evaluation_request__requires_an_evaluator() -> None:
+    with pytest.raises(ValidationError, match="at least one evaluator"):
+        MultiEvaluationRequest(request="q", response="a")
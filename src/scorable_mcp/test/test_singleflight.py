@@ -0,0 +1,106 @@
+"""Unit tests for in-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from scorable_mcp.schema import EvaluationRequest
+from scorable_mcp.singleflight import SingleFlight, request_key
+
+
+class _Upstream:
+    """Slow fake upstream call that counts invocations."""
+
+    def __init__(self, result: str = "ok", error: Exception | None = None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_singleflight__concurrent_calls_share_one_upstream_call() -> None:
+    """Test that identical concurrent calls are coalesced."""
+    group: SingleFlight[str, str] = SingleFlight("test")
+    upstream = _Upstream()
+
+    waiters = [asyncio.create_task(group.do("key", upstream)) for _ in range(5)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+
+    assert await asyncio.gather(*waiters) == ["ok"] * 5
+    assert upstream.calls == 1
+    assert group.coalesced == 4
+    assert len(group) == 0
+
+
+@pytest.mark.asyncio
+async def test_singleflight__error_is_delivered_to_every_caller() -> None:
+    """Test that a failing shared call fails all of its waiters."""
+    group: SingleFlight[str, str] = SingleFlight("test")
+    upstream = _Upstream(error=RuntimeError("boom"))
+
+    waiters = [asyncio.create_task(group.do("key", upstream)) for _ in range(3)]
+    await asyncio.sleep(0)
+    upstream.release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert upstream.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_singleflight__cancelled_caller_does_not_cancel_shared_call() -> None:
+    """Test that one caller giving up leaves the call running for the others."""
+    group: SingleFlight[str, str] = SingleFlight("test")
+    upstream = _Upstream()
+
+    first = asyncio.create_task(group.do("key", upstream))
+    second = asyncio.create_task(group.do("key", upstream))
+    await asyncio.sleep(0)
+    first.cancel()
+    upstream.release.set()
+
+    assert await second == "ok"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_singleflight__different_keys_and_later_calls_run_separately() -> None:
+    """Test that only concurrent calls with the same key are merged."""
+    group: SingleFlight[str, str] = SingleFlight("test")
+    upstream = _Upstream()
+    upstream.release.set()
+
+    await asyncio.gather(group.do("a", upstream), group.do("b", upstream))
+    await group.do("a", upstream)
+
+    assert upstream.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_singleflight__disabled_runs_every_call() -> None:
+    """Test that a disabled group never coalesces."""
+    group: SingleFlight[str, str] = SingleFlight("test", enabled=False)
+    upstream = _Upstream()
+    upstream.release.set()
+
+    await asyncio.gather(*(group.do("key", upstream) for _ in range(3)))
+
+    assert upstream.calls == 3
+
+
+def test_request_key__covers_metadata_fields() -> None:
+    """Test that requests differing only in tags are not merged."""
+    base = EvaluationRequest(evaluator_id="e", request="q", response="a")
+    tagged = EvaluationRequest(evaluator_id="e", request="q", response="a", tags=["x"])
+
+    assert request_key("evaluator", "e", base) == request_key("evaluator", "e", base.model_copy())
+    assert request_key("evaluator", "e", base) != request_key("evaluator", "e", tagged)
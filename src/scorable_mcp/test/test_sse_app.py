@@ -0,0 +1,79 @@
+"""Unit tests for the Starlette app built by the SSE transport."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from starlette.testclient import TestClient
+
+from scorable_mcp.sse_server import SSEMCPServer, create_app
+
+
+def test_health__reports_client_and_cache_state() -> None:
+    """Test the JSON shape of the health route."""
+    server = SSEMCPServer()
+
+    with TestClient(create_app(server)) as client:
+        response = client.get("/health")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "ok"
+    assert set(body["circuits"]) == {"execute", "list", "judges"}
+    assert body["circuits"]["execute"]["state"] == "closed"
+    assert set(body["rate_limits"]) == {"execute", "list"}
+    assert set(body["coalescing"]) == {"evaluations", "judges"}
+
+
+def test_health__degraded_while_a_circuit_is_open() -> None:
+    """Test that an open circuit is reported without failing the health check."""
+    server = SSEMCPServer()
+    breaker = server.core.connection.breakers["execute"]
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    with TestClient(create_app(server)) as client:
+        response = client.get("/health")
+        head = client.head("/health")
+
+    assert response.status_code == 200
+    assert head.status_code == 200
+    assert response.json()["status"] == "degraded"
+    assert response.json()["circuits"]["execute"]["state"] == "open"
+
+
+def test_lifespan__closes_the_connection_on_shutdown() -> None:
+    """Test that the app starts the server core and releases its connection pool."""
+    server = SSEMCPServer()
+
+    with (
+        patch.object(server.core, "start", AsyncMock()) as start,
+        TestClient(create_app(server)),
+    ):
+        start.assert_awaited_once()
+        connection = server.core.connection
+        assert connection.client is not None
+        assert connection.is_open
+
+    assert not connection.is_open
+
+
+def test_metrics__exposes_tool_upstream_and_session_metrics() -> None:
+    """Test that /metrics renders the Prometheus text format after a tool call."""
+    server = SSEMCPServer()
+    asyncio.run(server.call_tool("no_such_tool", {}))
+
+    with (
+        patch.object(server.core, "start", AsyncMock()),
+        TestClient(create_app(server)) as client,
+    ):
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE scorable_tool_call_duration_seconds histogram" in body
+    assert 'scorable_tool_calls_in_flight{tool="run_judge"} 0' in body
+    assert 'scorable_tool_calls_total{tool="unknown",outcome="unknown_tool"} 1' in body
+    assert 'scorable_circuit_state{endpoint="execute",state="closed"} 1' in body
+    assert 'scorable_sse_sessions_active{endpoint="/sse"} 0' in body
+    assert "# TYPE scorable_upstream_request_duration_seconds histogram" in body
@@ -0,0 +1,28 @@
+"""Tests for the tool catalogue."""
+
+from scorable_mcp import tools
+from scorable_mcp.schema import EvaluationRequest, RunJudgeRequest
+
+
+def test_get_tools__reuses_prebuilt_tool_objects() -> None:
+    """Test that tool definitions are built once and shared between calls."""
+    first = tools.get_tools()
+    second = tools.get_tools()
+
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_get_tools__every_tool_has_a_request_model() -> None:
+    """Test that the catalogue and the request model lookup stay in sync."""
+    for tool in tools.get_tools():
+        model = tools.get_request_model(tool.name)
+        assert model is not None, f"No request model for {tool.name}"
+        assert tool.inputSchema == model.model_json_schema()
+
+
+def test_get_request_model__known_and_unknown_tools() -> None:
+    """Test request model lookup by tool name."""
+    assert tools.get_request_model("run_evaluation") is EvaluationRequest
+    assert tools.get_request_model("run_judge") is RunJudgeRequest
+    assert tools.get_request_model("does_not_exist") is None
@@ -0,0 +1,161 @@
+"""Unit tests for tracing spans and their exporters."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from scorable_mcp.core import RootMCPServerCore
+from scorable_mcp.tracing import (
+    NOOP_SPAN,
+    FileSpanExporter,
+    OTLPSpanExporter,
+    Span,
+    Tracer,
+    current_span,
+    tracer,
+)
+
+
+class _Collector:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    async def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+def test_tracer__disabled_returns_shared_noop_span() -> None:
+    """Test that a tracer without exporter records nothing."""
+    disabled = Tracer()
+
+    with disabled.span("mcp.call_tool") as span:
+        span.set_attribute("mcp.tool.name", "run_judge")
+        assert current_span() is NOOP_SPAN
+
+    assert span is NOOP_SPAN
+    assert not disabled.enabled
+
+
+@pytest.mark.asyncio
+async def test_tracer__nests_spans_and_records_errors() -> None:
+    """Test that child spans join the trace of their parent and failures mark the span."""
+    collector = _Collector()
+    traced = Tracer(collector)
+
+    with traced.span("parent") as parent:
+        with pytest.raises(ValueError), traced.span("child"):
+            raise ValueError("boom")
+        assert current_span() is parent
+    await traced.flush()
+
+    child, finished_parent = collector.spans
+    assert finished_parent is parent
+    assert child.trace_id == parent.trace_id
+    assert child.parent_id == parent.span_id
+    assert parent.parent_id is None
+    assert child.status == "error"
+    assert child.attributes["exception.type"] == "ValueError"
+    assert traced.exported == 2
+
+
+@pytest.mark.asyncio
+async def test_file_exporter__appends_json_lines(tmp_path: Path) -> None:
+    """Test that spans are written to the file as one JSON object per line."""
+    path = tmp_path / "traces.jsonl"
+    traced = Tracer(FileSpanExporter(path))
+
+    for size in (10, 20):
+        with traced.span("scorable.request") as span:
+            span.set_attribute("http.request.body.size", size)
+        await traced.flush()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["attributes"]["http.request.body.size"] for r in records] == [10, 20]
+    assert records[0]["name"] == "scorable.request"
+    assert records[0]["duration_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_otlp_exporter__posts_spans_to_collector() -> None:
+    """Test the OTLP/JSON body received by the collector."""
+    received: list[dict] = []
+
+    def _collector(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v1/traces"
+        received.append(json.loads(request.content))
+        return httpx.Response(200, json={})
+
+    traced = Tracer(
+        OTLPSpanExporter("http://collector:4318/", transport=httpx.MockTransport(_collector))
+    )
+    span = traced.span("judge.run")
+    assert isinstance(span, Span)
+    with span:
+        span.set_attribute("scorable.judge.id", "judge-1")
+        span.set_attribute("scorable.cache_hit", False)
+    await traced.flush()
+
+    (otlp_span,) = received[0]["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert otlp_span["name"] == "judge.run"
+    assert otlp_span["traceId"] == span.trace_id
+    assert {"key": "scorable.judge.id", "value": {"stringValue": "judge-1"}} in otlp_span[
+        "attributes"
+    ]
+    assert {"key": "scorable.cache_hit", "value": {"boolValue": False}} in otlp_span["attributes"]
+
+
+@pytest.mark.asyncio
+async def test_tracer__export_failure_does_not_break_calls() -> None:
+    """Test that a collector error is counted instead of raised."""
+    traced = Tracer(
+        OTLPSpanExporter(
+            "http://collector", transport=httpx.MockTransport(lambda r: httpx.Response(503))
+        )
+    )
+    with traced.span("mcp.call_tool"):
+        pass
+    await traced.flush()
+
+    assert traced.export_errors == 1
+
+
+@pytest.mark.asyncio
+async def test_call_tool__traces_run_judge_down_to_the_request() -> None:
+    """Test that a judge call yields one trace from the tool call to the upstream request."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        result = {"evaluator_name": "Clarity", "score": 0.8, "justification": "ok"}
+        return httpx.Response(200, json={"evaluator_results": [result]})
+
+    collector = _Collector()
+    core = RootMCPServerCore()
+    with (
+        patch.object(tracer, "exporter", collector),
+        patch.object(core.connection, "_transport", httpx.MockTransport(_handler)),
+    ):
+        await core.call_tool("run_judge", {"judge_id": "judge-1", "request": "q", "response": "a"})
+        await core.aclose()
+
+    spans = {span.name: span for span in collector.spans}
+    assert set(spans) == {
+        "mcp.call_tool",
+        "mcp.validate_arguments",
+        "judge.run",
+        "scorable.encode_payload",
+        "scorable.request",
+        "mcp.serialize_result",
+    }
+    root = spans["mcp.call_tool"]
+    assert {span.trace_id for span in collector.spans} == {root.trace_id}
+    assert spans["judge.run"].parent_id == root.span_id
+    assert spans["scorable.request"].parent_id == spans["judge.run"].span_id
+    assert root.attributes["mcp.tool.name"] == "run_judge"
+    assert root.attributes["mcp.tool.outcome"] == "ok"
+    assert spans["judge.run"].attributes["scorable.judge.id"] == "judge-1"
+    assert spans["scorable.request"].attributes["http.response.status_code"] == 200
+    assert spans["scorable.request"].attributes["http.request.body.size"] == len(
+        b'{"request":"q","response":"a"}'
+    )
@@ -2,56 +2,92 @@
 
 from __future__ import annotations
 
+from functools import cache
+from types import MappingProxyType
+
 from mcp.types import Tool
+from pydantic import BaseModel
 
 from scorable_mcp.schema import (
     CodingPolicyAdherenceEvaluationRequest,
+    EvaluationBatchRequest,
     EvaluationRequest,
     EvaluationRequestByName,
     ListEvaluatorsRequest,
     ListJudgesRequest,
+    MultiEvaluationRequest,
     RunJudgeRequest,
 )
 
+# (name, description, request model) for every tool, in the order they are listed.
+_TOOL_SPECS: tuple[tuple[str, str, type[BaseModel]], ...] = (
+    (
+        "list_evaluators",
+        "List all available evaluators from Scorable",
+        ListEvaluatorsRequest,
+    ),
+    (
+        "run_evaluation",
+        "Run a standard evaluation using a Scorable evaluator by ID",
+        EvaluationRequest,
+    ),
+    (
+        "run_evaluation_by_name",
+        "Run a standard evaluation using a Scorable evaluator by name",
+        EvaluationRequestByName,
+    ),
+    (
+        "run_evaluation_batch",
+        "Run many evaluations in one call, e.g. to score a dataset. Each item selects its evaluator by ID or name; results and errors are returned per item in input order",
+        EvaluationBatchRequest,
+    ),
+    (
+        "run_evaluations",
+        "Run several Scorable evaluators (by ID and/or name) on the same request/response in one call. Returns per-evaluator scores, the total cost and the wall time",
+        MultiEvaluationRequest,
+    ),
+    (
+        "run_coding_policy_adherence",
+        "Evaluate code against repository coding policy documents using a dedicated Scorable evaluator",
+        CodingPolicyAdherenceEvaluationRequest,
+    ),
+    (
+        "list_judges",
+        "List all available judges from Scorable. Judge is a collection of evaluators forming LLM-as-a-judge.",
+        ListJudgesRequest,
+    ),
+    (
+        "run_judge",
+        "Run a judge using a Scorable judge by ID",
+        RunJudgeRequest,
+    ),
+)
+
+_REQUEST_MODELS: MappingProxyType[str, type[BaseModel]] = MappingProxyType(
+    {name: model for name, _, model in _TOOL_SPECS}
+)
+
+
+@cache
+def _tool_catalogue() -> tuple[Tool, ...]:
+    """Build the tool definitions once; JSON schema generation is expensive."""
+    return tuple(
+        Tool(name=name, description=description, inputSchema=model.model_json_schema())
+        for name, description, model in _TOOL_SPECS
+    )
+
 
 def get_tools() -> list[Tool]:
-    """Return the list of MCP *tools* supported by Scorable."""
-
-    return [
-        Tool(
-            name="list_evaluators",
-            description="List all available evaluators from Scorable",
-            inputSchema=ListEvaluatorsRequest.model_json_schema(),
-        ),
-        Tool(
-            name="run_evaluation",
-            description="Run a standard evaluation using a Scorable evaluator by ID",
-            inputSchema=EvaluationRequest.model_json_schema(),
-        ),
-        Tool(
-            name="run_evaluation_by_name",
-            description="Run a standard evaluation using a Scorable evaluator by name",
-            inputSchema=EvaluationRequestByName.model_json_schema(),
-        ),
-        Tool(
-            name="run_coding_policy_adherence",
-            description="Evaluate code against repository coding policy documents using a dedicated Scorable evaluator",
-            inputSchema=CodingPolicyAdherenceEvaluationRequest.model_json_schema(),
-        ),
-        Tool(
-            name="list_judges",
-            description="List all available judges from Scorable. Judge is a collection of evaluators forming LLM-as-a-judge.",
-            inputSchema=ListJudgesRequest.model_json_schema(),
-        ),
-        Tool(
-            name="run_judge",
-            description="Run a judge using a Scorable judge by ID",
-            inputSchema=RunJudgeRequest.model_json_schema(),
-        ),
-    ]
-
-
-def get_request_model(tool_name: str) -> type | None:
+    """Return the list of MCP *tools* supported by Scorable.
+
+    The ``Tool`` objects are built on first use and shared between calls, so
+    callers must treat them as read-only.
+    """
+
+    return list(_tool_catalogue())
+
+
+def get_request_model(tool_name: str) -> type[BaseModel] | None:
     """Return the Pydantic *request* model class for a given tool.
 
     This is useful for validating the *arguments* dict passed to
@@ -60,13 +96,4 @@ def get_request_model(tool_name: str) -> type | None:
     a generic model or raise.
     """
 
-    mapping: dict[str, type] = {
-        "list_evaluators": ListEvaluatorsRequest,
-        "list_judges": ListJudgesRequest,
-        "run_coding_policy_adherence": CodingPolicyAdherenceEvaluationRequest,
-        "run_evaluation_by_name": EvaluationRequestByName,
-        "run_evaluation": EvaluationRequest,
-        "run_judge": RunJudgeRequest,
-    }
-
-    return mapping.get(tool_name)
+    return _REQUEST_MODELS.get(tool_name)
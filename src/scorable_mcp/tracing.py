@@ -0,0 +1,332 @@
+"""Optional tracing spans for tool calls.
+
+Spans follow a tool call from ``RootMCPServerCore.call_tool`` (argument
+validation, scheduler queueing, result serialization) through the evaluator
+and judge services down to every Scorable API request, so a slow call shows
+where its time went. Finished spans are batched and handed to an exporter that
+writes JSON lines to a file or posts OTLP/JSON to a collector.
+
+Tracing is off unless settings.tracing_exporter selects an exporter. Then
+:meth:`Tracer.span` returns one shared no-op span: no allocation, no clock
+read and no context switch, and call sites guard attributes that are costly to
+compute with :attr:`Tracer.enabled`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+import time
+from contextvars import ContextVar, Token
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Literal, Protocol
+
+import httpx
+
+from scorable_mcp.settings import settings
+
+logger = logging.getLogger("scorable_mcp.tracing")
+
+type AttributeValue = str | bool | int | float
+
+SpanStatus = Literal["unset", "ok", "error"]
+
+
+class _NoopSpan:
+    """Span standing in for every span while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Ignore the attribute."""
+
+    def set_status(self, status: SpanStatus, message: str = "") -> None:
+        """Ignore the status."""
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("scorable_mcp_span", default=None)
+
+
+class Span:
+    """A timed operation with attributes, nested under the span active when it started."""
+
+    __slots__ = (
+        "attributes",
+        "end_ns",
+        "name",
+        "parent_id",
+        "span_id",
+        "start_ns",
+        "status",
+        "status_message",
+        "trace_id",
+        "_token",
+        "_tracer",
+    )
+
+    def __init__(self, tracer: Tracer, name: str, parent: Span | None):
+        """Initialize a span; it starts when entered as a context manager."""
+        self._tracer = tracer
+        self.name = name
+        self.trace_id: str = (
+            parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}"
+        )
+        self.span_id: str = f"{random.getrandbits(64):016x}"
+        self.parent_id: str | None = parent.span_id if parent is not None else None
+        self.attributes: dict[str, AttributeValue] = {}
+        self.status: SpanStatus = "unset"
+        self.status_message = ""
+        self.start_ns = 0
+        self.end_ns = 0
+        self._token: Token[Span | None] | None = None
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        """Attach *key* = *value* to the span."""
+        self.attributes[key] = value
+
+    def set_status(self, status: SpanStatus, message: str = "") -> None:
+        """Mark the span as succeeded or failed."""
+        self.status = status
+        self.status_message = message
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the start and the end of the span."""
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def __enter__(self) -> Span:
+        self.start_ns = time.time_ns()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.end_ns = time.time_ns()
+        if exc is not None and not isinstance(exc, asyncio.CancelledError):
+            self.set_status("error", str(exc))
+            self.attributes["exception.type"] = type(exc).__name__
+        if self._token is not None:
+            _current_span.reset(self._token)
+        self._tracer._finish(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the span as a flat JSON-serializable record."""
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration * 1000, 3),
+            "status": self.status,
+            "status_message": self.status_message,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporter(Protocol):
+    """Destination of finished spans."""
+
+    async def export(self, spans: list[Span]) -> None:
+        """Send a batch of finished spans."""
+        ...
+
+
+class FileSpanExporter:
+    """Append finished spans to a file as JSON lines."""
+
+    def __init__(self, path: str | Path):
+        """Initialize the exporter.
+
+        Args:
+            path: File the spans are appended to, created when missing
+        """
+        self.path = Path(path)
+
+    async def export(self, spans: list[Span]) -> None:
+        """Append *spans* to the file without blocking the event loop."""
+        lines = "".join(json.dumps(span.to_dict()) + "\n" for span in spans)
+        await asyncio.to_thread(self._append, lines)
+
+    def _append(self, lines: str) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+def _otlp_value(value: AttributeValue) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": value}
+
+
+def _otlp_span(span: Span) -> dict[str, Any]:
+    record: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [
+            {"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()
+        ],
+        "status": {
+            "code": {"unset": 0, "ok": 1, "error": 2}[span.status],
+            "message": span.status_message,
+        },
+    }
+    if span.parent_id is not None:
+        record["parentSpanId"] = span.parent_id
+    return record
+
+
+class OTLPSpanExporter:
+    """Post finished spans to an OpenTelemetry collector over OTLP/HTTP with JSON encoding."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        timeout: float = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            endpoint: Base URL of the collector; spans go to ``{endpoint}/v1/traces``
+            timeout: Seconds to wait for the collector
+            transport: Optional custom transport, mainly for tests
+        """
+        self.url = f"{endpoint.rstrip('/')}/v1/traces"
+        self.timeout = timeout
+        self._transport = transport
+
+    async def export(self, spans: list[Span]) -> None:
+        """Post *spans* to the collector."""
+        body = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": "scorable-mcp"}},
+                            {
+                                "key": "service.version",
+                                "value": {"stringValue": settings.version},
+                            },
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "scorable_mcp"},
+                            "spans": [_otlp_span(span) for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        async with httpx.AsyncClient(timeout=self.timeout, transport=self._transport) as client:
+            response = await client.post(self.url, json=body)
+            response.raise_for_status()
+
+
+class Tracer:
+    """Create spans and export them in batches."""
+
+    def __init__(self, exporter: SpanExporter | None = None, batch_size: int = 64):
+        """Initialize the tracer.
+
+        Args:
+            exporter: Where finished spans go; None disables tracing
+            batch_size: Finished spans buffered before an export is started
+        """
+        self.exporter = exporter
+        self.batch_size = max(batch_size, 1)
+        self.exported = 0
+        self.export_errors = 0
+        self._buffer: list[Span] = []
+        self._exports: set[asyncio.Task[None]] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded at all."""
+        return self.exporter is not None
+
+    def span(self, name: str) -> Span | _NoopSpan:
+        """Return a span named *name* to use as a context manager.
+
+        It becomes a child of the span active in the current context; while
+        tracing is disabled the shared no-op span is returned.
+        """
+        if self.exporter is None:
+            return NOOP_SPAN
+        return Span(self, name, _current_span.get())
+
+    def _finish(self, span: Span) -> None:
+        self._buffer.append(span)
+        if len(self._buffer) < self.batch_size:
+            return
+        try:
+            task = asyncio.get_running_loop().create_task(self.flush())
+        except RuntimeError:  # no event loop: the next flush exports the batch
+            return
+        self._exports.add(task)
+        task.add_done_callback(self._exports.discard)
+
+    async def flush(self) -> None:
+        """Export the buffered spans and wait for exports in progress.
+
+        Export failures are logged and counted; they never reach the traced calls.
+        """
+        batch, self._buffer = self._buffer, []
+        if batch and self.exporter is not None:
+            try:
+                await self.exporter.export(batch)
+                self.exported += len(batch)
+            except Exception as exc:
+                self.export_errors += 1
+                logger.warning("Failed to export %d spans: %s", len(batch), exc)
+        current = asyncio.current_task()
+        pending = [task for task in self._exports if task is not current]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def current_span() -> Span | _NoopSpan:
+    """Return the span active in the current context, or the no-op span."""
+    return _current_span.get() or NOOP_SPAN
+
+
+def exporter_from_settings() -> SpanExporter | None:
+    """Build the exporter selected by settings.tracing_exporter, if any."""
+    if settings.tracing_exporter == "file":
+        return FileSpanExporter(settings.tracing_file_path)
+    if settings.tracing_exporter == "otlp":
+        return OTLPSpanExporter(settings.tracing_otlp_endpoint)
+    return None
+
+
+tracer = Tracer(exporter_from_settings(), batch_size=settings.tracing_batch_size)